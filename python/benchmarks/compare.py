@@ -0,0 +1,97 @@
+"""
+Compare two run.py result files and flag regressions.
+A case regresses when its best time grows by more than --threshold (or peak memory by more
+than --memory-threshold); the exit status is 1 if any case regressed.
+
+    python benchmarks/compare.py baseline.json results.json --threshold 0.1
+"""
+
+import argparse
+import json
+import sys
+
+
+def load(path: str) -> dict[tuple, dict]:
+    with open(path) as f:
+        results = json.load(f)["results"]
+    return {key(result): result for result in results}
+
+
+def key(result: dict) -> tuple:
+    return (
+        result["benchmark"],
+        json.dumps(result["params"], sort_keys=True),
+        result["points"],
+    )
+
+
+def compare(
+    baseline: dict[tuple, dict],
+    current: dict[tuple, dict],
+    threshold: float,
+    memory_threshold: float,
+) -> list[dict]:
+    """One row per case present in both files, with time and memory ratios (current / baseline)."""
+    rows = []
+    for case in sorted(baseline.keys() & current.keys()):
+        old, new = baseline[case], current[case]
+        time_ratio = new["best"] / old["best"]
+        memory_ratio = new["peak_bytes"] / max(old["peak_bytes"], 1)
+        if time_ratio > 1.0 + threshold or memory_ratio > 1.0 + memory_threshold:
+            status = "REGRESSION"
+        elif time_ratio < 1.0 / (1.0 + threshold):
+            status = "improved"
+        else:
+            status = ""
+        rows.append(
+            {
+                "case": case,
+                "time_ratio": time_ratio,
+                "memory_ratio": memory_ratio,
+                "status": status,
+            }
+        )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("baseline", help="Result file to compare against")
+    parser.add_argument("current", help="New result file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Allowed relative slowdown of the best time (default: 0.1)",
+    )
+    parser.add_argument(
+        "--memory-threshold",
+        type=float,
+        default=0.1,
+        help="Allowed relative growth of peak memory (default: 0.1)",
+    )
+    args = parser.parse_args()
+
+    baseline = load(args.baseline)
+    current = load(args.current)
+    rows = compare(baseline, current, args.threshold, args.memory_threshold)
+
+    for row in rows:
+        benchmark, params, points = row["case"]
+        print(
+            f"{benchmark:<15} {params:<45} {points:>11,d} pts  "
+            f"time x{row['time_ratio']:6.3f}  memory x{row['memory_ratio']:6.3f}  "
+            f"{row['status']}"
+        )
+
+    unmatched = len(baseline.keys() ^ current.keys())
+    if unmatched:
+        print(f"{unmatched} cases appear in only one file and were skipped")
+
+    regressions = sum(row["status"] == "REGRESSION" for row in rows)
+    print(f"{regressions} regressions in {len(rows)} cases")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
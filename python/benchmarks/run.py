@@ -0,0 +1,206 @@
+"""
+Benchmark the core kernels and samplers over quantum numbers and problem sizes.
+Each case records best/median wall time, throughput (points per second) and peak traced
+memory, and the run is written to JSON for compare.py.
+
+    python benchmarks/run.py --output results.json
+    python benchmarks/run.py --max-points 1e8 --filter slice
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from functools import partial
+from typing import Callable, Iterator
+
+import numpy as np
+
+from wavefunction_tools import (
+    associated_laguerre_polynomial,
+    associated_legendre_polynomial,
+    clear_radial_axis_cache,
+    radial_axis,
+    sample_orbital,
+    sample_orbital_plane,
+    wavefunction_slice_cartesian,
+)
+
+# (params, points, func): func is called repeatedly and must not depend on earlier calls
+Case = tuple[dict, int, Callable[[], object]]
+
+SIZES = [10**3, 10**4, 10**5, 10**6, 10**7, 10**8]
+
+
+def laguerre_cases(sizes: list[int]) -> Iterator[Case]:
+    for n in (5, 20, 50):
+        for size in sizes:
+            x = np.linspace(0.0, 4.0 * n, size)
+            func = partial(associated_laguerre_polynomial, n, 3, x)
+            yield {"n": n, "k": 3}, size, func
+
+
+def legendre_cases(sizes: list[int]) -> Iterator[Case]:
+    for l, m in ((5, 2), (20, 5), (50, 10)):
+        for size in sizes:
+            x = np.linspace(-1.0, 1.0, size)
+            func = partial(associated_legendre_polynomial, l, m, x)
+            yield {"l": l, "m": m}, size, func
+
+
+def slice_cases(sizes: list[int]) -> Iterator[Case]:
+    for n, l, m in ((2, 1, 0), (6, 3, 2), (20, 5, 3)):
+        axis_limit = radial_axis(n, l)
+        for size in sizes:
+            resolution = int(round(np.sqrt(size)))
+            u = np.linspace(-axis_limit, axis_limit, resolution)
+            u_grid, v_grid = np.meshgrid(u, u, indexing="xy")
+            params = {"n": n, "l": l, "m": m, "resolution": resolution}
+            func = partial(wavefunction_slice_cartesian, n, l, m, "xz", u_grid, v_grid)
+            yield params, resolution**2, func
+
+
+def radial_axis_cases(sizes: list[int]) -> Iterator[Case]:
+    # Root finding from cold caches (for n > 4 this includes building the radial CDF
+    # table); one "point" per call, independent of sizes
+    def cold(n: int, l: int) -> float:
+        clear_radial_axis_cache()
+        return radial_axis(n, l)
+
+    for n, l in ((1, 0), (5, 2), (20, 5), (50, 10)):
+        yield {"n": n, "l": l}, 1, partial(cold, n, l)
+
+
+def sample_orbital_cases(sizes: list[int]) -> Iterator[Case]:
+    # Tables are cached after the warm-up call, so this times the sampling itself
+    for n, l, m in ((2, 1, 0), (6, 3, 2), (20, 5, 3)):
+        for size in sizes:
+            rng = np.random.default_rng(0)
+            func = partial(sample_orbital, n, l, m, size, rng=rng)
+            yield {"n": n, "l": l, "m": m}, size, func
+
+
+def sample_plane_cases(sizes: list[int]) -> Iterator[Case]:
+    # 1024^2-cell table: binary search of the CDF against the alias table
+    for sampler in ("cdf", "alias"):
+        for size in sizes:
+            rng = np.random.default_rng(0)
+            func = partial(
+                sample_orbital_plane, 6, 3, 2, size, "xz", rng=rng, sampler=sampler
+            )
+            yield {"n": 6, "l": 3, "m": 2, "sampler": sampler}, size, func
+
+
+BENCHMARKS = {
+    "laguerre": laguerre_cases,
+    "legendre": legendre_cases,
+    "slice": slice_cases,
+    "radial_axis": radial_axis_cases,
+    "sample_orbital": sample_orbital_cases,
+    "sample_plane": sample_plane_cases,
+}
+
+
+def measure(func: Callable[[], object], repeat: int, min_time: float) -> dict:
+    """Best and median of at least repeat timed calls (more while under min_time), then peak memory."""
+    func()  # Warm up caches and allocator
+
+    times = []
+    start = time.perf_counter()
+    while len(times) < repeat or time.perf_counter() - start < min_time:
+        t0 = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - t0)
+        if times[-1] > 1.0:
+            break  # Large cases: one timed call is enough
+
+    # Traced separately, as tracemalloc slows the calls down
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "best": min(times),
+        "median": statistics.median(times),
+        "repeats": len(times),
+        "peak_bytes": peak,
+    }
+
+
+def run(
+    names: list[str],
+    sizes: list[int],
+    repeat: int,
+    min_time: float,
+    verbose: bool = True,
+) -> list[dict]:
+    results = []
+    for name in names:
+        for params, points, func in BENCHMARKS[name](sizes):
+            result = {"benchmark": name, "params": params, "points": points}
+            result.update(measure(func, repeat, min_time))
+            result["throughput"] = points / result["best"]
+            results.append(result)
+            if verbose:
+                print(
+                    f"{name:<15} {json.dumps(params):<45} {points:>11,d} pts  "
+                    f"{result['best'] * 1e3:10.3f} ms  "
+                    f"{result['throughput']:11.3e} pts/s  "
+                    f"{result['peak_bytes'] / 2**20:9.1f} MiB"
+                )
+    return results
+
+
+def metadata() -> dict:
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", "-o", help="Write results to this JSON file")
+    parser.add_argument(
+        "--filter",
+        nargs="+",
+        choices=sorted(BENCHMARKS),
+        default=list(BENCHMARKS),
+        help="Benchmarks to run (default: all)",
+    )
+    parser.add_argument(
+        "--min-points", type=float, default=1e3, help="Smallest size (default: 1e3)"
+    )
+    parser.add_argument(
+        "--max-points",
+        type=float,
+        default=1e6,
+        help="Largest size (default: 1e6; 1e8 needs several GiB per array set)",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Minimum timed calls")
+    parser.add_argument(
+        "--min-time", type=float, default=0.2, help="Minimum seconds timed per case"
+    )
+    args = parser.parse_args()
+
+    sizes = [s for s in SIZES if args.min_points <= s <= args.max_points]
+    results = run(args.filter, sizes, args.repeat, args.min_time)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"metadata": metadata(), "results": results}, f, indent=2)
+        print(f"Wrote {len(results)} results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,11 +6,8 @@ import matplotlib.animation as animation
 from wavefunction_tools.wavefunction import Axis
 from wavefunction_tools import (
     radial_axis,
-    time_dependent_factor,
-    wavefunction_line_cartesian,
-    superpose_wavefunctions,
+    Superposition,
     complex_magnitude_squared,
-    complex_multiply,
 )
 
 
@@ -50,10 +47,9 @@ def main():
     u = np.linspace(-r_max, r_max, 3000)
 
     # Precompute orbitals #? Note that all orbitals are computed on same size grid, not ideal for auto-scaling
-    orbitals: list[tuple[np.ndarray, np.ndarray]] = []
-    for n, l, m in states:
-        re, im = wavefunction_line_cartesian(n, l, m, axis=axis, u=u)
-        orbitals.append((re, im))
+    superposition = Superposition.on_line(
+        [(n, l, m, 0.0) for n, l, m in states], axis, u
+    )
 
     # Precompute r_max
     state_rmax = [radial_axis(n, l) for (n, l, _m) in states]
@@ -93,13 +89,13 @@ def main():
         (n1, l1, m1) = states[k]
         (n2, l2, m2) = states[k + 1]
         factor = t if time_dependent else mix_factor
-        td1 = time_dependent_factor(n1, factor)
-        td2 = time_dependent_factor(n2, factor)
-        psi1 = complex_multiply(orbitals[k], td1)
-        psi2 = complex_multiply(orbitals[k + 1], td2)
 
-        # Superpose
-        re, im = superpose_wavefunctions(psi1, psi2, s)
+        # Superpose, mapping s [0,1] to the angle [0, pi/2]
+        theta = 0.5 * np.pi * s
+        coefficients = np.zeros(len(superposition.states))
+        coefficients[superposition.states.index(states[k])] += np.cos(theta)
+        coefficients[superposition.states.index(states[k + 1])] += np.sin(theta)
+        re, im = superposition.evaluate(factor, coefficients)
         magnitude_squared = complex_magnitude_squared(re, im)
 
         # Update graphs
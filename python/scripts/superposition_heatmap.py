@@ -11,12 +11,10 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 
-from wavefunction_tools.utilities import complex_multiply
 from wavefunction_tools import (
     radial_axis,
     wavefunction_slice_cartesian,
-    time_dependent_factor,
-    superpose_wavefunctions,
+    TwoStateDensity,
     complex_phase,
     complex_magnitude,
     complex_magnitude_squared,
@@ -118,6 +116,9 @@ def main():
     title = fig.suptitle("", fontsize=14)
     fig.tight_layout()
 
+    # Density/phase fields for the current pair, rebuilt when the pair changes
+    frames: dict[int, TwoStateDensity] = {}
+
     start = time.time()
 
     def animate(_i: int):
@@ -131,20 +132,18 @@ def main():
         (n1, l1, m1) = states[k]
         (n2, l2, m2) = states[k + 1]
         factor = t if time_dependent else mix_factor
-        td1 = time_dependent_factor(n1, factor)
-        td2 = time_dependent_factor(n2, factor)
-        psi1 = complex_multiply(orbitals[k], td1)
-        psi2 = complex_multiply(orbitals[k + 1], td2)
+        if k not in frames:
+            frames.clear()
+            frames[k] = TwoStateDensity(orbitals[k], orbitals[k + 1], n1, n2)
 
         # Superpose
-        re, im = superpose_wavefunctions(psi1, psi2, s)
         magnitude = (
-            complex_magnitude_squared(re, im)
+            frames[k].density(factor, s)
             if magnitude_squared
-            else complex_magnitude(re, im)
+            else frames[k].magnitude(factor, s)
         )
         magnitude = display_normalise(magnitude, gamma=gamma)
-        phase = complex_phase(re, im)
+        phase = frames[k].phase(factor, s)
 
         # Update graphs
         im_magnitude.set_data(magnitude)
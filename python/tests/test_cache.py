@@ -0,0 +1,64 @@
+import pytest
+import numpy as np
+
+from wavefunction_tools import TableCache, table_cache, sample_orbital
+
+
+def test_table_cache_hits_and_misses():
+    cache = TableCache(max_bytes=1024)
+    calls = []
+
+    @cache.cached
+    def build(n: int, scale: float = 1.0) -> np.ndarray:
+        calls.append(n)
+        return np.full(8, n * scale)
+
+    first = build(2)
+    second = build(2, scale=1.0)  # Same bound arguments as build(2)
+
+    assert first is second
+    assert calls == [2]
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    with pytest.raises(ValueError):
+        first[0] = 0.0  # Shared tables are read-only
+
+
+def test_table_cache_evicts_least_recently_used_by_bytes():
+    cache = TableCache(max_bytes=3 * 64)
+
+    @cache.cached
+    def build(n: int) -> np.ndarray:
+        return np.zeros(8)  # 64 bytes
+
+    build(0), build(1), build(2)
+    build(0)  # Refresh 0, so 1 is now least recently used
+    build(3)
+
+    assert len(cache) == 3
+    assert cache.current_bytes == 3 * 64
+    assert cache.evictions == 1
+    assert cache.get(("missing",)) is None
+
+    cache.max_bytes = 64
+    assert len(cache) == 1
+
+    cache.clear()
+    assert cache.stats() == {
+        "entries": 0,
+        "current_bytes": 0,
+        "max_bytes": 64,
+        "hits": 0,
+        "misses": 0,
+        "evictions": 0,
+    }
+
+
+def test_sample_orbital_reuses_cached_tables():
+    table_cache.clear()
+    sample_orbital(3, 1, 0, num_samples=100)
+    misses = table_cache.stats()["misses"]
+    sample_orbital(3, 1, 0, num_samples=100)
+
+    assert table_cache.stats()["misses"] == misses
+    assert table_cache.stats()["hits"] >= 2
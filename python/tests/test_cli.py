@@ -0,0 +1,104 @@
+import json
+
+import pytest
+import numpy as np
+from numpy.testing import assert_allclose, assert_array_equal
+
+from wavefunction_tools import (
+    load_frames,
+    radial_axis,
+    sample_orbital_plane,
+    wavefunction_slice_cartesian,
+)
+from wavefunction_tools.cli import main, run_jobs
+
+
+def test_slice_command_writes_density(tmp_path):
+    output = tmp_path / "slice.npy"
+    main(
+        [
+            "slice",
+            "3",
+            "1",
+            "-1",
+            "--plane",
+            "xz",
+            "--resolution",
+            "51",
+            "-o",
+            str(output),
+        ]
+    )
+
+    axis_limit = radial_axis(3, 1)
+    u = np.linspace(-axis_limit, axis_limit, 51)
+    u_grid, v_grid = np.meshgrid(u, u, indexing="xy")
+    re, im = wavefunction_slice_cartesian(3, 1, -1, "xz", u_grid, v_grid)
+    assert_allclose(np.load(output), re**2 + im**2, rtol=1e-12, atol=0.0)
+
+
+def test_batch_runs_jobs_across_processes_and_reports_failures(tmp_path):
+    jobs = [
+        {
+            "command": "sample",
+            "n": 2,
+            "l": 1,
+            "m": 0,
+            "samples": 500,
+            "plane": "xz",
+            "seed": 3,
+            "output": str(tmp_path / "sample.npy"),
+        },
+        {
+            "command": "line",
+            "n": 2,
+            "l": 1,
+            "m": 0,
+            "resolution": 64,
+            "quantity": "psi",
+            "output": str(tmp_path / "line.npy"),
+        },
+        {
+            "command": "superpose",
+            "states": ["1,0,0", [2, 1, 0, [0.0, 1.0]]],
+            "resolution": 32,
+            "times": [0.0, 0.5],
+            "output": str(tmp_path / "frames.npy"),
+        },
+        {
+            "command": "volume",
+            "n": 2,
+            "l": 1,
+            "m": 0,
+            "output": str(tmp_path / "v.txt"),
+        },
+        {"command": "orbit", "n": 1, "l": 0, "m": 0, "output": str(tmp_path / "o.npy")},
+    ]
+
+    errors = run_jobs(jobs, workers=2)
+
+    assert errors[:3] == [None, None, None]
+    assert "'.npy', '.png'" in errors[3]
+    assert "command must be one of" in errors[4]
+
+    u, v, (re, im) = sample_orbital_plane(2, 1, 0, 500, "xz", rng=3)
+    assert_array_equal(
+        np.load(tmp_path / "sample.npy"), np.column_stack((u, v, re, im))
+    )
+    assert np.load(tmp_path / "line.npy").shape == (64,)
+    frames, metadata = load_frames(tmp_path / "frames.npy")
+    assert frames.shape == (2, 32, 32)
+    assert metadata["states"][1]["coefficient"] == [0.0, 1.0]
+
+    path = tmp_path / "jobs.json"
+    path.write_text(json.dumps(jobs[:1] + jobs[4:]))
+    with pytest.raises(SystemExit) as exit_info:
+        main(["batch", str(path), "--workers", "1"])
+    assert exit_info.value.code == 1
+
+
+def test_png_output(tmp_path):
+    pytest.importorskip("matplotlib")
+    output = tmp_path / "slice.png"
+    main(["slice", "2", "1", "1", "--resolution", "32", "-o", str(output)])
+    assert output.read_bytes()[:4] == b"\x89PNG"
@@ -0,0 +1,51 @@
+import json
+
+import numpy as np
+
+from wavefunction_tools import (
+    instrument,
+    sample_orbital,
+    table_cache,
+    wavefunction_slice_cartesian,
+)
+from wavefunction_tools.instrument import stage
+
+
+def test_instrument_records_stages_only_inside_the_block():
+    u = np.linspace(-10.0, 10.0, 31)
+    u_grid, v_grid = np.meshgrid(u, u, indexing="xy")
+    table_cache.clear()  # So the sampling tables (and their cumsum) are built
+
+    with instrument() as report:
+        wavefunction_slice_cartesian(4, 2, 1, "xz", u_grid, v_grid)
+        sample_orbital(3, 1, 0, 500, rng=0)
+    wavefunction_slice_cartesian(4, 2, 1, "xz", u_grid, v_grid)
+
+    stages = report.as_dict()
+    assert stages["wavefunction_cartesian"]["calls"] == 1
+    assert stages["wavefunction_cartesian"]["elements"] == u_grid.size
+    assert stages["coordinates"]["elements"] == u_grid.size
+    assert stages["wavefunction"]["elements"] == 500
+    for name in ("laguerre", "legendre", "sample.cumsum", "sample.searchsorted"):
+        assert stages[name]["calls"] > 0
+        assert stages[name]["seconds"] >= 0.0
+    assert stage("laguerre") is stage("legendre")  # Shared no-op while not recording
+
+
+def test_instrument_memory_and_json_export(tmp_path):
+    with instrument(memory=True) as report:
+        with stage("outer", 10):
+            with stage("inner", 10):
+                block = np.ones(1 << 20)
+            del block
+            small = np.ones(1 << 10)
+
+    stages = report.as_dict()
+    assert stages["inner"]["peak_bytes"] >= 8 << 20
+    assert stages["outer"]["peak_bytes"] >= stages["inner"]["peak_bytes"]
+    assert small.size == 1 << 10
+
+    path = tmp_path / "report.json"
+    report.to_json(path)
+    assert json.loads(path.read_text()) == stages
+    assert "inner" in str(report)
@@ -2,8 +2,12 @@ import pytest
 import numpy as np
 from numpy.testing import assert_allclose
 
-from scipy.special import assoc_laguerre
-from wavefunction_tools import associated_laguerre_polynomial
+from scipy.special import assoc_laguerre, binom, eval_genlaguerre
+from wavefunction_tools import (
+    associated_laguerre_polynomial,
+    scaled_laguerre_polynomial,
+    Workspace,
+)
 
 NK_VALUES = [(0, 0), (1, 0), (1, 2), (2, 0), (2, 3), (5, 0), (5, 2), (10, 0), (10, 4)]
 X_SCALAR = [-2, -1e-6, 0.0, 1e-14, 0.1, 1.0, 2.5, 10.0]
@@ -17,3 +21,26 @@ def test_associated_laguerre_matches_scipy(n, k, x):
     got = associated_laguerre_polynomial(n, k, x)
 
     assert_allclose(got, expected, rtol=1e-10, atol=1e-12)
+
+
+@pytest.mark.parametrize("n,k", NK_VALUES)
+def test_associated_laguerre_out_and_workspace(n, k):
+    x = X_ARRAY[0]
+    out = np.empty_like(x)
+    workspace = Workspace()
+
+    got = associated_laguerre_polynomial(n, k, x, out=out, workspace=workspace)
+
+    assert got is out
+    assert_allclose(got, assoc_laguerre(x, n, k), rtol=1e-10, atol=1e-12)
+
+
+@pytest.mark.parametrize("n,k", NK_VALUES + [(40, 11), (100, 3), (150, 101)])
+def test_scaled_laguerre_matches_scipy(n, k):
+    x = np.linspace(0.0, 4.0 * n + 10.0, 2001)
+    expected = eval_genlaguerre(n, k, x) / np.sqrt(binom(n + k, n))
+    got = scaled_laguerre_polynomial(n, k, x)
+
+    # Relative to the largest value, as the terms span many orders of magnitude
+    scale = np.abs(expected).max()
+    assert_allclose(got / scale, expected / scale, rtol=0.0, atol=1e-11)
@@ -2,9 +2,13 @@ import pytest
 import numpy as np
 from numpy.testing import assert_allclose
 
-from scipy.special import lpmv
-from wavefunction_tools import associated_legendre_polynomial
-
+from scipy.special import lpmv, sph_harm_y
+from wavefunction_tools import (
+    associated_legendre_polynomial,
+    associated_legendre_table,
+    normalised_associated_legendre_polynomial,
+    lm_index,
+)
 
 LM_VALUES = [(0, 0), (1, 0), (1, 1), (2, 0), (2, 2), (3, 2), (3, 3), (5, 2), (6, 4)]
 LM_VALUES_NEG = [(1, -1), (2, -1), (2, -2), (3, -1), (3, -2), (3, -3), (6, -4)]
@@ -21,3 +25,27 @@ def test_associated_legendre_matches_scipy(l, m, x):
     got = associated_legendre_polynomial(l, m, x)
 
     assert_allclose(got, expected, rtol=1e-10, atol=1e-12)
+
+
+@pytest.mark.parametrize("l_max", [0, 1, 6])
+@pytest.mark.parametrize("x", X_SCALAR + X_ARRAY)
+def test_associated_legendre_table_matches_single(l_max, x):
+    table = associated_legendre_table(l_max, x)
+    assert table.shape == ((l_max + 1) ** 2,) + np.shape(x)
+
+    for l in range(0, l_max + 1):
+        for m in range(-l, l + 1):
+            expected = associated_legendre_polynomial(l, m, x)
+            assert_allclose(table[lm_index(l, m)], expected, rtol=1e-10, atol=1e-12)
+
+
+@pytest.mark.parametrize(
+    "l,m", LM_VALUES + LM_VALUES_NEG + [(60, 17), (100, -50), (200, 0), (200, 199)]
+)
+def test_normalised_associated_legendre_matches_scipy(l, m):
+    x = X_ARRAY[0]
+    # Y_l^m(theta, 0) is the normalised P_l^m(cos theta)
+    expected = sph_harm_y(l, m, np.arccos(x), 0.0).real
+    got = normalised_associated_legendre_polynomial(l, m, x)
+
+    assert_allclose(got, expected, rtol=0.0, atol=1e-12)
@@ -1,13 +1,21 @@
 import pytest
 import numpy as np
 from numpy.testing import assert_allclose
+from scipy.integrate import cumulative_simpson
 from scipy.special import eval_genlaguerre
-from math import factorial
+from math import factorial, lgamma
 
-from wavefunction_tools import radial_wave_function, radial_distribution
+from wavefunction_tools import (
+    radial_wave_function,
+    radial_distribution,
+    radial_cumulative_distribution,
+    inverse_radial_cumulative_distribution,
+    radial_table,
+    wavefunction_cartesian,
+    Workspace,
+)
 from wavefunction_tools.utilities import a0, Z
 
-
 NL_VALUES = [(1, 0), (2, 0), (2, 1), (3, 0), (3, 1), (4, 0), (4, 1), (4, 2), (4, 3)]
 
 R_SCALAR = [0.0, 1e-14, 1e-10, 1e-6, 0.1, 0.5, 1.0, 2.0, 10.0, 30.0]
@@ -46,3 +54,127 @@ def test_radial_distribution_is_normalized(n, l):
     integral = np.trapezoid(P, r)
 
     assert_allclose(integral, 1.0, rtol=1e-6, atol=1e-8)
+
+
+@pytest.mark.parametrize("n,l", NL_VALUES)
+def test_radial_cumulative_distribution_matches_integral(n, l):
+    r = np.linspace(0.0, 40.0 * n * a0 / Z, 20000)
+    P = radial_distribution(n, l, r)
+    expected = np.concatenate(([0.0], np.cumsum(0.5 * (P[1:] + P[:-1]) * np.diff(r))))
+    got = radial_cumulative_distribution(n, l, r)
+
+    assert_allclose(got, expected, rtol=0.0, atol=1e-6)
+
+
+@pytest.mark.parametrize("n,l", NL_VALUES)
+def test_inverse_radial_cumulative_distribution_roundtrip(n, l):
+    u = np.array([0.0, 1e-9, 0.01, 0.25, 0.5, 0.75, 0.99, 1.0 - 1e-9])
+    r = inverse_radial_cumulative_distribution(n, l, u)
+
+    assert_allclose(radial_cumulative_distribution(n, l, r), u, rtol=0.0, atol=1e-12)
+
+
+# Either side of the closed-form cut-off, and where the closed form used to cancel
+THRESHOLD_NL_VALUES = [
+    (4, 0),
+    (4, 3),
+    (5, 0),
+    (5, 4),
+    (8, 3),
+    (15, 0),
+    (18, 9),
+    (25, 2),
+]
+
+
+@pytest.mark.parametrize("n,l", THRESHOLD_NL_VALUES)
+def test_radial_cumulative_distribution_matches_quadrature_across_cutoff(n, l):
+    r = np.linspace(0.0, 4.0 * n * n * a0 / Z, 200_001)
+    expected = cumulative_simpson(radial_distribution(n, l, r), x=r, initial=0.0)
+    got = radial_cumulative_distribution(n, l, r[::500])
+
+    assert np.all((got >= 0.0) & (got <= 1.0))
+    assert_allclose(got, expected[::500], rtol=0.0, atol=1e-11)
+
+
+HIGH_NL_VALUES = [(10, 0), (20, 7), (60, 0), (100, 50), (200, 0), (200, 199)]
+
+
+@pytest.mark.parametrize("n,l", HIGH_NL_VALUES)
+def test_radial_wave_function_high_n_is_normalised_and_matches_scipy(n, l):
+    # Fine enough to resolve the fast inner oscillations of large n
+    r = np.linspace(0.0, 4.0 * n * n * a0 / Z, 400_001)
+    R = radial_wave_function(n, l, r)
+
+    assert np.all(np.isfinite(R))
+    assert_allclose(np.trapezoid(R**2 * r**2, r), 1.0, rtol=0.0, atol=1e-6)
+
+    # scipy's L is still finite for these n; the rest is formed in log space
+    rho = (2.0 * Z * r[1:]) / (n * a0)
+    L = eval_genlaguerre(n - l - 1, 2 * l + 1, rho)
+    log_norm = 0.5 * (
+        3 * np.log(2.0 * Z / (n * a0))
+        + lgamma(n - l)
+        - lgamma(n + l + 1)
+        - np.log(2.0 * n)
+    )
+    with np.errstate(divide="ignore"):
+        expected = np.sign(L) * np.exp(
+            log_norm - rho / 2.0 + l * np.log(rho) + np.log(np.abs(L))
+        )
+    scale = np.abs(R).max()
+    assert_allclose(R[1:] / scale, expected / scale, rtol=0.0, atol=1e-10)
+
+
+@pytest.mark.parametrize("n,l", HIGH_NL_VALUES)
+def test_radial_cumulative_distribution_high_n(n, l):
+    r = np.linspace(0.0, 4.0 * n * n * a0 / Z, 400_001)
+    P = radial_distribution(n, l, r)
+    expected = np.concatenate(([0.0], np.cumsum(0.5 * (P[1:] + P[:-1]) * np.diff(r))))
+    got = radial_cumulative_distribution(n, l, r[::1000])
+    assert_allclose(got, expected[::1000], rtol=0.0, atol=1e-6)
+
+    u = np.array([1e-9, 0.01, 0.5, 0.99, 1.0 - 1e-9])
+    r_u = inverse_radial_cumulative_distribution(n, l, u)
+    assert_allclose(radial_cumulative_distribution(n, l, r_u), u, rtol=0.0, atol=1e-12)
+
+
+def test_radial_wave_function_reuses_workspace():
+    r = R_ARRAY[0]
+    out = np.empty_like(r)
+    workspace = Workspace()
+
+    for n, l in NL_VALUES:
+        got = radial_wave_function(n, l, r, out=out, workspace=workspace)
+        assert got is out
+        expected = _radial_wave_function_scipy(n, l, r)
+        assert_allclose(got, expected, rtol=1e-10, atol=1e-12)
+        nbytes = workspace.nbytes
+
+    # Buffers are allocated on first use only
+    radial_wave_function(4, 0, r, out=out, workspace=workspace)
+    assert workspace.nbytes == nbytes
+
+
+@pytest.mark.parametrize("n,l", NL_VALUES + [(10, 2), (20, 7)])
+def test_radial_table_within_error_bound(n, l):
+    table = radial_table(n, l)
+    r = np.random.default_rng(n).uniform(0.0, 1.2 * table.r_max, 50_000)
+    r = np.concatenate((r, [0.0, table.r_max]))
+    exact = radial_wave_function(n, l, r)
+
+    assert table.max_error <= 1e-10 * np.abs(exact).max()
+    assert_allclose(table(r), exact, rtol=0.0, atol=1e-10 * np.abs(exact).max())
+    assert radial_table(n, l) is table
+
+
+def test_wavefunction_tabulated_backend_matches_exact():
+    x, y, z = np.random.default_rng(1).uniform(-60.0, 60.0, size=(3, 10_000))
+    exact = wavefunction_cartesian(6, 3, -2, x, y, z, out_format="complex")
+    tabulated = wavefunction_cartesian(
+        6, 3, -2, x, y, z, out_format="complex", radial_backend="tabulated"
+    )
+
+    assert_allclose(tabulated, exact, rtol=0.0, atol=1e-9 * np.abs(exact).max())
+    with pytest.raises(ValueError, match="radial_backend must be one of"):
+        wavefunction_cartesian(1, 0, 0, x, y, z, radial_backend="spline")
@@ -0,0 +1,258 @@
+import pytest
+import numpy as np
+from numpy.testing import assert_allclose, assert_array_equal
+from scipy.integrate import cumulative_trapezoid
+
+from wavefunction_tools import (
+    build_alias_table,
+    sample_alias,
+    sample_orbital,
+    sample_orbital_plane,
+    sample_orbital_plane_adaptive,
+    iter_sample_orbital,
+    parallel_sample_orbital,
+    parallel_sample_orbital_plane,
+    radial_axis,
+    radial_cumulative_distribution,
+)
+from wavefunction_tools.legendre import normalised_associated_legendre_polynomial
+from wavefunction_tools.sample_plane import build_plane_quadtree
+from wavefunction_tools.utilities import a0, Z
+
+NL_VALUES = [(1, 0), (2, 1), (3, 2), (4, 0), (18, 5), (25, 2)]
+
+
+@pytest.mark.parametrize("n,l", NL_VALUES)
+def test_sample_orbital_analytic_radial_mean(n, l):
+    r, _theta, _phi, _psi = sample_orbital(
+        n, l, 0, num_samples=200_000, r_max=np.inf, radial_method="analytic"
+    )
+    expected = (3 * n * n - l * (l + 1)) * a0 / (2 * Z)  # <r>
+
+    assert np.all(r >= 0.0)
+    assert_allclose(r.mean(), expected, rtol=1e-2)
+
+
+@pytest.mark.parametrize(
+    "m,basis", [(0, "complex"), (2, "complex"), (2, "real"), (-3, "real")]
+)
+def test_sample_orbital_separable_matches_grid_moments(m, basis):
+    n, l = 4, 3
+    kwargs = dict(num_samples=200_000, basis=basis, radial_method="analytic")
+    _r, theta_grid, phi_grid, _psi = sample_orbital(n, l, m, **kwargs)
+    _r, theta_sep, phi_sep, _psi = sample_orbital(
+        n, l, m, angular_method="separable", resolution_theta=2048, **kwargs
+    )
+
+    assert np.all((theta_sep >= 0.0) & (theta_sep <= np.pi))
+    assert np.all((phi_sep >= 0.0) & (phi_sep < 2.0 * np.pi))
+    assert_allclose(
+        (np.cos(theta_sep) ** 2).mean(), (np.cos(theta_grid) ** 2).mean(), atol=1e-2
+    )
+    for k in (1, 2, 4, 6):
+        assert_allclose(
+            np.cos(k * phi_sep).mean(), np.cos(k * phi_grid).mean(), atol=1e-2
+        )
+
+
+def test_iter_sample_orbital_yields_bounded_chunks():
+    chunks = list(iter_sample_orbital(3, 2, 1, num_samples=25_000, chunk_size=10_000))
+
+    assert [len(r) for r, _theta, _phi, _psi in chunks] == [10_000, 10_000, 5_000]
+    for r, theta, phi, (re, im) in chunks:
+        assert r.shape == theta.shape == phi.shape == re.shape == im.shape
+
+
+def test_sample_orbital_is_reproducible_for_a_seed():
+    first = sample_orbital(3, 1, 1, num_samples=1000, rng=42)
+    second = sample_orbital(3, 1, 1, num_samples=1000, rng=42)
+
+    for a, b in zip(first[:3], second[:3]):
+        assert_array_equal(a, b)
+    assert_array_equal(first[3][0], second[3][0])
+
+
+@pytest.mark.parametrize("sampler", ["orbital", "plane"])
+def test_parallel_sampling_is_independent_of_worker_count(sampler):
+    if sampler == "orbital":
+        sample, kwargs = parallel_sample_orbital, dict(angular_method="separable")
+    else:
+        sample, kwargs = parallel_sample_orbital_plane, dict(
+            plane="xz", axis_resolution=128
+        )
+
+    serial = sample(2, 1, 0, 5000, seed=7, workers=1, chunk_size=1000, **kwargs)
+    pooled = sample(2, 1, 0, 5000, seed=7, workers=2, chunk_size=1000, **kwargs)
+
+    assert len(serial[0]) == 5000
+    for a, b in zip(serial[:-1], pooled[:-1]):
+        assert_array_equal(a, b)
+    assert_array_equal(serial[-1][0], pooled[-1][0])
+    assert not np.array_equal(serial[0][:1000], serial[0][1000:2000])
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{}, dict(radial_method="analytic", angular_method="separable", basis="real")],
+)
+def test_sample_orbital_float32_matches_float64_moments(kwargs):
+    n, l, m = 3, 2, 1
+    r64, theta64, _phi, _psi = sample_orbital(n, l, m, 200_000, rng=3, **kwargs)
+    r32, theta32, phi32, (re32, im32) = sample_orbital(
+        n, l, m, 200_000, rng=3, dtype=np.float32, **kwargs
+    )
+
+    for array in (r32, theta32, phi32, re32, im32):
+        assert array.dtype == np.float32
+    assert_allclose(r32.mean(), r64.mean(), rtol=1e-2)
+    assert_allclose(
+        (np.cos(theta32) ** 2).mean(), (np.cos(theta64) ** 2).mean(), atol=1e-2
+    )
+
+
+@pytest.mark.parametrize(
+    "weights",
+    [
+        np.random.default_rng(0).random(1000) ** 8,  # Many tiny cells
+        np.r_[1e6, np.ones(1000)],  # One cell serves all the others
+        np.r_[0.0, 0.1, 0.1, 100.0, 100.0, 0.0, 3.0],
+        np.ones(7),
+        np.array([1.0, 1.0, 0.0, 2.0]),  # Exactly-full cells ahead of the donor
+        np.array([0.0, 1.0, 0.0, 3.0]),
+    ],
+)
+def test_alias_table_reproduces_weights(weights):
+    probability, alias = build_alias_table(weights)
+
+    # Cell i keeps probability[i] of its 1/N and gives the rest to alias[i]
+    implied = probability.copy()
+    np.add.at(implied, alias, 1.0 - probability)
+    assert_allclose(implied / len(weights), weights / weights.sum(), atol=1e-14)
+
+    counts = np.bincount(
+        sample_alias(probability, alias, 400_000, rng=1), minlength=len(weights)
+    )
+    assert_allclose(counts / 400_000, weights / weights.sum(), atol=3e-3)
+
+
+@pytest.mark.parametrize("sampler", ["orbital", "plane"])
+def test_alias_sampler_matches_cdf_moments(sampler):
+    n, l, m = 4, 2, 1
+    if sampler == "orbital":
+        sample, args = sample_orbital, (n, l, m, 200_000)
+    else:
+        sample, args = sample_orbital_plane, (n, l, m, 200_000, "xz")
+
+    cdf = sample(*args, rng=5, sampler="cdf")
+    alias = sample(*args, rng=5, sampler="alias")
+
+    for a, b in zip(cdf[:-1], alias[:-1]):
+        assert_allclose(np.abs(b).mean(), np.abs(a).mean(), rtol=1e-2)
+        assert_allclose((b**2).mean(), (a**2).mean(), rtol=2e-2)
+
+
+def test_plane_quadtree_refines_only_near_detail():
+    axis_limit = 10.0
+    u, v, level, pda, cda = build_plane_quadtree(1, 0, 0, "xz", axis_limit, 64, 5)
+
+    # Leaves tile the plane exactly, and the finest ones sit at the cusp
+    widths = 2.0 * axis_limit / 64 / 2.0**level
+    assert_allclose((widths**2).sum(), (2.0 * axis_limit) ** 2, rtol=1e-12)
+    assert level.max() == 5
+    assert np.hypot(u, v)[level == 5].max() < 2.0
+    assert np.hypot(u, v)[level <= 1].min() > 4.0
+    assert len(u) < 0.05 * (64 * 2**5) ** 2
+
+    # The plane integral of |psi_100|^2 = e^{-2r} / pi, whose tail beyond r = 10 is negligible
+    assert_allclose(pda.sum(), 0.5, rtol=1e-5)
+    assert cda[-1] == 1.0
+
+
+def test_plane_quadtree_defaults_reach_the_last_level_at_a_cusp():
+    axis_limit = radial_axis(1, 0)
+    u, v, level, _pda, _cda = build_plane_quadtree(1, 0, 0, "xz", axis_limit)
+
+    # 8192^2-equivalent leaves at the nucleus, for a small fraction of that grid's cells
+    assert level.max() == 5
+    assert np.hypot(u, v)[level == 5].max() < 0.1
+    assert len(u) < 300_000
+
+
+@pytest.mark.parametrize("sampler", ["cdf", "alias"])
+def test_adaptive_plane_sampler_matches_uniform_grid_moments(sampler):
+    args = (6, 3, 2, 200_000, "xz")
+    uniform = sample_orbital_plane(*args, axis_resolution=1024, rng=1)
+    adaptive = sample_orbital_plane_adaptive(*args, rng=2, sampler=sampler)
+
+    for a, b in zip(uniform[:2], adaptive[:2]):
+        assert_allclose(np.abs(b).mean(), np.abs(a).mean(), rtol=1e-2)
+        assert_allclose((b**2).mean(), (a**2).mean(), rtol=2e-2)
+
+
+def _ks_distance(samples, cdf):
+    x = np.sort(samples)
+    F = cdf(x)
+    i = np.arange(len(x))
+    return max(((i + 1) / len(x) - F).max(), (F - i / len(x)).max())
+
+
+def test_linear_interpolation_ks_distance():
+    n, l, m, num_samples = 4, 2, 1, 1_000_000
+    r_max = radial_axis(n, l)
+
+    # Analytic marginals: radial CDF (truncated at r_max), theta by fine quadrature and
+    # phi for the real basis, cos^2(phi)
+    def cdf_r(r):
+        return radial_cumulative_distribution(n, l, r) / radial_cumulative_distribution(
+            n, l, r_max
+        )
+
+    theta = np.linspace(0.0, np.pi, 100_001)
+    pdf_theta = normalised_associated_legendre_polynomial(l, m, np.cos(theta)) ** 2
+    cdf_theta = cumulative_trapezoid(pdf_theta * np.sin(theta), theta, initial=0.0)
+    cdf_theta /= cdf_theta[-1]
+
+    def cdf_phi(phi):
+        return (phi + 0.5 * np.sin(2.0 * phi)) / (2.0 * np.pi)
+
+    def ks_distances(interpolation, resolution):
+        r, theta_s, phi_s, _psi = sample_orbital(
+            n,
+            l,
+            m,
+            num_samples,
+            resolution_r=resolution,
+            resolution_theta=resolution,
+            resolution_phi=resolution,
+            basis="real",
+            interpolation=interpolation,
+            rng=0,
+        )
+        return np.array(
+            [
+                _ks_distance(r, cdf_r),
+                _ks_distance(theta_s, lambda t: np.interp(t, theta, cdf_theta)),
+                _ks_distance(phi_s, cdf_phi),
+            ]
+        )
+
+    # On a coarse grid constant cells are visibly biased, linear ones much less so
+    coarse_constant = ks_distances("constant", 24)
+    coarse_linear = ks_distances("linear", 24)
+    assert np.all(coarse_linear < 0.6 * coarse_constant)
+
+    # A 4x coarser linear grid stays within the 99% KS bound of exact sampling, like
+    # the constant one
+    bound = 1.63 / np.sqrt(num_samples)
+    assert np.all(ks_distances("linear", 64) < bound)
+    assert np.all(ks_distances("constant", 256) < bound)
+
+
+@pytest.mark.parametrize("sampler", ["cdf", "alias"])
+def test_linear_interpolation_stays_in_range(sampler):
+    r, theta, phi, _psi = sample_orbital(
+        3, 2, -2, 50_000, r_max=20.0, interpolation="linear", sampler=sampler, rng=1
+    )
+    assert r.min() >= 0.0 and r.max() <= 20.0
+    assert theta.min() >= 0.0 and theta.max() <= np.pi
+    assert phi.min() >= 0.0 and phi.max() < 2.0 * np.pi
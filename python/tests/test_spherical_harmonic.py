@@ -3,7 +3,15 @@ import numpy as np
 from numpy.testing import assert_allclose
 
 from scipy.special import sph_harm_y
-from wavefunction_tools import spherical_harmonic
+from wavefunction_tools import (
+    cartesian_to_spherical,
+    lm_index,
+    spherical_harmonic,
+    spherical_harmonic_cartesian,
+    spherical_harmonic_real,
+    spherical_harmonic_real_cartesian,
+    spherical_harmonic_table,
+)
 
 # Ensure positive, negative, even, odd m values are all tested
 LM_VALUES = [
@@ -52,3 +60,43 @@ def test_spherical_harmonic_matches_scipy(l, m, theta, phi):
     got = re + 1j * im
 
     assert_allclose(got, expected, rtol=1e-10, atol=1e-11)
+
+
+@pytest.mark.parametrize("l_max", [0, 3, 6])
+def test_spherical_harmonic_table_matches_scipy(l_max):
+    theta, phi = np.meshgrid(THETA_SCALAR, PHI_SCALAR, indexing="ij")
+    re, im = spherical_harmonic_table(l_max, theta, phi)
+    assert re.shape == ((l_max + 1) ** 2,) + theta.shape
+
+    for l in range(0, l_max + 1):
+        for m in range(-l, l + 1):
+            expected = sph_harm_y(l, m, theta, phi)
+            got = re[lm_index(l, m)] + 1j * im[lm_index(l, m)]
+            assert_allclose(got, expected, rtol=1e-10, atol=1e-11)
+
+
+@pytest.mark.parametrize("l,m", LM_VALUES)
+def test_spherical_harmonic_complex_format_matches_scipy(l, m):
+    theta, phi = np.meshgrid(THETA_SCALAR, PHI_SCALAR, indexing="ij")
+    got = spherical_harmonic(l, m, theta, phi, out_format="complex")
+
+    assert_allclose(got, sph_harm_y(l, m, theta, phi), rtol=1e-10, atol=1e-11)
+
+
+@pytest.mark.parametrize("l,m", LM_VALUES)
+def test_spherical_harmonic_cartesian_matches_angles(l, m):
+    rng = np.random.default_rng(l * 10 + m)
+    x, y, z = rng.normal(size=(3, 500))
+    # The origin, both poles and points on the z axis and in the xy plane
+    x = np.concatenate((x, [0.0, 0.0, 0.0, 0.0, 1.0, -2.0]))
+    y = np.concatenate((y, [0.0, 0.0, 0.0, 0.0, -3.0, 0.5]))
+    z = np.concatenate((z, [0.0, 1.0, -2.0, 1e-300, 0.0, 0.0]))
+    _r, theta, phi = cartesian_to_spherical(x, y, z)
+
+    got = spherical_harmonic_cartesian(l, m, x, y, z, out_format="complex")
+    expected = spherical_harmonic(l, m, theta, phi, out_format="complex")
+    assert_allclose(got, expected, rtol=1e-10, atol=1e-12)
+
+    got = spherical_harmonic_real_cartesian(l, m, x, y, z)
+    expected = spherical_harmonic_real(l, m, theta, phi)
+    assert_allclose(got, expected, rtol=1e-10, atol=1e-12)
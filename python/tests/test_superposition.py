@@ -0,0 +1,146 @@
+import pytest
+import numpy as np
+from numpy.testing import assert_allclose
+
+from wavefunction_tools import (
+    Superposition,
+    TwoStateDensity,
+    load_frames,
+    render_frames,
+    wavefunction_line_cartesian,
+    wavefunction_slice_cartesian,
+    time_dependent_factor,
+    superpose_wavefunctions,
+    complex_multiply,
+)
+
+STATES = [(1, 0, 0), (2, 1, 0), (3, 2, 1)]
+
+
+@pytest.mark.parametrize("time", [0.0, 0.37, 5.0])
+@pytest.mark.parametrize("factor", [0.0, 0.3, 1.0])
+def test_superpose_complex_format_matches_tuple(time, factor):
+    u = np.linspace(-20.0, 20.0, 101)
+    psi_tuple = [wavefunction_line_cartesian(n, l, m, "z", u) for n, l, m in STATES[:2]]
+    psi_complex = [
+        wavefunction_line_cartesian(n, l, m, "z", u, out_format="complex")
+        for n, l, m in STATES[:2]
+    ]
+
+    expected = superpose_wavefunctions(
+        complex_multiply(psi_tuple[0], time_dependent_factor(1, time)),
+        complex_multiply(psi_tuple[1], time_dependent_factor(2, time)),
+        factor,
+    )
+    got = superpose_wavefunctions(
+        psi_complex[0] * time_dependent_factor(1, time, out_format="complex"),
+        complex_multiply(psi_complex[1], time_dependent_factor(2, time)),
+        factor,
+    )
+
+    assert np.iscomplexobj(got)
+    assert_allclose(got, expected[0] + 1j * expected[1], rtol=1e-12, atol=1e-15)
+
+
+def test_superposition_matches_explicit_sum():
+    states = [(1, 0, 0, 0.6), (2, 1, 0, 0.3j), (3, 2, 1, -0.5 + 0.2j), (4, 3, -2, 0.1)]
+    u = np.linspace(-25.0, 25.0, 61)
+    u_grid, v_grid = np.meshgrid(u, u, indexing="xy")
+    superposition = Superposition.on_slice(states, "xz", u_grid, v_grid)
+
+    times = np.array([0.0, 0.37, 5.0])
+    got = superposition.evaluate(times, out_format="complex")
+    assert got.shape == times.shape + u_grid.shape
+
+    for time, psi in zip(times, got):
+        expected = sum(
+            coefficient
+            * wavefunction_slice_cartesian(
+                n, l, m, "xz", u_grid, v_grid, out_format="complex"
+            )
+            * time_dependent_factor(n, time, out_format="complex")
+            for n, l, m, coefficient in states
+        )
+        assert_allclose(psi, expected, rtol=1e-12, atol=1e-15)
+
+    re, im = superposition.evaluate(0.37)
+    assert_allclose(re + 1j * im, got[1], rtol=1e-12, atol=1e-15)
+
+
+def test_superposition_merges_repeated_states_and_overrides_coefficients():
+    u = np.linspace(-20.0, 20.0, 101)
+    superposition = Superposition.on_line(
+        [(2, 1, 0, 0.25), (1, 0, 0, 1.0), (2, 1, 0, 0.25)], "z", u
+    )
+    assert superposition.states == [(2, 1, 0), (1, 0, 0)]
+    assert_allclose(superposition.coefficients, [0.5, 1.0])
+
+    psi = superposition.evaluate(1.5, coefficients=[0.0, 1.0], out_format="complex")
+    expected = wavefunction_line_cartesian(
+        1, 0, 0, "z", u, out_format="complex"
+    ) * time_dependent_factor(1, 1.5, out_format="complex")
+    assert_allclose(psi, expected, rtol=1e-12, atol=1e-15)
+
+
+@pytest.mark.parametrize("time", [0.0, 0.37, 5.0])
+@pytest.mark.parametrize("factor", [0.0, 0.3, 1.0, (0.6 - 0.2j, 0.1 + 0.7j)])
+def test_two_state_density_matches_superposition(time, factor):
+    u = np.linspace(-20.0, 20.0, 81)
+    u_grid, v_grid = np.meshgrid(u, u, indexing="xy")
+    psi1 = wavefunction_slice_cartesian(2, 1, 1, "xy", u_grid, v_grid)
+    psi2 = wavefunction_slice_cartesian(3, 2, -1, "xy", u_grid, v_grid)
+    frames = TwoStateDensity(psi1, psi2, 2, 3)
+
+    if isinstance(factor, tuple):
+        a, b = factor
+    else:
+        a, b = np.cos(0.5 * np.pi * factor), np.sin(0.5 * np.pi * factor)
+    psi = a * (psi1[0] + 1j * psi1[1]) * time_dependent_factor(
+        2, time, out_format="complex"
+    ) + b * (psi2[0] + 1j * psi2[1]) * time_dependent_factor(
+        3, time, out_format="complex"
+    )
+
+    scale = np.abs(psi).max()
+    assert_allclose(
+        frames.density(time, factor), np.abs(psi) ** 2, atol=1e-12 * scale**2
+    )
+    assert_allclose(frames.magnitude(time, factor), np.abs(psi), atol=1e-7 * scale)
+
+    # Compare phases only where psi is not vanishingly small
+    mask = np.abs(psi) > 1e-6 * scale
+    difference = np.angle(np.exp(1j * (frames.phase(time, factor) - np.angle(psi))))
+    assert_allclose(difference[mask], 0.0, atol=1e-9)
+
+
+@pytest.mark.parametrize("quantity", ["psi", "density", "magnitude", "phase"])
+def test_render_frames_round_trips_through_disk(tmp_path, quantity):
+    states = [(1, 0, 0, 0.8), (2, 1, 1, 0.6j)]
+    u = np.linspace(-10.0, 10.0, 31)
+    u_grid, v_grid = np.meshgrid(u, u, indexing="xy")
+    superposition = Superposition.on_slice(states, "xy", u_grid, v_grid)
+    times = np.linspace(0.0, 2.0, 7)
+
+    path = tmp_path / "frames.npy"
+    render_frames(superposition, times, path, quantity=quantity, batch_size=3)
+    frames, metadata = load_frames(path)
+
+    psi = superposition.evaluate(times, out_format="complex")
+    expected = {
+        "psi": psi,
+        "density": np.abs(psi) ** 2,
+        "magnitude": np.abs(psi),
+        "phase": np.angle(psi),
+    }[quantity]
+    assert isinstance(frames, np.memmap)
+    assert_allclose(frames, expected, rtol=1e-12, atol=1e-15)
+
+    assert metadata["quantity"] == quantity
+    assert metadata["times"] == times.tolist()
+    assert metadata["shape"] == list(u_grid.shape)
+    assert metadata["grid"] == {"plane": "xy", "u": [-10.0, 10.0], "v": [-10.0, 10.0]}
+    assert [(s["n"], s["l"], s["m"]) for s in metadata["states"]] == [
+        (1, 0, 0),
+        (2, 1, 1),
+    ]
+    assert metadata["states"][1]["coefficient"] == [0.0, 0.6]
@@ -0,0 +1,152 @@
+import pytest
+import numpy as np
+from numpy.testing import assert_allclose, assert_array_equal
+
+from wavefunction_tools import (
+    cartesian_to_spherical,
+    clear_radial_axis_cache,
+    radial_axis,
+    radial_distribution,
+    wavefunction,
+    wavefunction_cartesian,
+    wavefunction_slice_cartesian,
+    wavefunction_volume,
+)
+from wavefunction_tools.tiling import evaluate_tiled
+
+NL_VALUES = [(1, 0), (2, 0), (2, 1), (3, 1), (4, 3), (8, 2)]
+
+
+@pytest.mark.parametrize("n,l", NL_VALUES)
+@pytest.mark.parametrize("tail", [1e-1, 1e-3, 1e-6])
+def test_radial_axis_encloses_one_minus_tail(n, l, tail):
+    r_axis = radial_axis(n, l, tail=tail)
+    r = np.linspace(0.0, r_axis, 20000)
+    enclosed = np.trapezoid(radial_distribution(n, l, r), r)
+
+    assert_allclose(enclosed, 1.0 - tail, rtol=0.0, atol=1e-7)
+    assert radial_axis(n, l, tail=tail) == r_axis
+    clear_radial_axis_cache()
+    assert radial_axis(n, l, tail=tail) == r_axis
+
+
+@pytest.mark.parametrize("basis", ["complex", "real"])
+@pytest.mark.parametrize("workers", [2, 0])
+def test_wavefunction_slice_tiled_matches_serial(basis, workers):
+    u = np.linspace(-20.0, 20.0, 301)
+    u_grid, v_grid = np.meshgrid(u, u, indexing="xy")
+
+    expected = wavefunction_slice_cartesian(4, 2, -1, "xz", u_grid, v_grid, basis)
+    got = wavefunction_slice_cartesian(
+        4, 2, -1, "xz", u_grid, v_grid, basis, workers=workers
+    )
+
+    assert got[0].shape == u_grid.shape
+    assert_array_equal(got[0], expected[0])
+    assert_array_equal(got[1], expected[1])
+
+
+@pytest.mark.parametrize("indexing", ["xy", "ij"])
+@pytest.mark.parametrize("resolution", [40, 41])
+@pytest.mark.parametrize("v_scale", [1.0, 0.5])
+def test_wavefunction_slice_symmetric_grid_matches_direct(
+    indexing, resolution, v_scale
+):
+    # Symmetric about 0 (the radial part is reused across mirror pixels) and not
+    u = np.linspace(-30.0, 30.0, resolution)
+    for v in (v_scale * u, np.linspace(-10.0, 30.0, resolution)):
+        u_grid, v_grid = np.meshgrid(u, v, indexing=indexing)
+        psi = wavefunction_slice_cartesian(
+            6, 3, 2, "xy", u_grid, v_grid, out_format="complex"
+        )
+        expected = wavefunction_cartesian(
+            6, 3, 2, u_grid, v_grid, np.zeros_like(u_grid), out_format="complex"
+        )
+        assert_allclose(psi, expected, rtol=1e-12, atol=1e-15)
+
+
+def test_evaluate_tiled_broadcasts_and_preserves_structure():
+    x = np.linspace(0.0, 1.0, 50_000).reshape(100, 500)
+    y = np.arange(500.0)
+
+    got = evaluate_tiled(lambda a, b: a * b, x, y, workers=3, tile_size=1000)
+
+    assert_array_equal(got, x * y)
+
+
+@pytest.mark.parametrize(
+    "n,l,m", [(1, 0, 0), (2, 1, 0), (3, 1, -1), (3, 2, 1), (4, 3, -2), (4, 3, 3)]
+)
+@pytest.mark.parametrize("basis", ["complex", "real"])
+@pytest.mark.parametrize("resolution", [16, 17])
+def test_wavefunction_volume_matches_direct_evaluation(n, l, m, basis, resolution):
+    extent = 2.0 * n * n
+    axis = np.linspace(-extent, extent, resolution)
+    x, y, z = np.meshgrid(axis, axis, axis, indexing="ij")
+
+    expected_re, expected_im = wavefunction_cartesian(n, l, m, x, y, z, basis)
+    re, im = wavefunction_volume(n, l, m, extent, resolution, basis)
+
+    assert_allclose(re, expected_re, rtol=1e-9, atol=1e-12)
+    assert_allclose(im, expected_im, rtol=1e-9, atol=1e-12)
+
+
+@pytest.mark.parametrize("n,l,m", [(2, 1, 0), (3, 2, -1), (4, 3, 2)])
+@pytest.mark.parametrize("basis", ["complex", "real"])
+def test_complex_out_format_matches_tuple(n, l, m, basis):
+    u = np.linspace(-15.0, 15.0, 41)
+    u_grid, v_grid = np.meshgrid(u, u, indexing="xy")
+
+    re, im = wavefunction_slice_cartesian(n, l, m, "xz", u_grid, v_grid, basis)
+    psi = wavefunction_slice_cartesian(
+        n, l, m, "xz", u_grid, v_grid, basis, out_format="complex"
+    )
+    assert np.iscomplexobj(psi) == (basis == "complex")
+    assert_allclose(psi, re + 1j * im, rtol=1e-12, atol=1e-15)
+
+    re, im = wavefunction_volume(n, l, m, 10.0, 15, basis)
+    psi = wavefunction_volume(n, l, m, 10.0, 15, basis, out_format="complex")
+    assert_allclose(psi, re + 1j * im, rtol=1e-12, atol=1e-15)
+
+
+@pytest.mark.parametrize(
+    "n,l,m", [(1, 0, 0), (3, 2, 1), (4, 3, -2), (6, 4, 3), (10, 5, 2), (15, 9, -4)]
+)
+@pytest.mark.parametrize("basis", ["complex", "real"])
+def test_float32_matches_float64_within_envelope(n, l, m, basis):
+    extent = radial_axis(n, l)
+    # float32 coordinates, so both paths see exactly the same points
+    x, y, z = (
+        np.random.default_rng(0)
+        .uniform(-extent, extent, size=(3, 20_000))
+        .astype(np.float32)
+    )
+
+    expected = wavefunction_cartesian(n, l, m, x, y, z, basis, out_format="complex")
+    psi = wavefunction_cartesian(
+        n, l, m, x, y, z, basis, out_format="complex", dtype=np.float32
+    )
+
+    assert psi.dtype == (np.complex64 if basis == "complex" else np.float32)
+    assert np.abs(psi - expected).max() <= 1e-5 * np.abs(expected).max()
+
+    re, im = wavefunction_volume(n, l, m, extent, 15, basis, dtype=np.float32)
+    assert re.dtype == im.dtype == np.float32
+
+
+def test_dtype_rejects_non_float_precisions():
+    with pytest.raises(ValueError, match="dtype must be one of"):
+        wavefunction_cartesian(1, 0, 0, 1.0, 0.0, 0.0, dtype=np.int32)
+
+
+@pytest.mark.parametrize("n,l,m", [(1, 0, 0), (3, 2, -1), (4, 3, 3), (6, 5, -4)])
+@pytest.mark.parametrize("basis", ["complex", "real"])
+def test_wavefunction_cartesian_matches_spherical_path(n, l, m, basis):
+    axis = np.linspace(-3.0 * n * n, 3.0 * n * n, 21)  # Includes the origin and axes
+    x, y, z = np.meshgrid(axis, axis, axis, indexing="ij")
+
+    got = wavefunction_cartesian(n, l, m, x, y, z, basis, out_format="complex")
+    r, theta, phi = cartesian_to_spherical(x, y, z)
+    expected = wavefunction(n, l, m, r, theta, phi, basis, out_format="complex")
+
+    assert_allclose(got, expected, rtol=1e-9, atol=1e-14)
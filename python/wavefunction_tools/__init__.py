@@ -1,13 +1,36 @@
-from .laguerre import associated_laguerre_polynomial, laguerre_derivative
-from .legendre import associated_legendre_polynomial
-from .radial_wave_function import radial_wave_function, radial_distribution
-from .spherical_harmonic import spherical_harmonic, spherical_harmonic_real
+from .laguerre import (
+    associated_laguerre_polynomial,
+    scaled_laguerre_polynomial,
+    laguerre_derivative,
+)
+from .legendre import (
+    associated_legendre_polynomial,
+    associated_legendre_table,
+    normalised_associated_legendre_polynomial,
+    lm_index,
+)
+from .radial_wave_function import (
+    radial_wave_function,
+    radial_distribution,
+    radial_cumulative_distribution,
+    inverse_radial_cumulative_distribution,
+)
+from .radial_table import RadialTable, radial_table
+from .spherical_harmonic import (
+    spherical_harmonic,
+    spherical_harmonic_cartesian,
+    spherical_harmonic_real,
+    spherical_harmonic_real_cartesian,
+    spherical_harmonic_table,
+)
 from .wavefunction import (
     wavefunction,
     wavefunction_cartesian,
     wavefunction_slice_cartesian,
     wavefunction_line_cartesian,
+    wavefunction_volume,
     radial_axis,
+    clear_radial_axis_cache,
 )
 from .utilities import (
     spherical_to_cartesian,
@@ -16,7 +39,19 @@ from .utilities import (
     complex_magnitude,
     complex_magnitude_squared,
     complex_multiply,
+    Workspace,
+)
+from .sample import sample_orbital, iter_sample_orbital
+from .cache import TableCache, table_cache
+from .alias import build_alias_table, sample_alias
+from .instrument import Report, instrument
+from .sample_plane import sample_orbital_plane, sample_orbital_plane_adaptive
+from .superposition import (
+    energy_level,
+    time_dependent_factor,
+    superpose_wavefunctions,
+    Superposition,
+    TwoStateDensity,
 )
-from .sample import sample_orbital
-from .sample_plane import sample_orbital_plane
-from .superposition import time_dependent_factor, superpose_wavefunctions
+from .frames import render_frames, load_frames, frame_quantity
+from .parallel import parallel_sample_orbital, parallel_sample_orbital_plane
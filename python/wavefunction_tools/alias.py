@@ -0,0 +1,87 @@
+"""
+Walker/Vose alias tables: O(1) draws from a discrete distribution, whatever its size.
+Inverse-CDF sampling costs a binary search (O(log N) cache misses) per draw; an alias table
+costs one uniform, one table lookup and one comparison.
+"""
+
+import numpy as np
+import numpy.typing as npt
+from typing import Literal
+
+from .instrument import stage
+from .utilities import RNGLike
+
+# How table samplers draw grid cells: binary search of the CDF, or an alias table
+Sampler = Literal["cdf", "alias"]
+
+
+def build_alias_table(weights: npt.ArrayLike) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Alias table (probability, alias) for non-negative weights (any shape, flattened).
+    Cell i keeps index i with probability[i] and otherwise returns alias[i].
+
+    Vose's construction, vectorised: under-full cells are served in order by the over-full
+    cells in order, each over-full cell being emptied in turn, so the cell serving small
+    cell k is the one whose cumulative excess first passes k's cumulative deficit.
+    """
+    weights = np.asarray(weights, dtype=np.float64).ravel()
+    size = weights.size
+    total = weights.sum()
+    if size == 0 or not total > 0.0:
+        raise ValueError("weights must contain a positive entry.")
+
+    # Scaled so the mean cell holds exactly 1
+    q = weights * (size / total)
+    is_small = q < 1.0
+    is_small[np.argmax(q)] = False  # Keep a donor even if rounding puts every q below 1
+    small = np.flatnonzero(is_small)
+    large = np.flatnonzero(~is_small)
+
+    deficit_end = np.cumsum(1.0 - q[small])
+    # Shared boundaries, so both searches below see the same rounding
+    deficit_start = np.r_[0.0, deficit_end[:-1]]
+    excess_end = np.cumsum(q[large] - 1.0)
+
+    index_dtype = np.int32 if size < 2**31 else np.intp
+    probability = np.ones(size, dtype=np.float64)
+    alias = np.arange(size, dtype=index_dtype)
+
+    # Each small cell is filled by the large cell being emptied when its deficit starts
+    donor = np.searchsorted(excess_end, deficit_start, side="right")
+    donor = np.minimum(donor, len(large) - 1)
+    probability[small] = q[small]
+    alias[small] = large[donor]
+
+    # A large cell overshoots into the small cell straddling its excess end, and that
+    # overshoot is then filled by the next large cell
+    straddle = np.searchsorted(deficit_end, excess_end, side="left")
+    overshoot = np.zeros(len(large))
+    inside = straddle < len(small)
+    # Only if that cell's deficit starts before the excess ends: a large cell with no
+    # excess (q exactly 1) ahead of every donor straddles nothing
+    inside[inside] &= deficit_start[straddle[inside]] < excess_end[inside]
+    overshoot[inside] = deficit_end[straddle[inside]] - excess_end[inside]
+    overshoot[-1] = 0.0  # The last donor only absorbs rounding
+    probability[large] = np.clip(1.0 - overshoot, 0.0, 1.0)
+    alias[large[:-1]] = large[1:]
+
+    return probability, alias
+
+
+def sample_alias(
+    probability: np.ndarray,
+    alias: np.ndarray,
+    num_samples: int,
+    rng: RNGLike = None,
+) -> np.ndarray:
+    """Indices drawn from an alias table (see build_alias_table)."""
+    rng = np.random.default_rng(rng)
+    with stage("sample.alias", num_samples):
+        # One float64 uniform gives both the cell (integer part) and the coin (fraction)
+        u = rng.random(num_samples)
+        u *= len(probability)
+        index = u.astype(alias.dtype)
+        u -= index
+        np.minimum(index, len(probability) - 1, out=index)  # u * N can round up to N
+        keep = u < probability[index]
+        return np.where(keep, index, alias[index])
@@ -0,0 +1,127 @@
+import functools
+import inspect
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+import numpy as np
+
+
+class TableCache:
+    """
+    Bounded least-recently-used cache for sampling tables, sized by array bytes.
+    Cached arrays are made read-only, since every caller shares them.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024):
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_bytes = int(max_bytes)
+        self._current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        """Set the byte budget (0 disables caching), evicting entries that no longer fit."""
+        with self._lock:
+            self._max_bytes = int(value)
+            self._evict()
+
+    @property
+    def current_bytes(self) -> int:
+        return self._current_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key][0]
+
+    def put(self, key: Hashable, value: Any) -> Any:
+        """Store value under key (unless it alone exceeds max_bytes) and return it."""
+        _freeze(value)
+        size = _nbytes(value)
+        with self._lock:
+            if key in self._entries:
+                self._current_bytes -= self._entries.pop(key)[1]
+            if 0 < self._max_bytes and size <= self._max_bytes:
+                self._entries[key] = (value, size)
+                self._current_bytes += size
+                self._evict()
+        return value
+
+    def clear(self) -> None:
+        """Drop all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "current_bytes": self._current_bytes,
+                "max_bytes": self._max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def cached(self, func: Callable) -> Callable:
+        """Decorator caching func on its bound arguments (defaults included)."""
+        signature = inspect.signature(func)
+        _missing = object()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (func.__module__, func.__qualname__, tuple(bound.arguments.items()))
+
+            value = self.get(key, _missing)
+            if value is _missing:
+                value = self.put(key, func(*args, **kwargs))
+            return value
+
+        return wrapper
+
+    def _evict(self) -> None:
+        while self._current_bytes > self._max_bytes and self._entries:
+            _key, (_value, size) = self._entries.popitem(last=False)
+            self._current_bytes -= size
+            self.evictions += 1
+
+
+def _nbytes(value: Any) -> int:
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (tuple, list)):
+        return sum(_nbytes(item) for item in value)
+    return 0
+
+
+def _freeze(value: Any) -> None:
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif isinstance(value, (tuple, list)):
+        for item in value:
+            _freeze(item)
+
+
+# Shared by the sampling table builders in sample.py and sample_plane.py
+table_cache = TableCache()
@@ -0,0 +1,430 @@
+"""
+Headless rendering from the command line, for batch jobs without a display.
+Each subcommand renders one job to .npy (arrays) or .png (images, drawn with matplotlib's
+Agg canvas, no GUI backend). `batch` runs a JSON list of job specs across a process pool;
+a job spec is the subcommand's arguments as keys, e.g.
+
+    {"command": "slice", "n": 3, "l": 1, "m": -1, "plane": "xz", "output": "a.png"}
+
+Jobs are ordered by quantum numbers before being handed out in chunks, so consecutive jobs
+in a worker process reuse its cached tables (radial_axis, sampling tables).
+
+    wavefunction-tools slice 3 1 -1 --plane xz --resolution 1000 -o slice.png
+    wavefunction-tools superpose --state 1,0,0 --state 2,1,0 --times 0 1 2 -o frames.npy
+    wavefunction-tools batch jobs.json --workers 8
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+import numpy as np
+
+from .alias import Sampler
+from .frames import FrameQuantity, frame_quantity, render_frames
+from .sample import sample_orbital
+from .sample_plane import sample_orbital_plane
+from .superposition import Superposition
+from .utilities import spherical_to_cartesian
+from .wavefunction import (
+    Axis,
+    Basis,
+    Plane,
+    radial_axis,
+    wavefunction_line_cartesian,
+    wavefunction_slice_cartesian,
+    wavefunction_volume,
+)
+
+# (n, l, m), optionally with a coefficient: "n,l,m[,c]", [n, l, m] or [n, l, m, c]
+StateSpec = str | Sequence[Any]
+
+
+def render_slice(
+    n: int,
+    l: int,
+    m: int,
+    output: str | Path,
+    plane: Plane = "xy",
+    resolution: int = 512,
+    extent: float | None = None,
+    basis: Basis = "complex",
+    quantity: FrameQuantity = "density",
+    workers: int | None = None,
+) -> Path:
+    """quantity of psi on a resolution^2 grid over [-extent, extent]^2 of plane."""
+    extent = radial_axis(n, l) if extent is None else extent
+    u = np.linspace(-extent, extent, resolution)
+    u_grid, v_grid = np.meshgrid(u, u, indexing="xy")
+    psi = wavefunction_slice_cartesian(
+        n, l, m, plane, u_grid, v_grid, basis, workers=workers, out_format="complex"
+    )
+    values = frame_quantity(psi, quantity)
+    return _write(
+        output,
+        values,
+        lambda ax: _image(ax, values, extent, quantity, plane),
+        title=rf"$(n,l,m)=({n},{l},{m})$ {quantity} on {plane}-plane",
+    )
+
+
+def render_line(
+    n: int,
+    l: int,
+    m: int,
+    output: str | Path,
+    axis: Axis = "z",
+    resolution: int = 2048,
+    extent: float | None = None,
+    basis: Basis = "complex",
+    quantity: FrameQuantity = "density",
+    workers: int | None = None,
+) -> Path:
+    """quantity of psi at resolution points over [-extent, extent] of axis."""
+    extent = radial_axis(n, l) if extent is None else extent
+    u = np.linspace(-extent, extent, resolution)
+    psi = wavefunction_line_cartesian(
+        n, l, m, axis, u, basis, workers=workers, out_format="complex"
+    )
+    values = frame_quantity(psi, quantity)
+
+    def plot(ax) -> None:
+        ax.plot(u, values)
+        ax.set_xlabel(axis)
+        ax.set_ylabel(quantity)
+
+    return _write(
+        output, values, plot, title=rf"$(n,l,m)=({n},{l},{m})$ on {axis}-axis"
+    )
+
+
+def render_volume(
+    n: int,
+    l: int,
+    m: int,
+    output: str | Path,
+    resolution: int = 128,
+    extent: float | None = None,
+    basis: Basis = "complex",
+    quantity: FrameQuantity = "density",
+    workers: int | None = None,
+) -> Path:
+    """quantity of psi on the cube [-extent, extent]^3, indexed [x, y, z] (.npy only)."""
+    extent = radial_axis(n, l) if extent is None else extent
+    psi = wavefunction_volume(
+        n, l, m, extent, resolution, basis, workers=workers, out_format="complex"
+    )
+    return _write(output, frame_quantity(psi, quantity))
+
+
+def render_sample(
+    n: int,
+    l: int,
+    m: int,
+    output: str | Path,
+    samples: int = 100_000,
+    plane: Plane | None = None,
+    extent: float | None = None,
+    basis: Basis = "complex",
+    seed: int | None = None,
+    sampler: Sampler = "cdf",
+) -> Path:
+    """
+    Samples of |psi|^2 as rows (x, y, z, re, im), or (u, v, re, im) on a plane.
+    .png draws the samples as a dot density plot, which needs a plane.
+    """
+    if plane is None:
+        r, theta, phi, (re, im) = sample_orbital(
+            n, l, m, samples, r_max=extent, basis=basis, rng=seed, sampler=sampler
+        )
+        points = np.column_stack((*spherical_to_cartesian(r, theta, phi), re, im))
+        return _write(output, points)
+
+    u, v, (re, im) = sample_orbital_plane(
+        n,
+        l,
+        m,
+        samples,
+        plane,
+        axis_limit=extent,
+        basis=basis,
+        rng=seed,
+        sampler=sampler,
+    )
+
+    def plot(ax) -> None:
+        ax.scatter(u, v, s=0.5, c=np.where(re >= 0.0, "C1", "C0"), linewidths=0)
+        ax.set_xlabel(plane[0])
+        ax.set_ylabel(plane[1])
+        ax.set_aspect("equal", adjustable="box")
+
+    return _write(
+        output,
+        np.column_stack((u, v, re, im)),
+        plot,
+        title=rf"Dot density: $(n,l,m)=({n},{l},{m})$ on {plane}-plane",
+    )
+
+
+def render_superpose(
+    states: Sequence[StateSpec],
+    output: str | Path,
+    plane: Plane = "xy",
+    resolution: int = 512,
+    extent: float | None = None,
+    basis: Basis = "complex",
+    quantity: FrameQuantity = "density",
+    times: Sequence[float] = (0.0,),
+    hbar: float = 1.0,
+    workers: int | None = None,
+) -> Path:
+    """
+    quantity of the superposition of states at each time on a plane.
+    .npy writes the frame stack with render_frames (and its .json sidecar); .png one frame.
+    """
+    states = [_parse_state(state) for state in states]
+    if extent is None:
+        extent = max(radial_axis(n, l) for n, l, _m, _c in states)
+    u = np.linspace(-extent, extent, resolution)
+    u_grid, v_grid = np.meshgrid(u, u, indexing="xy")
+    superposition = Superposition.on_slice(
+        states, plane, u_grid, v_grid, basis=basis, hbar=hbar, workers=workers
+    )
+
+    output = Path(output)
+    if output.suffix == ".npy":
+        render_frames(superposition, times, output, quantity)
+        return output
+    if len(times) != 1:
+        raise ValueError("A .png output renders a single time; use .npy for several.")
+
+    values = frame_quantity(
+        superposition.evaluate(times[0], out_format="complex"), quantity
+    )
+    return _write(
+        output,
+        values,
+        lambda ax: _image(ax, values, extent, quantity, plane),
+        title=f"{quantity} at t={times[0]:g} on {plane}-plane",
+    )
+
+
+RENDERERS: dict[str, Callable[..., Path]] = {
+    "slice": render_slice,
+    "line": render_line,
+    "volume": render_volume,
+    "sample": render_sample,
+    "superpose": render_superpose,
+}
+
+
+def run_job(job: dict[str, Any]) -> Path:
+    """Render one job spec {"command": ..., "output": ..., **arguments}."""
+    job = dict(job)
+    command = job.pop("command", None)
+    if command not in RENDERERS:
+        raise ValueError(
+            f"command must be one of: {', '.join(repr(c) for c in RENDERERS)}"
+        )
+    return RENDERERS[command](**job)
+
+
+def run_jobs(
+    jobs: Sequence[dict[str, Any]], workers: int | None = None
+) -> list[str | None]:
+    """
+    Render job specs across a process pool (workers=1 runs them in this process).
+    Returns, in job order, None for each job that succeeded and the error otherwise.
+    """
+    # Sorted so the jobs in a chunk mostly share quantum numbers, and the worker's tables
+    order = sorted(range(len(jobs)), key=lambda i: _job_key(jobs[i]))
+    ordered = [jobs[i] for i in order]
+
+    if workers == 1 or len(jobs) <= 1:
+        results = [_try_job(job) for job in ordered]
+    else:
+        chunksize = max(1, len(jobs) // (4 * (workers or os.cpu_count() or 1)))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_try_job, ordered, chunksize=chunksize))
+
+    errors: list[str | None] = [None] * len(jobs)
+    for index, error in zip(order, results):
+        errors[index] = error
+    return errors
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = vars(_parser().parse_args(argv))
+    command = args.pop("command")
+
+    if command != "batch":
+        print(run_job({"command": command, **args}))
+        return
+
+    with open(args["jobs"]) as f:
+        jobs = json.load(f)
+    errors = run_jobs(jobs, args["workers"])
+    for job, error in zip(jobs, errors):
+        print(f"{job.get('output')}: {'ok' if error is None else error}")
+
+    failed = sum(error is not None for error in errors)
+    print(f"{len(jobs) - failed} of {len(jobs)} jobs succeeded")
+    sys.exit(1 if failed else 0)
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="wavefunction-tools", description=__doc__.strip().splitlines()[0]
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("-o", "--output", required=True, help="Output .npy or .png")
+    common.add_argument(
+        "--extent", type=float, help="Axis limit (default: radial_axis(n, l))"
+    )
+    common.add_argument("--basis", choices=["complex", "real"], default="complex")
+
+    quantum = argparse.ArgumentParser(add_help=False)
+    quantum.add_argument("n", type=int)
+    quantum.add_argument("l", type=int)
+    quantum.add_argument("m", type=int)
+
+    evaluated = argparse.ArgumentParser(add_help=False)
+    evaluated.add_argument(
+        "--quantity",
+        choices=["psi", "density", "magnitude", "phase"],
+        default="density",
+        help="What to write (default: density)",
+    )
+    evaluated.add_argument(
+        "--workers", type=int, help="Threads per evaluation (0: every CPU)"
+    )
+
+    def add(name: str, parents: list, help: str) -> argparse.ArgumentParser:
+        return subparsers.add_parser(name, parents=parents, help=help)
+
+    slice_parser = add("slice", [quantum, common, evaluated], "psi on a plane")
+    slice_parser.add_argument("--plane", choices=["xy", "xz", "yz"], default="xy")
+    slice_parser.add_argument("--resolution", type=int, default=512)
+
+    line_parser = add("line", [quantum, common, evaluated], "psi along an axis")
+    line_parser.add_argument("--axis", choices=["x", "y", "z"], default="z")
+    line_parser.add_argument("--resolution", type=int, default=2048)
+
+    volume_parser = add("volume", [quantum, common, evaluated], "psi on a cube")
+    volume_parser.add_argument("--resolution", type=int, default=128)
+
+    sample_parser = add("sample", [quantum, common], "Samples of |psi|^2")
+    sample_parser.add_argument("--samples", type=int, default=100_000)
+    sample_parser.add_argument(
+        "--plane", choices=["xy", "xz", "yz"], help="Sample a plane (default: 3D)"
+    )
+    sample_parser.add_argument("--seed", type=int)
+    sample_parser.add_argument(
+        "--sampler",
+        choices=["cdf", "alias"],
+        default="cdf",
+        help="Grid cell draws by CDF search or alias table (default: cdf)",
+    )
+
+    superpose_parser = add("superpose", [common, evaluated], "Superposed states")
+    superpose_parser.add_argument(
+        "--state",
+        dest="states",
+        action="append",
+        required=True,
+        help="n,l,m[,coefficient], repeated for each state",
+    )
+    superpose_parser.add_argument("--plane", choices=["xy", "xz", "yz"], default="xy")
+    superpose_parser.add_argument("--resolution", type=int, default=512)
+    superpose_parser.add_argument("--times", type=float, nargs="+", default=[0.0])
+    superpose_parser.add_argument("--hbar", type=float, default=1.0)
+
+    batch_parser = subparsers.add_parser("batch", help="Run a JSON list of job specs")
+    batch_parser.add_argument("jobs", help="JSON file with a list of job specs")
+    batch_parser.add_argument(
+        "--workers", type=int, help="Worker processes (default: every CPU)"
+    )
+    return parser
+
+
+def _try_job(job: dict[str, Any]) -> str | None:
+    try:
+        run_job(job)
+    except Exception as error:
+        return f"{type(error).__name__}: {error}"
+    return None
+
+
+def _job_key(job: dict[str, Any]) -> tuple:
+    return (
+        str(job.get("states", "")),
+        job.get("n", 0),
+        job.get("l", 0),
+        job.get("m", 0),
+    )
+
+
+def _parse_state(state: StateSpec) -> tuple[int, int, int, complex]:
+    parts = state.split(",") if isinstance(state, str) else list(state)
+    if len(parts) not in (3, 4):
+        raise ValueError("A state must be n,l,m or n,l,m,coefficient.")
+    coefficient = parts[3] if len(parts) == 4 else 1.0
+    if isinstance(coefficient, (list, tuple)):
+        coefficient = complex(*coefficient)  # [re, im] in JSON
+    return int(parts[0]), int(parts[1]), int(parts[2]), complex(coefficient)
+
+
+def _write(
+    output: str | Path,
+    values: np.ndarray,
+    plot: Callable | None = None,
+    title: str = "",
+) -> Path:
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    if output.suffix == ".npy":
+        np.save(output, values)
+        return output
+    if output.suffix != ".png":
+        raise ValueError("output must end in one of: '.npy', '.png'")
+    if plot is None:
+        raise ValueError("Only 2D and line jobs have an image form; use a .npy output.")
+    if np.iscomplexobj(values):
+        raise ValueError("quantity 'psi' is complex; use a .npy output.")
+
+    # A bare Figure draws on the Agg canvas, so no GUI backend is ever selected
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(8, 7))
+    ax = fig.subplots()
+    plot(ax)
+    ax.set_title(title)
+    fig.tight_layout()
+    fig.savefig(output, dpi=150)
+    return output
+
+
+def _image(ax, values: np.ndarray, extent: float, quantity: str, plane: str) -> None:
+    phase = quantity == "phase"
+    image = ax.imshow(
+        values,
+        extent=(-extent, extent, -extent, extent),
+        origin="lower",
+        cmap="twilight" if phase else "magma",
+        vmin=-np.pi if phase else None,
+        vmax=np.pi if phase else None,
+    )
+    ax.set_xlabel(plane[0])
+    ax.set_ylabel(plane[1])
+    ax.set_aspect("equal", adjustable="box")
+    ax.figure.colorbar(image, ax=ax, fraction=0.046, pad=0.04).set_label(quantity)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Offline rendering of superposition animations.
+Frames are computed in vectorised batches of times and streamed into a memory-mapped .npy
+stack, with a JSON sidecar (same path, .json suffix) describing states, times and grid.
+"""
+
+import json
+import numpy as np
+import numpy.typing as npt
+from pathlib import Path
+from typing import Any, Literal
+
+from .superposition import Superposition
+
+# What each frame stores: psi itself (complex), |psi|^2, |psi| or arg(psi)
+FrameQuantity = Literal["psi", "density", "magnitude", "phase"]
+
+
+def render_frames(
+    superposition: Superposition,
+    times: npt.ArrayLike,
+    path: str | Path,
+    quantity: FrameQuantity = "density",
+    batch_size: int = 16,
+) -> np.memmap:
+    """
+    Render superposition at each time into a (len(times), *shape) .npy stack at path.
+    Only batch_size frames are held in memory at once. Returns the memory-mapped stack.
+    """
+    _check_quantity(quantity)
+    if batch_size <= 0:
+        raise ValueError("batch_size must be a positive integer.")
+
+    path = Path(path)
+    times = np.asarray(times, dtype=float).ravel()
+    dtype = superposition.dtype if quantity == "psi" else superposition.stack.real.dtype
+
+    frames = np.lib.format.open_memmap(
+        path, mode="w+", dtype=dtype, shape=(len(times),) + superposition.shape
+    )
+    for start in range(0, len(times), batch_size):
+        stop = min(start + batch_size, len(times))
+        psi = superposition.evaluate(times[start:stop], out_format="complex")
+        frames[start:stop] = frame_quantity(psi, quantity)
+    frames.flush()
+
+    metadata = {
+        "quantity": quantity,
+        "states": [
+            {"n": n, "l": l, "m": m, "coefficient": [c.real, c.imag]}
+            for (n, l, m), c in zip(
+                superposition.states, superposition.coefficients.tolist()
+            )
+        ],
+        "basis": superposition.basis,
+        "hbar": superposition.hbar,
+        "times": times.tolist(),
+        "shape": list(superposition.shape),
+        "grid": superposition.grid,
+    }
+    path.with_suffix(".json").write_text(json.dumps(metadata, indent=2))
+    return frames
+
+
+def load_frames(
+    path: str | Path, mmap_mode: Literal["r", "r+", "c"] | None = "r"
+) -> tuple[np.ndarray, dict[str, Any]]:
+    """Frames written by render_frames (memory-mapped by default) and their metadata."""
+    path = Path(path)
+    frames = np.load(path, mmap_mode=mmap_mode)
+    metadata = json.loads(path.with_suffix(".json").read_text())
+    return frames, metadata
+
+
+def frame_quantity(psi: np.ndarray, quantity: FrameQuantity) -> np.ndarray:
+    """quantity of complex psi: psi itself, |psi|^2, |psi| or arg(psi)."""
+    _check_quantity(quantity)
+    if quantity == "psi":
+        return psi
+    if quantity == "phase":
+        return np.angle(psi)
+    density = psi.real * psi.real + psi.imag * psi.imag
+    return density if quantity == "density" else np.sqrt(density)
+
+
+def _check_quantity(quantity: str) -> None:
+    if quantity not in ("psi", "density", "magnitude", "phase"):
+        raise ValueError(
+            "quantity must be one of: 'psi', 'density', 'magnitude', 'phase'"
+        )
@@ -0,0 +1,165 @@
+"""
+Opt-in timing of the hot-path stages (coordinates, Laguerre, Legendre, CDF cumsum, searchsorted, ...).
+Record a block with `with instrument() as report:`, or set WAVEFUNCTION_TOOLS_INSTRUMENT=1
+(or =memory to also trace allocations) to record the whole process and print the report to
+stderr at exit. While nothing is recording, stage() returns a shared no-op context, so each
+instrumented stage costs one function call and a None check.
+"""
+
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import Iterator
+
+ENV_VAR = "WAVEFUNCTION_TOOLS_INSTRUMENT"
+
+
+class Report:
+    """
+    Per-stage call count, element count, cumulative seconds and peak bytes allocated.
+    Stages nest (e.g. laguerre inside radial_wave_function), and each stage's time and
+    bytes include its nested stages. Bytes are only traced with memory=True.
+    """
+
+    def __init__(self, memory: bool = False):
+        self.memory = memory
+        self._stages: dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, elements: int, seconds: float, nbytes: int) -> None:
+        with self._lock:
+            stats = self._stages.setdefault(name, [0, 0, 0.0, 0])
+            stats[0] += 1
+            stats[1] += elements
+            stats[2] += seconds
+            stats[3] = max(stats[3], nbytes)
+
+    def as_dict(self) -> dict[str, dict[str, float]]:
+        """Stages by decreasing time, as {name: {calls, elements, seconds, peak_bytes}}."""
+        with self._lock:
+            stages = sorted(self._stages.items(), key=lambda item: -item[1][2])
+            return {
+                name: {
+                    "calls": calls,
+                    "elements": elements,
+                    "seconds": seconds,
+                    "peak_bytes": nbytes,
+                }
+                for name, (calls, elements, seconds, nbytes) in stages
+            }
+
+    def to_json(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.as_dict(), f, indent=2)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stages.clear()
+
+    def __str__(self) -> str:
+        lines = [
+            f"{'stage':<30} {'calls':>8} {'elements':>14} {'seconds':>10} "
+            f"{'ns/element':>11} {'peak MiB':>9}"
+        ]
+        for name, stats in self.as_dict().items():
+            elements = stats["elements"]
+            per_element = (
+                f"{1e9 * stats['seconds'] / elements:.2f}" if elements else "-"
+            )
+            lines.append(
+                f"{name:<30} {stats['calls']:>8,d} {elements:>14,d} "
+                f"{stats['seconds']:>10.4f} {per_element:>11} "
+                f"{stats['peak_bytes'] / 2**20:>9.1f}"
+            )
+        return "\n".join(lines)
+
+
+class _Stage:
+    __slots__ = ("report", "name", "elements", "start")
+
+    def __init__(self, report: Report, name: str, elements: int):
+        self.report = report
+        self.name = name
+        self.elements = elements
+
+    def __enter__(self) -> None:
+        if self.report.memory and tracemalloc.is_tracing():
+            _push_memory_frame()
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc) -> None:
+        seconds = time.perf_counter() - self.start
+        nbytes = 0
+        if self.report.memory and tracemalloc.is_tracing():
+            nbytes = _pop_memory_frame()
+        self.report.record(self.name, self.elements, seconds, nbytes)
+
+
+_active: Report | None = None
+_OFF = nullcontext()
+_local = threading.local()
+
+
+def stage(name: str, elements: int = 0) -> _Stage | nullcontext:
+    """Context manager recording one call of a stage over elements points into the active report."""
+    report = _active
+    if report is None:
+        return _OFF
+    return _Stage(report, name, elements)
+
+
+@contextmanager
+def instrument(memory: bool = False) -> Iterator[Report]:
+    """
+    Record stages inside the block into a new Report (the innermost block records).
+    memory=True traces allocations with tracemalloc, which slows the stages down.
+    """
+    global _active
+    previous = _active
+    report = Report(memory)
+    started = memory and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    _active = report
+    try:
+        yield report
+    finally:
+        _active = previous
+        if started:
+            tracemalloc.stop()
+
+
+def _push_memory_frame() -> None:
+    # Fold the peak so far into the enclosing stage before resetting it for this one
+    frames = _local.__dict__.setdefault("frames", [])
+    current, peak = tracemalloc.get_traced_memory()
+    if frames:
+        frames[-1][1] = max(frames[-1][1], peak)
+    tracemalloc.reset_peak()
+    frames.append([current, current])
+
+
+def _pop_memory_frame() -> int:
+    """Bytes allocated above the stage's starting point at its peak (approximate across threads)."""
+    frames = _local.frames
+    start, peak = frames.pop()
+    peak = max(peak, tracemalloc.get_traced_memory()[1])
+    if frames:
+        frames[-1][1] = max(frames[-1][1], peak)
+    return peak - start
+
+
+def _report_at_exit(report: Report) -> None:
+    print(f"wavefunction_tools stages ({ENV_VAR}):\n{report}", file=sys.stderr)
+
+
+if os.environ.get(ENV_VAR, "0") not in ("", "0"):
+    _active = Report(memory=os.environ[ENV_VAR] == "memory")
+    if _active.memory:
+        tracemalloc.start()
+    atexit.register(_report_at_exit, _active)
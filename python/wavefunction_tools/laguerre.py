@@ -1,4 +1,5 @@
-from .utilities import alternating_sign, binomial
+from .instrument import stage
+from .utilities import alternating_sign, binomial, real_dtype, Workspace
 
 import numpy as np
 import numpy.typing as npt
@@ -36,29 +37,105 @@ def _associated_laguerre_sum_factorial(n: int, k: int, x: npt.ArrayLike) -> np.n
     return summation
 
 
-def associated_laguerre_polynomial(n: int, k: int, x: npt.ArrayLike) -> np.ndarray:
-    """Associated Laguerre L_n^k(x) using recurrence relation."""
-    x = np.asarray(x, dtype=float)
+def associated_laguerre_polynomial(
+    n: int,
+    k: int,
+    x: npt.ArrayLike,
+    out: np.ndarray | None = None,
+    workspace: Workspace | None = None,
+    dtype: npt.DTypeLike = float,
+) -> np.ndarray:
+    """
+    Associated Laguerre L_n^k(x) using recurrence relation.
+    The recurrence runs in place on out (which must not overlap x) and two workspace buffers.
+    """
+    x = np.asarray(x, dtype=real_dtype(dtype))
+    if out is None:
+        out = np.empty_like(x)
 
-    if n == 0:
-        return np.ones_like(x)
-    if n == 1:
-        return 1 + k - x
+    with stage("laguerre", x.size):
+        if n == 0:
+            out[...] = 1.0
+            return out
+        if n == 1:
+            np.subtract(1 + k, x, out=out)
+            return out
 
-    L_n_minus_2 = np.ones_like(x)
-    L_n_minus_1 = 1 + k - x
+        # Buffers alternate each step, so start out where the final step lands
+        workspace = Workspace() if workspace is None else workspace
+        scratch = workspace.get("laguerre.L", x.shape, x.dtype)
+        term = workspace.get("laguerre.term", x.shape, x.dtype)
+        L_n_minus_2, L_n_minus_1 = (
+            (out, scratch) if (n - 1) % 2 == 1 else (scratch, out)
+        )
 
-    L_n = np.zeros_like(x)
-    for current_n in range(2, n + 1):
-        L_n = (
-            (2 * current_n - 1 + k - x) * L_n_minus_1
-            - (current_n + k - 1) * L_n_minus_2
-        ) / (current_n)
-        L_n_minus_2 = L_n_minus_1
-        L_n_minus_1 = L_n
-    return L_n
+        L_n_minus_2[...] = 1.0
+        np.subtract(1 + k, x, out=L_n_minus_1)
 
+        for current_n in range(2, n + 1):
+            # L_n = ((2n - 1 + k - x) L_{n-1} - (n + k - 1) L_{n-2}) / n, written over L_{n-2}
+            np.subtract(2 * current_n - 1 + k, x, out=term)
+            term *= L_n_minus_1
+            L_n_minus_2 *= current_n + k - 1
+            np.subtract(term, L_n_minus_2, out=L_n_minus_2)
+            L_n_minus_2 /= current_n
+            L_n_minus_2, L_n_minus_1 = L_n_minus_1, L_n_minus_2
+        return L_n_minus_1
 
-def laguerre_derivative(n: int, k: int, x: npt.ArrayLike) -> np.ndarray:
-    x = np.asarray(x, dtype=float)
-    return -associated_laguerre_polynomial(n - 1, k + 1, x)
+
+def scaled_laguerre_polynomial(
+    n: int,
+    k: int,
+    x: npt.ArrayLike,
+    out: np.ndarray | None = None,
+    workspace: Workspace | None = None,
+    dtype: npt.DTypeLike = float,
+    seed: npt.ArrayLike = 1.0,
+) -> np.ndarray:
+    """
+    Scaled associated Laguerre seed * L_n^k(x) / sqrt(C(n + k, n)), by the recurrence for the
+    scaled terms, so no binomials are formed and |L_n^k| / sqrt(C(n + k, n)) stays below
+    sqrt(C(n + k, n)) e^{x/2} for large n and k. A decaying seed (e.g. part of e^{-x/2})
+    keeps every intermediate term in range. Runs in place like associated_laguerre_polynomial.
+    """
+    x = np.asarray(x, dtype=real_dtype(dtype))
+    if out is None:
+        out = np.empty_like(x)
+
+    with stage("laguerre", x.size):
+        if n == 0:
+            out[...] = seed
+            return out
+
+        # Buffers alternate each step, so start out where the final step lands
+        workspace = Workspace() if workspace is None else workspace
+        scratch = workspace.get("laguerre.L", x.shape, x.dtype)
+        term = workspace.get("laguerre.term", x.shape, x.dtype)
+        M_n_minus_2, M_n_minus_1 = (
+            (out, scratch) if (n - 1) % 2 == 1 else (scratch, out)
+        )
+
+        M_n_minus_2[...] = seed
+        np.subtract(1 + k, x, out=M_n_minus_1)
+        M_n_minus_1 *= M_n_minus_2
+        M_n_minus_1 /= np.sqrt(1 + k)
+
+        for current_n in range(2, n + 1):
+            # M_n = (2n - 1 + k - x) / sqrt(n (n + k)) M_{n-1}
+            #       - sqrt((n - 1)(n + k - 1) / (n (n + k))) M_{n-2}, written over M_{n-2}
+            np.subtract(2 * current_n - 1 + k, x, out=term)
+            term *= M_n_minus_1
+            term /= np.sqrt(current_n * (current_n + k))
+            M_n_minus_2 *= np.sqrt(
+                (current_n - 1) * (current_n + k - 1) / (current_n * (current_n + k))
+            )
+            np.subtract(term, M_n_minus_2, out=M_n_minus_2)
+            M_n_minus_2, M_n_minus_1 = M_n_minus_1, M_n_minus_2
+        return M_n_minus_1
+
+
+def laguerre_derivative(
+    n: int, k: int, x: npt.ArrayLike, dtype: npt.DTypeLike = float
+) -> np.ndarray:
+    x = np.asarray(x, dtype=real_dtype(dtype))
+    return -associated_laguerre_polynomial(n - 1, k + 1, x, dtype=x.dtype)
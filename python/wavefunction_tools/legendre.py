@@ -1,58 +1,215 @@
 from .utilities import condon_shortley_phase_factor as cspf, factorial_ratio
-from .utilities import binomial
+from .utilities import binomial, real_dtype, Workspace
+from .instrument import stage
 
 import numpy as np
 import numpy.typing as npt
-from math import factorial
+from math import exp, factorial, lgamma, log, pi
 
 
-def double_factorial(n: int) -> int:
-    """Compute n!! for integer n."""
+def double_factorial(n: int) -> float:
+    """Compute n!! for integer n, as a float (inf once it exceeds the float range)."""
     if n <= 0:
-        return 1
-    product = 1
+        return 1.0
+    product = 1.0
     for k in range(n, 0, -2):
         product *= k
     return product
 
 
-def associated_legendre_polynomial(l: int, m: int, x: npt.ArrayLike) -> np.ndarray:
+def associated_legendre_polynomial(
+    l: int,
+    m: int,
+    x: npt.ArrayLike,
+    out: np.ndarray | None = None,
+    workspace: Workspace | None = None,
+    dtype: npt.DTypeLike = float,
+) -> np.ndarray:
     """
     Associated Legendre polynomial P_l^m(x) of degree l and order m, using recurrence relation.
     Includes the Condon-Shortley phase factor.
+    The recurrence runs in place on out (which must not overlap x) and two workspace buffers.
     """
-    x = np.asarray(x, dtype=float)
+    x = np.asarray(x, dtype=real_dtype(dtype))
     if l < 0:
         raise ValueError("Degree l must be non-negative integer.")
+    if out is None:
+        out = np.empty_like(x)
     if abs(m) > l:
-        return np.zeros_like(x, dtype=float)
+        out[...] = 0.0
+        return out
 
     if m < 0:
         mp = -m
         sign = cspf(mp)
         factor = factorial_ratio(l - mp, l + mp)
         # factor = factorial(l - mp) / factorial(l + mp)
-        return sign * factor * associated_legendre_polynomial(l, mp, x)
-
-    P_mm = cspf(m) * double_factorial(2 * m - 1) * (1 - x**2) ** (m / 2)
-    if l == m:
-        return P_mm
-
-    P_m_plus_1_m = x * (2 * m + 1) * P_mm
-    if l == m + 1:
-        return P_m_plus_1_m
-
-    P_lm_minus_2 = P_mm
-    P_lm_minus_1 = P_m_plus_1_m
-    P_lm = np.zeros_like(x, dtype=float)
-    for current_l in range(m + 2, l + 1):
-        P_lm = (
-            x * (2 * current_l - 1) * P_lm_minus_1 - (current_l + m - 1) * P_lm_minus_2
-        ) / (current_l - m)
-        P_lm_minus_2 = P_lm_minus_1
-        P_lm_minus_1 = P_lm
-
-    return P_lm
+        associated_legendre_polynomial(
+            l, mp, x, out=out, workspace=workspace, dtype=x.dtype
+        )
+        out *= sign * factor
+        return out
+
+    with stage("legendre", x.size):
+        # Buffers alternate each step, so start out where the final step lands
+        workspace = Workspace() if workspace is None else workspace
+        scratch = workspace.get("legendre.P", x.shape, x.dtype)
+        if (l - m) % 2 == 0:
+            P_mm, P_m_plus_1_m = out, scratch
+        else:
+            P_mm, P_m_plus_1_m = scratch, out
+
+        # P_mm = (-1)^m (2m - 1)!! (1 - x^2)^(m/2)
+        np.multiply(x, x, out=P_mm)
+        np.subtract(1, P_mm, out=P_mm)
+        np.power(P_mm, m / 2, out=P_mm)
+        P_mm *= cspf(m) * double_factorial(2 * m - 1)
+        if l == m:
+            return P_mm
+
+        np.multiply(x, 2 * m + 1, out=P_m_plus_1_m)
+        P_m_plus_1_m *= P_mm
+        if l == m + 1:
+            return P_m_plus_1_m
+
+        term = workspace.get("legendre.term", x.shape, x.dtype)
+        P_lm_minus_2 = P_mm
+        P_lm_minus_1 = P_m_plus_1_m
+        for current_l in range(m + 2, l + 1):
+            # P_l = (x (2l - 1) P_{l-1} - (l + m - 1) P_{l-2}) / (l - m), written over P_{l-2}
+            np.multiply(x, 2 * current_l - 1, out=term)
+            term *= P_lm_minus_1
+            P_lm_minus_2 *= current_l + m - 1
+            np.subtract(term, P_lm_minus_2, out=P_lm_minus_2)
+            P_lm_minus_2 /= current_l - m
+            P_lm_minus_2, P_lm_minus_1 = P_lm_minus_1, P_lm_minus_2
+
+        return P_lm_minus_1
+
+
+def normalised_associated_legendre_polynomial(
+    l: int,
+    m: int,
+    x: npt.ArrayLike,
+    out: np.ndarray | None = None,
+    workspace: Workspace | None = None,
+    dtype: npt.DTypeLike = float,
+) -> np.ndarray:
+    """
+    sqrt((2l + 1) / (4 pi) (l - m)! / (l + m)!) P_l^m(x), the theta part of Y_l^m
+    (Condon-Shortley phase included). The recurrence runs on the normalised terms, which stay
+    O(sqrt(l)), so it is accurate for l in the hundreds where P_l^m itself overflows.
+    Runs in place like associated_legendre_polynomial.
+    """
+    x = np.asarray(x, dtype=real_dtype(dtype))
+    if l < 0:
+        raise ValueError("Degree l must be non-negative integer.")
+    if out is None:
+        out = np.empty_like(x)
+    if abs(m) > l:
+        out[...] = 0.0
+        return out
+
+    mp = abs(m)
+    with stage("legendre", x.size):
+        workspace = Workspace() if workspace is None else workspace
+        scratch = workspace.get("legendre.P", x.shape, x.dtype)
+        if (l - mp) % 2 == 0:
+            P_mm, P_m_plus_1_m = out, scratch
+        else:
+            P_mm, P_m_plus_1_m = scratch, out
+
+        # P_mm = (-1)^m sqrt((2m + 1) / (4 pi) (2m - 1)!! / (2m)!!) (1 - x^2)^(m/2),
+        # with (2m - 1)!! / (2m)!! = Gamma(m + 1/2) / (sqrt(pi) m!)
+        seed = (
+            exp(
+                0.5 * (log((2 * mp + 1) / (4 * pi)) + lgamma(mp + 0.5) - lgamma(mp + 1))
+            )
+            / pi**0.25
+        )
+        np.multiply(x, x, out=P_mm)
+        np.subtract(1, P_mm, out=P_mm)
+        np.power(P_mm, mp / 2, out=P_mm)
+        # The normalised P_l^{-m} is (-1)^m times P_l^m, cancelling the Condon-Shortley phase
+        P_mm *= seed if m < 0 else cspf(mp) * seed
+        if l == mp:
+            return P_mm
+
+        np.multiply(x, np.sqrt(2 * mp + 3), out=P_m_plus_1_m)
+        P_m_plus_1_m *= P_mm
+        if l == mp + 1:
+            return P_m_plus_1_m
+
+        term = workspace.get("legendre.term", x.shape, x.dtype)
+        P_lm_minus_2 = P_mm
+        P_lm_minus_1 = P_m_plus_1_m
+        for current_l in range(mp + 2, l + 1):
+            # P_l = a x P_{l-1} - b P_{l-2}, written over P_{l-2}, with
+            # a = sqrt((4l^2 - 1) / (l^2 - m^2)) and
+            # b = sqrt((2l + 1) ((l - 1)^2 - m^2) / ((2l - 3) (l^2 - m^2)))
+            l2_m2 = current_l**2 - mp**2
+            a = np.sqrt((4 * current_l**2 - 1) / l2_m2)
+            b = np.sqrt(
+                (2 * current_l + 1)
+                * ((current_l - 1) ** 2 - mp**2)
+                / ((2 * current_l - 3) * l2_m2)
+            )
+            np.multiply(x, a, out=term)
+            term *= P_lm_minus_1
+            P_lm_minus_2 *= b
+            np.subtract(term, P_lm_minus_2, out=P_lm_minus_2)
+            P_lm_minus_2, P_lm_minus_1 = P_lm_minus_1, P_lm_minus_2
+
+        return P_lm_minus_1
+
+
+def lm_index(l: int, m: int) -> int:
+    """Row of (l, m) in a triangular table ordered by l, then m from -l to l."""
+    return l * (l + 1) + m
+
+
+def associated_legendre_table(
+    l_max: int, x: npt.ArrayLike, dtype: npt.DTypeLike = float
+) -> np.ndarray:
+    """
+    All associated Legendre polynomials P_l^m(x) for 0 <= l <= l_max and |m| <= l, in one recurrence sweep.
+    Returns an array of shape ((l_max + 1)^2, *x.shape), indexed by lm_index(l, m).
+    Includes the Condon-Shortley phase factor.
+    """
+    x = np.asarray(x, dtype=real_dtype(dtype))
+    if l_max < 0:
+        raise ValueError("Degree l_max must be non-negative integer.")
+
+    table = np.empty(((l_max + 1) ** 2,) + x.shape, dtype=x.dtype)
+    sqrt_one_minus_x2 = np.sqrt(1 - x**2)
+
+    # P_m^m seeded from P_{m-1}^{m-1}, so the seed is computed once for all m
+    P_mm = np.ones_like(x)
+    for m in range(0, l_max + 1):
+        if m > 0:
+            P_mm = -(2 * m - 1) * sqrt_one_minus_x2 * P_mm
+        table[lm_index(m, m)] = P_mm
+
+        if m < l_max:
+            table[lm_index(m + 1, m)] = x * (2 * m + 1) * P_mm
+
+        for current_l in range(m + 2, l_max + 1):
+            table[lm_index(current_l, m)] = (
+                x * (2 * current_l - 1) * table[lm_index(current_l - 1, m)]
+                - (current_l + m - 1) * table[lm_index(current_l - 2, m)]
+            ) / (current_l - m)
+
+        # Negative m extension
+        if m > 0:
+            for current_l in range(m, l_max + 1):
+                factor = cspf(m) * factorial_ratio(current_l - m, current_l + m)
+                np.multiply(
+                    table[lm_index(current_l, m)],
+                    factor,
+                    out=table[lm_index(current_l, -m), ...],
+                )
+
+    return table
 
 
 def _associated_legendre_sum(l: int, m: int, x: npt.ArrayLike) -> np.ndarray:
@@ -0,0 +1,106 @@
+"""
+Process-pool sampling with independent random streams.
+Work is split into fixed-size chunks, each with its own child SeedSequence, so results for a
+given seed depend on chunk_size but never on the number of workers.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable
+
+import numpy as np
+
+from .sample import sample_orbital
+from .sample_plane import sample_orbital_plane
+from .wavefunction import radial_axis
+
+
+def parallel_sample_orbital(
+    n: int,
+    l: int,
+    m: int,
+    num_samples: int,
+    seed: int | np.random.SeedSequence | None = None,
+    workers: int | None = None,
+    chunk_size: int = 1_000_000,
+    **kwargs: Any,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, tuple[np.ndarray, np.ndarray]]:
+    """sample_orbital across a process pool; kwargs are forwarded to sample_orbital."""
+    if kwargs.get("r_max") is None:
+        kwargs["r_max"] = radial_axis(n, l)
+
+    chunks = _run_chunks(
+        sample_orbital, (n, l, m), num_samples, seed, workers, chunk_size, kwargs
+    )
+    r, theta, phi, psi = zip(*chunks)
+    re, im = zip(*psi)
+    return (
+        np.concatenate(r),
+        np.concatenate(theta),
+        np.concatenate(phi),
+        (np.concatenate(re), np.concatenate(im)),
+    )
+
+
+def parallel_sample_orbital_plane(
+    n: int,
+    l: int,
+    m: int,
+    num_samples: int,
+    seed: int | np.random.SeedSequence | None = None,
+    workers: int | None = None,
+    chunk_size: int = 1_000_000,
+    **kwargs: Any,
+) -> tuple[np.ndarray, np.ndarray, tuple[np.ndarray, np.ndarray]]:
+    """sample_orbital_plane across a process pool; kwargs are forwarded to sample_orbital_plane."""
+    if kwargs.get("axis_limit") is None:
+        kwargs["axis_limit"] = radial_axis(n, l)
+
+    chunks = _run_chunks(
+        sample_orbital_plane, (n, l, m), num_samples, seed, workers, chunk_size, kwargs
+    )
+    u, v, psi = zip(*chunks)
+    re, im = zip(*psi)
+    return (
+        np.concatenate(u),
+        np.concatenate(v),
+        (np.concatenate(re), np.concatenate(im)),
+    )
+
+
+def _run_chunks(
+    sampler: Callable,
+    quantum_numbers: tuple[int, int, int],
+    num_samples: int,
+    seed: int | np.random.SeedSequence | None,
+    workers: int | None,
+    chunk_size: int,
+    kwargs: dict[str, Any],
+) -> list:
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer.")
+    if "rng" in kwargs:
+        raise TypeError("Pass seed instead of rng; each chunk gets its own stream.")
+
+    seed_sequence = (
+        seed
+        if isinstance(seed, np.random.SeedSequence)
+        else np.random.SeedSequence(seed)
+    )
+    counts = [
+        min(chunk_size, num_samples - start)
+        for start in range(0, max(num_samples, 1), chunk_size)
+    ]
+    jobs = [
+        (sampler, quantum_numbers, count, child, kwargs)
+        for count, child in zip(counts, seed_sequence.spawn(len(counts)))
+    ]
+
+    if workers == 1 or len(jobs) == 1:
+        return [_run_chunk(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_run_chunk, jobs))
+
+
+def _run_chunk(job: tuple) -> tuple:
+    sampler, (n, l, m), count, seed_sequence, kwargs = job
+    return sampler(n, l, m, num_samples=count, rng=seed_sequence, **kwargs)
@@ -0,0 +1,162 @@
+"""
+Tabulated radial wave function: a piecewise polynomial fit of R_{nl} on [0, r_max].
+Evaluating the table costs a segment lookup and a short Horner sum per point,
+independent of n, instead of the full Laguerre recurrence and an exp.
+"""
+
+import numpy as np
+import numpy.typing as npt
+from functools import lru_cache
+
+from .instrument import stage
+from .radial_wave_function import (
+    radial_wave_function,
+    inverse_radial_cumulative_distribution,
+)
+from .utilities import Workspace
+
+
+class RadialTable:
+    """
+    Piecewise polynomial fit of R_{nl}(r) on [0, r_max] in equal-width segments,
+    interpolating at Chebyshev nodes and stored in a local power basis for Horner evaluation.
+    Segments are doubled until the table, checked at 4 degree + 5 points per segment, is
+    within tol * max|R| there; max_error is that measured error, not a proven bound between
+    the check points. Radii beyond r_max are evaluated exactly.
+    """
+
+    def __init__(
+        self,
+        n: int,
+        l: int,
+        r_max: float,
+        tol: float = 1e-10,
+        degree: int = 5,
+        max_segments: int = 1 << 18,
+    ):
+        if r_max <= 0.0:
+            raise ValueError("r_max must be positive.")
+        if degree < 1:
+            raise ValueError("degree must be a positive integer.")
+
+        self.n = n
+        self.l = l
+        self.r_max = float(r_max)
+        self.degree = degree
+
+        self.segments = max(16 * n, 64)
+        while True:
+            # Stored as (degree + 1, segments) so each Horner step gathers from one row
+            self.coefficients = _fit(n, l, self.r_max, self.segments, degree)
+            error, scale = self._check()
+            if error <= tol * scale or self.segments >= max_segments:
+                break
+            self.segments *= 2
+
+        if error > tol * scale:
+            raise ValueError(
+                f"Could not reach tol={tol} with {max_segments} segments of degree {degree}."
+            )
+        self.coefficients.flags.writeable = False
+        self.max_error = error
+
+    @property
+    def nbytes(self) -> int:
+        return self.coefficients.nbytes
+
+    def __call__(
+        self,
+        r: npt.ArrayLike,
+        out: np.ndarray | None = None,
+        workspace: Workspace | None = None,
+    ) -> np.ndarray:
+        """R_{nl}(r) from the table, in r's floating dtype (computed in float64)."""
+        r = np.asarray(r)
+        if r.dtype.kind != "f":
+            r = r.astype(float)
+        if out is None:
+            out = np.empty_like(r)
+
+        with stage("radial_table", r.size):
+            workspace = Workspace() if workspace is None else workspace
+            u = workspace.get("radial_table.u", r.shape)
+            index = workspace.get("radial_table.index", r.shape, np.intp)
+            result = workspace.get("radial_table.result", r.shape)
+            row = workspace.get("radial_table.row", r.shape)
+
+            # r / width splits into a segment index and u in [0, 1] within it
+            np.multiply(r, self.segments / self.r_max, out=u)
+            np.floor(u, out=result)
+            np.clip(result, 0, self.segments - 1, out=result)
+            index[...] = result
+            u -= result
+
+            # Horner: R = (...(c_d u + c_{d-1}) u + ...) u + c_0
+            np.take(self.coefficients[self.degree], index, out=result)
+            for k in range(self.degree - 1, -1, -1):
+                result *= u
+                np.take(self.coefficients[k], index, out=row)
+                result += row
+            out[...] = result
+
+            beyond = r > self.r_max
+            if np.any(beyond):
+                out[beyond] = radial_wave_function(self.n, self.l, r[beyond])
+            return out
+
+    def _check(self) -> tuple[float, float]:
+        """Max table error on a grid between the nodes, and max|R| on that grid."""
+        u = np.linspace(0.0, 1.0, 4 * self.degree + 5)
+        width = self.r_max / self.segments
+        r = width * (np.arange(self.segments)[:, None] + u)
+        r[-1, -1] = self.r_max  # Guard the last point against rounding past r_max
+
+        exact = radial_wave_function(self.n, self.l, r)
+        return float(np.abs(self(r) - exact).max()), float(np.abs(exact).max())
+
+
+def radial_table(
+    n: int,
+    l: int,
+    r_max: float | None = None,
+    tol: float = 1e-10,
+    degree: int = 5,
+) -> RadialTable:
+    """
+    Memoized RadialTable for (n, l). r_max defaults to the radius enclosing all but 1e-10
+    of the probability, so only far-tail points fall back to exact evaluation.
+    """
+    r_max = None if r_max is None else float(r_max)
+    return _radial_table(n, l, r_max, float(tol), degree)
+
+
+@lru_cache(maxsize=64)
+def _radial_table(
+    n: int, l: int, r_max: float | None, tol: float, degree: int
+) -> RadialTable:
+    if r_max is None:
+        r_max = float(inverse_radial_cumulative_distribution(n, l, 1.0 - 1e-10))
+    return RadialTable(n, l, r_max, tol=tol, degree=degree)
+
+
+def _fit(n: int, l: int, r_max: float, segments: int, degree: int) -> np.ndarray:
+    """Power-basis coefficients in u in [0, 1] of shape (degree + 1, segments)."""
+    k = np.arange(degree + 1)
+    nodes = 0.5 * (np.cos(np.pi * (k + 0.5) / (degree + 1)) + 1.0)  # u in (0, 1)
+
+    width = r_max / segments
+    values = radial_wave_function(n, l, width * (np.arange(segments)[:, None] + nodes))
+
+    # Chebyshev coefficients c_j = (2 - [j == 0]) / (degree + 1) * sum_k f(u_k) T_j(2u_k - 1)
+    chebyshev = np.cos(np.pi * np.outer(k, k + 0.5) / (degree + 1))
+    coefficients = values @ chebyshev.T * (2.0 / (degree + 1))
+    coefficients[:, 0] *= 0.5
+
+    # Column j holds the power-basis coefficients of T_j(2u - 1)
+    to_power = np.zeros((degree + 1, degree + 1))
+    for j in k:
+        power = np.polynomial.Chebyshev.basis(j, domain=[0.0, 1.0]).convert(
+            kind=np.polynomial.Polynomial
+        )
+        to_power[: len(power.coef), j] = power.coef
+    return np.ascontiguousarray(to_power @ coefficients.T)
@@ -1,36 +1,272 @@
-from .utilities import factorial_ratio, a0, Z
-from .laguerre import associated_laguerre_polynomial
+from .utilities import binomial, alternating_sign, a0, Z
+from .utilities import invert_monotone, real_dtype, Workspace
+from .laguerre import scaled_laguerre_polynomial
+from .instrument import stage
 
 import numpy as np
 import numpy.typing as npt
+from functools import lru_cache
+from math import factorial, lgamma, log
 
 
-def radial_wave_function(n: int, l: int, r: npt.ArrayLike) -> np.ndarray:
-    """Radial wave function R_{nl}(r)"""
-    r = np.asarray(r, dtype=float)
+def radial_wave_function(
+    n: int,
+    l: int,
+    r: npt.ArrayLike,
+    out: np.ndarray | None = None,
+    workspace: Workspace | None = None,
+    dtype: npt.DTypeLike = float,
+) -> np.ndarray:
+    """
+    Radial wave function R_{nl}(r)
+    Computed in place on out (which must not overlap r) and workspace buffers.
+    """
+    r = np.asarray(r, dtype=real_dtype(dtype))
 
     if n <= 0:
         raise ValueError("n must be a non-negative integer.")
     if l < 0 or l >= n:
         raise ValueError("Require 0 <= l <= n-1.")
 
-    root_term1 = ((2 * Z) / (n * a0)) ** 3
-    root_term2 = factorial_ratio(n - l - 1, n + l) / (2 * n)
-    # rootTerm2 = factorial(n - l - 1) / (2 * n * factorial(n + l))
-    normalisation = np.sqrt(root_term1 * root_term2)
+    if out is None:
+        out = np.empty_like(r)
 
-    rho = (2 * Z * r) / (n * a0)
-    exponential = np.exp(-rho / 2.0)
-    laguerre = associated_laguerre_polynomial(n - l - 1, 2 * l + 1, rho)
+    with stage("radial_wave_function", r.size):
+        # R = N e^{-rho/2} rho^l L_{n-l-1}^{2l+1}(rho), with N sqrt(C(n + l, n - l - 1))
+        # = sqrt((2Z / (n a0))^3 / (2n (2l + 1)!)) moved onto the scaled Laguerre term
+        log_normalisation = 0.5 * (
+            3 * log(2 * Z / (n * a0)) - log(2 * n) - lgamma(2 * l + 2)
+        )
+
+        workspace = Workspace() if workspace is None else workspace
+        rho = workspace.get("radial.rho", r.shape, r.dtype)
+        weight = workspace.get("radial.term", r.shape, r.dtype)
 
-    return normalisation * exponential * rho**l * laguerre
+        # rho = 2Zr / (n a0)
+        np.multiply(r, 2 * Z, out=rho)
+        rho /= n * a0
 
+        # sqrt of the weight N' e^{-rho/2} rho^l, from log space so neither factor over- or
+        # underflows on its own; half seeds the recurrence and half scales the result
+        if l > 0:
+            with np.errstate(divide="ignore"):
+                np.log(rho, out=weight)
+            weight *= l
+        else:
+            weight[...] = 0.0
+        np.multiply(rho, -0.5, out=out)
+        weight += out
+        weight += log_normalisation
+        weight *= 0.5
+        np.exp(weight, out=weight)
 
-def radial_distribution(n: int, l: int, r: npt.ArrayLike) -> np.ndarray:
+        R = scaled_laguerre_polynomial(
+            n - l - 1,
+            2 * l + 1,
+            rho,
+            out=out,
+            workspace=workspace,
+            dtype=r.dtype,
+            seed=weight,
+        )
+        R *= weight
+        return R
+
+
+def radial_distribution(
+    n: int,
+    l: int,
+    r: npt.ArrayLike,
+    out: np.ndarray | None = None,
+    workspace: Workspace | None = None,
+    dtype: npt.DTypeLike = float,
+) -> np.ndarray:
     """Radial probability density P_{nl}(r) assuming ∫|Y_l^m|^2 dΩ = 1"""
-    r = np.asarray(r, dtype=float)
-    R = radial_wave_function(n, l, r)
-    return (r**2) * (R**2)
+    r = np.asarray(r, dtype=real_dtype(dtype))
+    workspace = Workspace() if workspace is None else workspace
+    P = radial_wave_function(n, l, r, out=out, workspace=workspace, dtype=r.dtype)
+
+    # P = r^2 R^2
+    np.multiply(P, P, out=P)
+    term = workspace.get("radial.term", r.shape, r.dtype)
+    np.multiply(r, r, out=term)
+    P *= term
+    return P
 
     # If spherical harmonics are normalised so ∫|Y_l^m|^2 dΩ = 4π
     # return 4 * np.pi * (r**2) * (R**2)
+
+
+def radial_cumulative_distribution(n: int, l: int, r: npt.ArrayLike) -> np.ndarray:
+    """
+    Radial CDF: the probability of finding the electron within radius r.
+    Closed form for n <= 4; above that a cached piecewise degree-9 polynomial table
+    (_RadialCDFTable, 640 segments at n = 5 to 6880 at n = 200), good to ~1e-13.
+    """
+    r = np.asarray(r, dtype=float)
+    rho = (2 * Z * r) / (n * a0)
+    return _radial_cdf_rho(n, l, rho)
+
+
+def inverse_radial_cumulative_distribution(
+    n: int, l: int, u: npt.ArrayLike
+) -> np.ndarray:
+    """Radius r at which the radial CDF equals u in [0, 1), by safeguarded Newton iteration."""
+    u = np.asarray(u, dtype=float)
+    if np.any((u < 0.0) | (u >= 1.0)):
+        raise ValueError("Require 0 <= u < 1.")
+
+    # Grow the bracket from the expectation value <rho> until it encloses max(u)
+    rho_hi = (3 * n * n - l * (l + 1)) / n
+    u_max = float(u.max(initial=0.0))
+    while float(_radial_cdf_rho(n, l, rho_hi)) <= u_max:
+        rho_hi *= 2.0
+
+    rho = invert_monotone(
+        lambda x: _radial_cdf_rho(n, l, x),
+        lambda x: _radial_pdf_rho(n, l, x),
+        u,
+        0.0,
+        rho_hi,
+    )
+    return (n * a0 * rho) / (2 * Z)
+
+
+@lru_cache(maxsize=None)
+def _radial_cdf_coefficients(n: int, l: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Polynomial coefficients (ascending) for the radial density and CDF in rho = 2Zr/(n a0):
+    pdf(rho) = e^{-rho} sum_j c_j rho^j and CDF(rho) = 1 - e^{-rho} sum_k q_k rho^k.
+    Uses int_0^x rho^j e^{-rho} drho = j! (1 - e^{-x} sum_{k<=j} x^k/k!).
+    """
+    if n <= 0:
+        raise ValueError("n must be a non-negative integer.")
+    if l < 0 or l >= n:
+        raise ValueError("Require 0 <= l <= n-1.")
+
+    k, alpha = n - l - 1, 2 * l + 1
+    laguerre = np.array(
+        [
+            alternating_sign(i) * binomial(k + alpha, k - i) / factorial(i)
+            for i in range(0, k + 1)
+        ]
+    )
+    c = np.concatenate(
+        (np.zeros(2 * l + 2), np.polynomial.polynomial.polymul(laguerre, laguerre))
+    )
+
+    j_factorial = np.array([float(factorial(j)) for j in range(len(c))])
+    moments = c * j_factorial
+    c /= moments.sum()
+    moments /= moments.sum()
+
+    q = np.cumsum(moments[::-1])[::-1] / j_factorial
+    q.flags.writeable = False
+    c.flags.writeable = False
+    return c, q
+
+
+def _radial_cdf_rho(n: int, l: int, rho: npt.ArrayLike) -> np.ndarray:
+    rho = np.asarray(rho, dtype=float)
+    if n > _CLOSED_FORM_MAX_N:
+        return _radial_cdf_table(n, l).cdf(rho)
+
+    _c, q = _radial_cdf_coefficients(n, l)
+    with np.errstate(invalid="ignore"):
+        survival = np.exp(-rho) * np.polynomial.polynomial.polyval(rho, q)
+    return 1.0 - np.where(np.isposinf(rho), 0.0, survival)
+
+
+def _radial_pdf_rho(n: int, l: int, rho: npt.ArrayLike) -> np.ndarray:
+    rho = np.asarray(rho, dtype=float)
+    if n > _CLOSED_FORM_MAX_N:
+        return _radial_cdf_table(n, l).pdf(rho)
+
+    c, _q = _radial_cdf_coefficients(n, l)
+    return np.exp(-rho) * np.polynomial.polynomial.polyval(rho, c)
+
+
+# The closed-form coefficients alternate in sign and cancel as n grows: the CDF is good to
+# 2e-15 up to n = 4, then 1e-13 at n = 5, 4e-8 at n = 11 and 0.1 at n = 18 (7.4 at
+# (25, 2)). Larger n integrate the stable radial_distribution instead (_RadialCDFTable)
+_CLOSED_FORM_MAX_N = 4
+
+
+class _RadialCDFTable:
+    """
+    Radial density as a piecewise polynomial in s = sqrt(rho) on [0, rho_max], integrated
+    exactly per segment, so the CDF and its derivative agree for Newton inversion at any n.
+    The density oscillates with phase ~ sqrt(n rho), so equal steps in s resolve the fast inner
+    oscillations of large n as well as the tail. The density beyond rho_max = 4n + 60 is below
+    e^{-60} of its peak and is treated as zero.
+    """
+
+    def __init__(self, n: int, l: int, degree: int = 9, width: float = 0.25):
+        self.rho_max = 4.0 * n + 60.0
+        # Steps in rho grow like 2 s ds, so the last segment spans at most width in rho
+        self.segments = int(np.ceil(2.0 * self.rho_max / width))
+        self.width = np.sqrt(self.rho_max) / self.segments
+
+        # Interpolate g(s) = 2s pdf(s^2) at Chebyshev nodes in t in (-1, 1), where the power
+        # basis is well conditioned, with s = width * (segment + (t + 1) / 2)
+        k = np.arange(degree + 1)
+        nodes = np.cos(np.pi * (k + 0.5) / (degree + 1))
+        s = self.width * (np.arange(self.segments)[:, None] + 0.5 * (nodes + 1.0))
+        r = n * a0 * s**2 / (2 * Z)
+        g = 2.0 * s * radial_distribution(n, l, r) * (n * a0 / (2 * Z))
+        self.pdf_coefficients = np.linalg.solve(np.vander(nodes, increasing=True), g.T)
+
+        # Antiderivative in t, sum_k a_k t^{k+1} / (k + 1) times width / 2; its value at
+        # t = -1 moves into the cumulative mass before each segment
+        self.cdf_coefficients = np.zeros((degree + 2, self.segments))
+        self.cdf_coefficients[1:] = self.pdf_coefficients / (k[:, None] + 1.0)
+        self.cdf_coefficients *= 0.5 * self.width
+        start = _horner(self.cdf_coefficients, slice(None), -1.0)
+        end = _horner(self.cdf_coefficients, slice(None), 1.0)
+        self.offsets = np.concatenate(([0.0], np.cumsum(end - start)[:-1])) - start
+
+        # Renormalise away the (tiny) fit and truncation error
+        total = float(np.sum(end - start))
+        self.pdf_coefficients /= total
+        self.cdf_coefficients /= total
+        self.offsets /= total
+
+    def cdf(self, rho: np.ndarray) -> np.ndarray:
+        index, t, _s = self._locate(rho)
+        value = self.offsets[index] + _horner(self.cdf_coefficients, index, t)
+        value = np.clip(value, 0.0, 1.0)  # Rounding leaves ~1e-30 below 0 at the origin
+        return np.where(rho >= self.rho_max, 1.0, value)
+
+    def pdf(self, rho: np.ndarray) -> np.ndarray:
+        """d CDF / d rho = g(s) / (2s), which vanishes at the origin for every l."""
+        index, t, s = self._locate(rho)
+        g = _horner(self.pdf_coefficients, index, t)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            value = g / (2.0 * s)
+        return np.where((rho >= self.rho_max) | (s == 0.0), 0.0, value)
+
+    def _locate(self, rho: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        s = np.sqrt(np.clip(rho, 0.0, self.rho_max))
+        position = s / self.width
+        index = np.minimum(position.astype(np.intp), self.segments - 1)
+        return index, 2.0 * (position - index) - 1.0, s
+
+
+def _horner(
+    coefficients: np.ndarray, index: np.ndarray | slice, t: npt.ArrayLike
+) -> np.ndarray:
+    """Evaluate the per-segment polynomials (rows ascending in degree) of segments index at t."""
+    result = coefficients[-1][index]
+    for row in coefficients[-2::-1]:
+        result = result * t + row[index]
+    return result
+
+
+@lru_cache(maxsize=64)
+def _radial_cdf_table(n: int, l: int) -> _RadialCDFTable:
+    return _RadialCDFTable(n, l)
+
+
+def clear_radial_cdf_cache() -> None:
+    """Drop the cached radial CDF tables (n > 4), e.g. to time a cold inversion."""
+    _radial_cdf_table.cache_clear()
@@ -2,10 +2,26 @@
 
 import numpy as np
 import numpy.typing as npt
-
-from .radial_wave_function import radial_distribution
+from typing import Iterator, Literal
+
+from .radial_wave_function import (
+    radial_distribution,
+    radial_cumulative_distribution,
+    inverse_radial_cumulative_distribution,
+)
+from .alias import Sampler, build_alias_table, sample_alias
+from .cache import table_cache
+from .instrument import stage
+from .legendre import normalised_associated_legendre_polynomial
 from .spherical_harmonic import spherical_harmonic, spherical_harmonic_real
-from .wavefunction import Basis, wavefunction, radial_axis
+from .utilities import RNGLike, invert_monotone, real_dtype
+from .wavefunction import Basis, RadialBackend, wavefunction, radial_axis
+
+
+RadialMethod = Literal["grid", "analytic"]
+AngularMethod = Literal["grid", "separable"]
+# Density within a grid cell: constant (node plus jitter) or interpolated between nodes
+Interpolation = Literal["constant", "linear"]
 
 
 def sample_orbital(
@@ -19,108 +35,641 @@ def sample_orbital(
     resolution_phi: int = 512,
     add_jitter: bool = True,
     basis: Basis = "complex",
+    radial_method: RadialMethod = "grid",
+    angular_method: AngularMethod = "grid",
+    rng: RNGLike = None,
+    dtype: npt.DTypeLike = float,
+    radial_backend: RadialBackend = "exact",
+    sampler: Sampler = "cdf",
+    interpolation: Interpolation = "constant",
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray, tuple[np.ndarray, np.ndarray]]:
-    """Inverse-transform sample - Separate radial and angular parts."""
+    """
+    Inverse-transform sample - Separate radial and angular parts.
+    radial_method="analytic" inverts the radial CDF by Newton iteration (no radial jitter).
+    Only n <= 4 is grid-free: above that the CDF is a cached table good to ~1e-13 (see
+    radial_cumulative_distribution), built once from 6,400 (n = 5) to 68,800 (n = 200)
+    radial_distribution points, more setup than the 4096-point radial grid it replaces.
+    angular_method="separable" samples theta from its 1D marginal and phi from its
+    analytic conditional (resolution_phi is unused, no phi jitter).
+    Pass a seed, SeedSequence or Generator as rng for reproducible samples.
+    dtype=np.float32 halves table and sample memory (CDFs are still accumulated in float64).
+    radial_backend is used to re-evaluate psi at the samples (see wavefunction).
+    sampler="alias" draws grid cells from cached alias tables in O(1) instead of a binary
+    search of the CDF, so the cost per sample no longer grows with the table size.
+    interpolation="linear" draws within each grid cell from the density interpolated
+    (bi)linearly between its nodes, instead of a uniform jitter about the nearest node, so
+    much coarser grids reach the same accuracy (add_jitter then has no effect).
+    """
+    rng = np.random.default_rng(rng)
+    dtype = real_dtype(dtype)
 
     if r_max is None:
         r_max = radial_axis(n, l)
 
-    # Radial PDA & CDA
-    r_grid, pda_r, cda_r = build_radial_pda_cda(n, l, r_max, resolution_r)
+    radial_table, angular_table = _build_orbital_tables(
+        n,
+        l,
+        m,
+        r_max,
+        resolution_r,
+        resolution_theta,
+        resolution_phi,
+        basis,
+        radial_method,
+        angular_method,
+        dtype,
+        sampler,
+        interpolation,
+    )
+    return _sample_orbital_chunk(
+        n,
+        l,
+        m,
+        num_samples,
+        r_max,
+        radial_table,
+        angular_table,
+        add_jitter,
+        basis,
+        rng,
+        dtype,
+        radial_backend,
+        interpolation,
+    )
+
+
+def iter_sample_orbital(
+    n: int,
+    l: int,
+    m: int,
+    num_samples: int,
+    chunk_size: int = 1_000_000,
+    r_max: float | None = None,
+    resolution_r: int = 4096,
+    resolution_theta: int = 256,
+    resolution_phi: int = 512,
+    add_jitter: bool = True,
+    basis: Basis = "complex",
+    radial_method: RadialMethod = "grid",
+    angular_method: AngularMethod = "grid",
+    rng: RNGLike = None,
+    dtype: npt.DTypeLike = float,
+    radial_backend: RadialBackend = "exact",
+    sampler: Sampler = "cdf",
+    interpolation: Interpolation = "constant",
+) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray, tuple[np.ndarray, np.ndarray]]]:
+    """
+    Streaming sample_orbital - Yield (r, theta, phi, psi) in chunks of at most chunk_size.
+    Tables are built once, so peak memory is bounded by chunk_size rather than num_samples.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer.")
+    rng = np.random.default_rng(rng)
+    dtype = real_dtype(dtype)
+
+    if r_max is None:
+        r_max = radial_axis(n, l)
 
-    # Angular PDA & CDA
-    theta_grid, phi_grid, pda_omega, cda_omega = build_angular_pda_cda(
-        l, m, resolution_theta, resolution_phi, basis
+    radial_table, angular_table = _build_orbital_tables(
+        n,
+        l,
+        m,
+        r_max,
+        resolution_r,
+        resolution_theta,
+        resolution_phi,
+        basis,
+        radial_method,
+        angular_method,
+        dtype,
+        sampler,
+        interpolation,
     )
+    for start in range(0, num_samples, chunk_size):
+        yield _sample_orbital_chunk(
+            n,
+            l,
+            m,
+            min(chunk_size, num_samples - start),
+            r_max,
+            radial_table,
+            angular_table,
+            add_jitter,
+            basis,
+            rng,
+            dtype,
+            radial_backend,
+            interpolation,
+        )
+
+
+def _build_orbital_tables(
+    n: int,
+    l: int,
+    m: int,
+    r_max: float,
+    resolution_r: int,
+    resolution_theta: int,
+    resolution_phi: int,
+    basis: Basis,
+    radial_method: RadialMethod,
+    angular_method: AngularMethod,
+    dtype: np.dtype,
+    sampler: Sampler = "cdf",
+    interpolation: Interpolation = "constant",
+) -> tuple[tuple[np.ndarray, ...] | None, tuple[np.ndarray, ...]]:
+    """
+    Build the sampling tables once: radial (r_grid, cda) or None for "analytic",
+    angular (theta_grid, cda) for "separable" or (theta_grid, phi_grid, cda) for "grid".
+    With sampler="alias" each cda is replaced by its alias table (probability, alias).
+    With interpolation="linear" each cda is over the cells between nodes instead, and the
+    node pda is appended to the table.
+    """
+    if sampler not in ("cdf", "alias"):
+        raise ValueError("sampler must be one of: 'cdf', 'alias'")
+    if interpolation not in ("constant", "linear"):
+        raise ValueError("interpolation must be one of: 'constant', 'linear'")
+    if interpolation == "linear" and min(resolution_r, resolution_theta) < 3:
+        raise ValueError("interpolation='linear' requires grid resolutions >= 3.")
+    alias = sampler == "alias"
+    linear = interpolation == "linear"
+
+    # Cached tables make repeat calls cheap, so this stage mostly times cache misses
+    with stage("sample.tables"):
+        # Radial PDA & CDA
+        if radial_method == "analytic":
+            radial_table = None
+        elif radial_method == "grid":
+            r_grid, pda_r, cda_r = build_radial_pda_cda(
+                n, l, r_max, resolution_r, dtype
+            )
+            if linear:
+                cells_r = build_radial_cell_table(
+                    n, l, r_max, resolution_r, dtype, sampler
+                )
+                radial_table = (r_grid, cells_r, pda_r)
+            else:
+                if alias:
+                    cda_r = build_radial_alias_table(n, l, r_max, resolution_r, dtype)
+                radial_table = (r_grid, cda_r)
+        else:
+            raise ValueError("radial_method must be one of: 'grid', 'analytic'")
+
+        # Angular PDA & CDA
+        if angular_method == "separable":
+            theta_grid, pda_theta, cda_theta = build_theta_pda_cda(
+                l, m, resolution_theta, dtype
+            )
+            if linear:
+                cells_theta = build_theta_cell_table(
+                    l, m, resolution_theta, dtype, sampler
+                )
+                angular_table = (theta_grid, cells_theta, pda_theta)
+            else:
+                if alias:
+                    cda_theta = build_theta_alias_table(l, m, resolution_theta, dtype)
+                angular_table = (theta_grid, cda_theta)
+        elif angular_method == "grid":
+            theta_grid, phi_grid, pda_omega, cda_omega = build_angular_pda_cda(
+                l, m, resolution_theta, resolution_phi, basis, dtype
+            )
+            if linear:
+                cells_omega = build_angular_cell_table(
+                    l, m, resolution_theta, resolution_phi, basis, dtype, sampler
+                )
+                angular_table = (theta_grid, phi_grid, cells_omega, pda_omega)
+            else:
+                if alias:
+                    cda_omega = build_angular_alias_table(
+                        l, m, resolution_theta, resolution_phi, basis, dtype
+                    )
+                angular_table = (theta_grid, phi_grid, cda_omega)
+        else:
+            raise ValueError("angular_method must be one of: 'grid', 'separable'")
+
+        return radial_table, angular_table
+
+
+def _sample_orbital_chunk(
+    n: int,
+    l: int,
+    m: int,
+    num_samples: int,
+    r_max: float,
+    radial_table: tuple[np.ndarray, ...] | None,
+    angular_table: tuple[np.ndarray, ...],
+    add_jitter: bool,
+    basis: Basis,
+    rng: np.random.Generator,
+    dtype: np.dtype,
+    radial_backend: RadialBackend,
+    interpolation: Interpolation = "constant",
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, tuple[np.ndarray, np.ndarray]]:
+    """Draw num_samples points from prebuilt tables (see _build_orbital_tables)."""
+    linear = interpolation == "linear"
 
     # Sample Radial
-    r_indices = sample_cdf(cda_r, num_samples)
-    r_samples = r_grid[r_indices]
+    if radial_table is None:
+        r_samples = sample_radial_analytic(n, l, num_samples, r_max, rng=rng)
+        r_samples = r_samples.astype(dtype, copy=False)
+    elif linear:
+        r_grid, cells_r, pda_r = radial_table
+        r_samples = _sample_linear(r_grid, pda_r, cells_r, num_samples, rng)
+        r_samples = r_samples.astype(dtype, copy=False)
+    else:
+        r_grid, cda_r = radial_table
+        r_indices = _sample_index(cda_r, num_samples, rng)
+        r_samples = r_grid[r_indices]
+
+    # Sample Angular (linear tables carry the node pda as an extra entry)
+    separable = len(angular_table) == (3 if linear else 2)
+    if separable and linear:
+        theta_grid, cells_theta, pda_theta = angular_table
+        theta_samples = _sample_linear(
+            theta_grid, pda_theta, cells_theta, num_samples, rng
+        )
+        theta_samples = theta_samples.astype(dtype, copy=False)
+        phi_samples = sample_phi(m, num_samples, basis, rng=rng)
+        phi_samples = phi_samples.astype(dtype, copy=False)
+    elif linear:
+        theta_grid, phi_grid, cells_omega, pda_omega = angular_table
+        theta_samples, phi_samples = _sample_bilinear_periodic(
+            theta_grid, phi_grid, pda_omega, cells_omega, num_samples, rng
+        )
+        theta_samples = theta_samples.astype(dtype, copy=False)
+        phi_samples = phi_samples.astype(dtype, copy=False)
+    elif separable:
+        theta_grid, cda_theta = angular_table
+        theta_samples = theta_grid[_sample_index(cda_theta, num_samples, rng)]
+        phi_samples = sample_phi(m, num_samples, basis, rng=rng)
+        phi_samples = phi_samples.astype(dtype, copy=False)
+    else:
+        theta_grid, phi_grid, cda_omega = angular_table
 
-    # Sample Angular (Unflattening index assumes row-major order)
-    omega_indices = sample_cdf(cda_omega, num_samples)
+        # Unflattening index assumes row-major order
+        omega_indices = _sample_index(cda_omega, num_samples, rng)
 
-    theta_indices = omega_indices // resolution_phi
-    phi_indices = omega_indices % resolution_phi
+        theta_indices = omega_indices // len(phi_grid)
+        phi_indices = omega_indices % len(phi_grid)
 
-    theta_samples = theta_grid[theta_indices]
-    phi_samples = phi_grid[phi_indices]
+        theta_samples = theta_grid[theta_indices]
+        phi_samples = phi_grid[phi_indices]
 
     # Add Jitter using half cell size
-    if add_jitter:
-        rng = np.random.default_rng()
+    if add_jitter and not linear:
+        if radial_table is not None:
+            dr = float(r_grid[1] - r_grid[0])
+            r_samples += (rng.random(num_samples, dtype=dtype) - 0.5) * dr
 
-        dr = float(r_grid[1] - r_grid[0])
         dtheta = float(theta_grid[1] - theta_grid[0])
-        dphi = float(phi_grid[1] - phi_grid[0])
+        theta_samples += (rng.random(num_samples, dtype=dtype) - 0.5) * dtheta
 
-        r_samples += (rng.random(num_samples) - 0.5) * dr
-        theta_samples += (rng.random(num_samples) - 0.5) * dtheta
-        phi_samples += (rng.random(num_samples) - 0.5) * dphi
+        if len(angular_table) == 3:
+            dphi = float(phi_grid[1] - phi_grid[0])
+            phi_samples += (rng.random(num_samples, dtype=dtype) - 0.5) * dphi
 
         # Clamp to valid range
-        r_samples = np.clip(r_samples, 0.0, r_max)
+        r_samples = np.clip(r_samples, 0.0, float(r_max))
         theta_samples = np.clip(theta_samples, 0.0, np.pi)
         phi_samples = np.mod(phi_samples, 2.0 * np.pi)
 
     # Re-evaluate psi at sampled points
-    psi = wavefunction(n, l, m, r_samples, theta_samples, phi_samples, basis=basis)
+    psi = wavefunction(
+        n,
+        l,
+        m,
+        r_samples,
+        theta_samples,
+        phi_samples,
+        basis=basis,
+        dtype=dtype,
+        radial_backend=radial_backend,
+    )
 
     return r_samples, theta_samples, phi_samples, psi
 
 
+@table_cache.cached
 def build_radial_pda_cda(
-    n: int, l: int, r_max: float, r_resolution: int
+    n: int, l: int, r_max: float, r_resolution: int, dtype: npt.DTypeLike = float
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     """Build radial probability density array and cumulative distribution array."""
 
     # Build grid
-    r_grid = np.linspace(0.0, r_max, r_resolution)
+    r_grid = np.linspace(0.0, r_max, r_resolution, dtype=dtype)
 
     # Compute PDA (includes r^2 factor) #? Should I discrete re-normalise?
-    pda = radial_distribution(n, l, r_grid)
+    pda = radial_distribution(n, l, r_grid, dtype=dtype)
 
     # Compute CDA
-    cda = np.cumsum(pda)
-    cda /= cda[-1]
+    cda = _normalised_cumsum(pda)
 
     return r_grid, pda, cda
 
 
+@table_cache.cached
+def build_radial_alias_table(
+    n: int, l: int, r_max: float, r_resolution: int, dtype: npt.DTypeLike = float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Alias table of the radial PDA (see build_radial_pda_cda)."""
+    _r_grid, pda, _cda = build_radial_pda_cda(n, l, r_max, r_resolution, dtype)
+    return build_alias_table(pda)
+
+
+@table_cache.cached
+def build_radial_cell_table(
+    n: int,
+    l: int,
+    r_max: float,
+    r_resolution: int,
+    dtype: npt.DTypeLike = float,
+    sampler: Sampler = "cdf",
+) -> np.ndarray | tuple[np.ndarray, np.ndarray]:
+    """
+    CDA (or alias table) of the r_resolution - 1 cells between radial grid nodes, each
+    weighted by its mass (see _cell_masses and build_radial_pda_cda).
+    """
+    _r_grid, pda, _cda = build_radial_pda_cda(n, l, r_max, r_resolution, dtype)
+    return _index_table(_cell_masses(pda), sampler)
+
+
+def sample_radial_analytic(
+    n: int,
+    l: int,
+    num_samples: int,
+    r_max: float | None = None,
+    rng: RNGLike = None,
+) -> np.ndarray:
+    """
+    Radial samples in [0, r_max] by inverting radial_cumulative_distribution: exact to
+    rounding for n <= 4, and to its ~1e-13 tabulation error above that.
+    """
+    u_max = 1.0 if r_max is None else float(radial_cumulative_distribution(n, l, r_max))
+    rng = np.random.default_rng(rng)
+    u = rng.uniform(0.0, u_max, size=num_samples)
+    u = np.minimum(u, np.nextafter(1.0, 0.0))
+    return inverse_radial_cumulative_distribution(n, l, u)
+
+
+@table_cache.cached
 def build_angular_pda_cda(
     l: int,
     m: int,
     theta_resolution: int,
     phi_resolution: int,
     basis: Basis,
+    dtype: npt.DTypeLike = float,
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """Build angular probability density array and cumulative distribution array."""
 
     # Build grids
-    theta_grid = np.linspace(0.0, np.pi, theta_resolution)  # [0, pi]
-    phi_grid = np.linspace(0.0, 2.0 * np.pi, phi_resolution, endpoint=False)  # [0, 2pi)
+    theta_grid = np.linspace(0.0, np.pi, theta_resolution, dtype=dtype)  # [0, pi]
+    phi_grid = np.linspace(
+        0.0, 2.0 * np.pi, phi_resolution, endpoint=False, dtype=dtype
+    )  # [0, 2pi)
     theta_mesh, phi_mesh = np.meshgrid(theta_grid, phi_grid, indexing="ij")
 
     # Compute PDA
     if basis == "complex":
-        Y_re, Y_im = spherical_harmonic(l, m, theta_mesh, phi_mesh)
+        Y_re, Y_im = spherical_harmonic(l, m, theta_mesh, phi_mesh, dtype=dtype)
         pda = Y_re**2 + Y_im**2
     else:
-        Y = spherical_harmonic_real(l, m, theta_mesh, phi_mesh)
+        Y = spherical_harmonic_real(l, m, theta_mesh, phi_mesh, dtype=dtype)
         pda = Y**2
 
     pda *= np.sin(theta_mesh)  # Jacobian factor
 
     # Compute CDA (flattened using row-major order)
-    cda = np.cumsum(pda.flatten())
-    cda /= cda[-1]
+    cda = _normalised_cumsum(pda.ravel())
 
     return theta_grid, phi_grid, pda, cda
 
 
-def sample_cdf(cdf: npt.ArrayLike, num_samples: int) -> np.ndarray:
+@table_cache.cached
+def build_angular_alias_table(
+    l: int,
+    m: int,
+    theta_resolution: int,
+    phi_resolution: int,
+    basis: Basis,
+    dtype: npt.DTypeLike = float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Alias table of the flattened angular PDA (see build_angular_pda_cda)."""
+    _theta_grid, _phi_grid, pda, _cda = build_angular_pda_cda(
+        l, m, theta_resolution, phi_resolution, basis, dtype
+    )
+    return build_alias_table(pda)
+
+
+@table_cache.cached
+def build_angular_cell_table(
+    l: int,
+    m: int,
+    theta_resolution: int,
+    phi_resolution: int,
+    basis: Basis,
+    dtype: npt.DTypeLike = float,
+    sampler: Sampler = "cdf",
+) -> np.ndarray | tuple[np.ndarray, np.ndarray]:
+    """
+    CDA (or alias table) of the (theta_resolution - 1) x phi_resolution cells between
+    angular grid nodes (phi wraps around), each weighted by its mass, in row-major order
+    (see _cell_masses and build_angular_pda_cda).
+    """
+    _theta_grid, _phi_grid, pda, _cda = build_angular_pda_cda(
+        l, m, theta_resolution, phi_resolution, basis, dtype
+    )
+    mass = _cell_masses(_cell_masses(pda, axis=0), axis=1, periodic=True)
+    return _index_table(mass, sampler)
+
+
+@table_cache.cached
+def build_theta_pda_cda(
+    l: int, m: int, theta_resolution: int, dtype: npt.DTypeLike = float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Build the theta marginal probability density array and cumulative distribution array.
+    |Y|^2 factorises into f(theta) g(phi) for both bases, and f(theta) ~ P_l^|m|(cos theta)^2.
+    """
+
+    # Build grid
+    theta_grid = np.linspace(0.0, np.pi, theta_resolution, dtype=dtype)  # [0, pi]
+
+    # Compute PDA (normalisation cancels in the CDA, but keeps large l in range)
+    x = np.cos(theta_grid)
+    pda = normalised_associated_legendre_polynomial(l, abs(m), x, dtype=dtype) ** 2
+    pda *= np.sin(theta_grid)  # Jacobian factor
+
+    # Compute CDA
+    cda = _normalised_cumsum(pda)
+
+    return theta_grid, pda, cda
+
+
+@table_cache.cached
+def build_theta_alias_table(
+    l: int, m: int, theta_resolution: int, dtype: npt.DTypeLike = float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Alias table of the theta marginal PDA (see build_theta_pda_cda)."""
+    _theta_grid, pda, _cda = build_theta_pda_cda(l, m, theta_resolution, dtype)
+    return build_alias_table(pda)
+
+
+@table_cache.cached
+def build_theta_cell_table(
+    l: int,
+    m: int,
+    theta_resolution: int,
+    dtype: npt.DTypeLike = float,
+    sampler: Sampler = "cdf",
+) -> np.ndarray | tuple[np.ndarray, np.ndarray]:
+    """
+    CDA (or alias table) of the theta_resolution - 1 cells between theta grid nodes, each
+    weighted by its mass (see _cell_masses and build_theta_pda_cda).
+    """
+    _theta_grid, pda, _cda = build_theta_pda_cda(l, m, theta_resolution, dtype)
+    return _index_table(_cell_masses(pda), sampler)
+
+
+def sample_phi(
+    m: int, num_samples: int, basis: Basis, rng: RNGLike = None
+) -> np.ndarray:
+    """
+    Sample phi in [0, 2pi) from its analytic conditional density.
+    Uniform for the complex basis (and m = 0), cos^2(m phi) / sin^2(|m| phi) for the real basis.
+    """
+    rng = np.random.default_rng(rng)
+    if basis == "complex" or m == 0:
+        return rng.uniform(0.0, 2.0 * np.pi, size=num_samples)
+
+    # With s = 2|m| phi (mod 2pi), cos^2(m phi) = (1 + cos s) / 2 and sin^2 shifts s by pi
+    u = rng.random(num_samples)
+    s = invert_monotone(
+        lambda x: (x + np.sin(x)) / (2.0 * np.pi),
+        lambda x: (1.0 + np.cos(x)) / (2.0 * np.pi),
+        u,
+        0.0,
+        2.0 * np.pi,
+    )
+    if m < 0:
+        s = s + np.pi
+
+    # Each of the 2|m| lobes is equally likely
+    lobe = rng.integers(0, 2 * abs(m), size=num_samples)
+    phi = (s + 2.0 * np.pi * lobe) / (2 * abs(m))
+    return np.mod(phi, 2.0 * np.pi)
+
+
+def sample_cdf(cdf: npt.ArrayLike, num_samples: int, rng: RNGLike = None) -> np.ndarray:
     """Sample from a CDF using inverse transform sampling."""
-    rng = np.random.default_rng()
-    u = rng.uniform(0.0, 1.0, size=num_samples)
-    index = np.searchsorted(cdf, u, side="left")
+    rng = np.random.default_rng(rng)
+    cdf = np.asarray(cdf)
+    # Draw u in the table's precision so searchsorted never copies a float32 CDF
+    u_dtype = np.float32 if cdf.dtype == np.float32 else np.float64
+    u = rng.random(num_samples, dtype=u_dtype)
+    with stage("sample.searchsorted", num_samples):
+        index = np.searchsorted(cdf, u, side="left")
     return np.minimum(index, len(cdf) - 1)  # Clamp
+
+
+def _sample_index(
+    table: np.ndarray | tuple[np.ndarray, np.ndarray],
+    num_samples: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Grid indices from a CDA or an alias table (probability, alias)."""
+    if isinstance(table, tuple):
+        return sample_alias(*table, num_samples, rng=rng)
+    return sample_cdf(table, num_samples, rng=rng)
+
+
+def _sample_linear(
+    grid: np.ndarray,
+    pda: np.ndarray,
+    cells: np.ndarray | tuple[np.ndarray, np.ndarray],
+    num_samples: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Samples of the density interpolated linearly between the nodes of a uniform grid."""
+    i = _sample_index(cells, num_samples, rng)
+    t = _invert_linear(rng.random(num_samples), pda[i], pda[i + 1])
+    return grid[i] + t * float(grid[1] - grid[0])
+
+
+def _sample_bilinear_periodic(
+    theta_grid: np.ndarray,
+    phi_grid: np.ndarray,
+    pda: np.ndarray,
+    cells: np.ndarray | tuple[np.ndarray, np.ndarray],
+    num_samples: int,
+    rng: np.random.Generator,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Samples of the density interpolated bilinearly between the nodes of a uniform
+    (theta, phi) grid, phi periodic: theta from the cell's linear marginal, then phi from
+    the linear conditional at that theta.
+    """
+    index = _sample_index(cells, num_samples, rng)
+    i, j = np.divmod(index, len(phi_grid))
+    j_next = j + 1
+    j_next[j_next == len(phi_grid)] = 0
+
+    p00, p01 = pda[i, j], pda[i, j_next]
+    p10, p11 = pda[i + 1, j], pda[i + 1, j_next]
+    s = _invert_linear(rng.random(num_samples), p00 + p01, p10 + p11)
+    t = _invert_linear(
+        rng.random(num_samples), p00 + s * (p10 - p00), p01 + s * (p11 - p01)
+    )
+    theta = theta_grid[i] + s * float(theta_grid[1] - theta_grid[0])
+    phi = phi_grid[j] + t * float(phi_grid[1] - phi_grid[0])
+    return theta, np.mod(phi, 2.0 * np.pi)  # The last cell ends at 2 pi
+
+
+def _invert_linear(u: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    t in [0, 1] with CDF u under the density a + (b - a) t. The rationalised root of the
+    quadratic, u (a + b) / (a + sqrt(a^2 (1 - u) + b^2 u)), is stable as b -> a.
+    """
+    denominator = a + np.sqrt(a * a * (1.0 - u) + b * b * u)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t = u * (a + b) / denominator
+    return np.where(denominator > 0.0, t, u)  # Empty cells are never drawn, but be safe
+
+
+def _cell_masses(pda: np.ndarray, axis: int = 0, periodic: bool = False) -> np.ndarray:
+    """
+    Mass (per unit spacing) of each cell between neighbouring nodes along axis: the integral
+    of the cubic through the 4 nearest nodes, (-1, 13, 13, -1) / 24, or of the quadratic
+    through 3 in the end cells. This is 4th order, whereas the trapezoid rule's 2nd order
+    error would swamp the gain from interpolating within cells.
+    """
+    p = np.moveaxis(np.asarray(pda, dtype=np.float64), axis, 0)
+    if periodic:
+        mass = 13.0 * (p + np.roll(p, -1, axis=0)) - np.roll(p, 1, axis=0)
+        mass -= np.roll(p, -2, axis=0)
+        mass /= 24.0
+    else:
+        mass = np.empty((len(p) - 1,) + p.shape[1:])
+        mass[1:-1] = (13.0 * (p[1:-2] + p[2:-1]) - p[:-3] - p[3:]) / 24.0
+        mass[0] = (5.0 * p[0] + 8.0 * p[1] - p[2]) / 12.0
+        mass[-1] = (5.0 * p[-1] + 8.0 * p[-2] - p[-3]) / 12.0
+
+    # The cubic can dip below zero next to a zero of the density
+    np.maximum(mass, 0.0, out=mass)
+    return np.moveaxis(mass, 0, axis).astype(pda.dtype, copy=False)
+
+
+def _index_table(
+    weights: np.ndarray, sampler: Sampler
+) -> np.ndarray | tuple[np.ndarray, np.ndarray]:
+    if sampler == "alias":
+        return build_alias_table(weights)
+    return _normalised_cumsum(weights.ravel())
+
+
+def _normalised_cumsum(pda: np.ndarray) -> np.ndarray:
+    """CDF of a density array, accumulated in float64 and returned in the density's dtype."""
+    with stage("sample.cumsum", pda.size):
+        cda = np.cumsum(pda, dtype=np.float64)
+        cda /= cda[-1]
+        return cda.astype(pda.dtype, copy=False)
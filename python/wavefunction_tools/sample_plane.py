@@ -1,6 +1,11 @@
 import numpy as np
 import numpy.typing as npt
 
+from .alias import Sampler, build_alias_table, sample_alias
+from .cache import table_cache
+from .instrument import stage
+from .sample import _normalised_cumsum
+from .utilities import RNGLike, real_dtype
 from .wavefunction import Plane, Basis, wavefunction_slice_cartesian, radial_axis
 
 
@@ -14,19 +19,37 @@ def sample_orbital_plane(
     axis_resolution: int = 1024,
     add_jitter: bool = True,
     basis: Basis = "complex",
+    rng: RNGLike = None,
+    dtype: npt.DTypeLike = float,
+    sampler: Sampler = "cdf",
 ) -> tuple[np.ndarray, np.ndarray, tuple[np.ndarray, np.ndarray]]:
-    """Inverse-transform sample - XY, XZ, or YZ plane."""
+    """
+    Inverse-transform sample - XY, XZ, or YZ plane.
+    dtype=np.float32 halves table and sample memory (the CDF is still accumulated in float64).
+    sampler="alias" draws grid cells from a cached alias table in O(1) instead of a binary
+    search of the axis_resolution^2 CDF.
+    """
+    rng = np.random.default_rng(rng)
+    dtype = real_dtype(dtype)
 
     if axis_limit is None:
         axis_limit = radial_axis(n, l)
 
     # Plane PDA & CDA
     u_grid, v_grid, pda, cda = build_plane_pda_cda(
-        n, l, m, plane, axis_limit, axis_resolution, basis
+        n, l, m, plane, axis_limit, axis_resolution, basis, dtype
     )
 
     # Sample Plane
-    uv_indices = sample_cdf(cda, num_samples)
+    if sampler == "alias":
+        probability, alias = build_plane_alias_table(
+            n, l, m, plane, axis_limit, axis_resolution, basis, dtype
+        )
+        uv_indices = sample_alias(probability, alias, num_samples, rng=rng)
+    elif sampler == "cdf":
+        uv_indices = sample_cdf(cda, num_samples, rng=rng)
+    else:
+        raise ValueError("sampler must be one of: 'cdf', 'alias'")
 
     u_indices = uv_indices // axis_resolution
     v_indices = uv_indices % axis_resolution
@@ -36,21 +59,21 @@ def sample_orbital_plane(
 
     # Add Jitter using half cell size
     if add_jitter:
-        rng = np.random.default_rng()
         du = u_grid[1] - u_grid[0]
         dv = v_grid[1] - v_grid[0]
-        u_samples += (rng.random(num_samples) - 0.5) * du
-        v_samples += (rng.random(num_samples) - 0.5) * dv
+        u_samples += (rng.random(num_samples, dtype=dtype) - 0.5) * du
+        v_samples += (rng.random(num_samples, dtype=dtype) - 0.5) * dv
         # Clamp?
 
     # Re-evaluate psi at sampled points
     psi = wavefunction_slice_cartesian(
-        n, l, m, plane, u_samples, v_samples, basis=basis
+        n, l, m, plane, u_samples, v_samples, basis=basis, dtype=dtype
     )
 
     return u_samples, v_samples, psi
 
 
+@table_cache.cached
 def build_plane_pda_cda(
     n: int,
     l: int,
@@ -59,6 +82,7 @@ def build_plane_pda_cda(
     axis_limit: float,
     axis_resolution: int,
     basis: Basis,
+    dtype: npt.DTypeLike = float,
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """Build plane probability density array and cumulative distribution array."""
 
@@ -66,12 +90,14 @@ def build_plane_pda_cda(
         raise ValueError("plane must be one of: 'xy', 'xz', 'yz'")
 
     # Build grid
-    u_grid = np.linspace(-axis_limit, axis_limit, axis_resolution)
-    v_grid = np.linspace(-axis_limit, axis_limit, axis_resolution)
+    u_grid = np.linspace(-axis_limit, axis_limit, axis_resolution, dtype=dtype)
+    v_grid = np.linspace(-axis_limit, axis_limit, axis_resolution, dtype=dtype)
     u_mesh, v_mesh = np.meshgrid(u_grid, v_grid, indexing="ij")
 
     # Compute PDA (no Jacobian required since plane is Cartesian) #? Should I discrete re-normalise?
-    re, im = wavefunction_slice_cartesian(n, l, m, plane, u_mesh, v_mesh, basis=basis)
+    re, im = wavefunction_slice_cartesian(
+        n, l, m, plane, u_mesh, v_mesh, basis=basis, dtype=dtype
+    )
     pda = re**2 + im**2
 
     # TODO: Revisit
@@ -82,16 +108,223 @@ def build_plane_pda_cda(
     if mass < 1e-12:
         raise ValueError("Near-zero probability density (e.g. nodal plane).")
 
-    flat = pda.ravel()
-    cda = np.cumsum(flat)
-    cda /= cda[-1]
+    # Accumulate in float64 so a float32 CDF keeps its small increments
+    cda = _normalised_cumsum(pda.ravel())
 
     return u_grid, v_grid, pda, cda
 
 
-def sample_cdf(cdf: npt.ArrayLike, num_samples: int) -> np.ndarray:
+def sample_orbital_plane_adaptive(
+    n: int,
+    l: int,
+    m: int,
+    num_samples: int = 10000,
+    plane: Plane = "xy",
+    axis_limit: float | None = None,
+    base_resolution: int = 256,
+    levels: int = 5,
+    tolerance: float = 1e-9,
+    add_jitter: bool = True,
+    basis: Basis = "complex",
+    rng: RNGLike = None,
+    dtype: npt.DTypeLike = float,
+    sampler: Sampler = "cdf",
+) -> tuple[np.ndarray, np.ndarray, tuple[np.ndarray, np.ndarray]]:
+    """
+    Inverse-transform sample - XY, XZ, or YZ plane, over the leaves of an adaptive quadtree
+    (see build_plane_quadtree) instead of a uniform grid. With the defaults, cusps reach the
+    cells of a 8192^2 grid (level 5) while smooth regions stay at the coarser levels: about
+    0.2M leaves for (1, 0, 0), 0.4M for (6, 3, 2) (no cusp, so at most level 4) and 1.3M for
+    (20, 5, 3), against 67M cells for the uniform grid.
+    """
+    rng = np.random.default_rng(rng)
+    dtype = real_dtype(dtype)
+
+    if axis_limit is None:
+        axis_limit = radial_axis(n, l)
+
+    # Leaf table (the flattened pyramid: drawing a leaf by its mass is the same as
+    # descending the levels by each child's share of its parent)
+    table = (
+        n,
+        l,
+        m,
+        plane,
+        axis_limit,
+        base_resolution,
+        levels,
+        tolerance,
+        basis,
+        dtype,
+    )
+    u_centres, v_centres, level, _pda, cda = build_plane_quadtree(*table)
+
+    # Sample Leaves
+    if sampler == "alias":
+        probability, alias = build_plane_quadtree_alias_table(*table)
+        indices = sample_alias(probability, alias, num_samples, rng=rng)
+    elif sampler == "cdf":
+        indices = sample_cdf(cda, num_samples, rng=rng)
+    else:
+        raise ValueError("sampler must be one of: 'cdf', 'alias'")
+
+    u_samples = u_centres[indices]
+    v_samples = v_centres[indices]
+
+    # Add Jitter across the whole leaf, whose width halves with each level
+    if add_jitter:
+        width = np.ldexp(2.0 * axis_limit / base_resolution, -level[indices])
+        width = width.astype(dtype, copy=False)
+        u_samples += (rng.random(num_samples, dtype=dtype) - 0.5) * width
+        v_samples += (rng.random(num_samples, dtype=dtype) - 0.5) * width
+
+    # Re-evaluate psi at sampled points
+    psi = wavefunction_slice_cartesian(
+        n, l, m, plane, u_samples, v_samples, basis=basis, dtype=dtype
+    )
+
+    return u_samples, v_samples, psi
+
+
+@table_cache.cached
+def build_plane_alias_table(
+    n: int,
+    l: int,
+    m: int,
+    plane: Plane,
+    axis_limit: float,
+    axis_resolution: int,
+    basis: Basis,
+    dtype: npt.DTypeLike = float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Alias table of the flattened plane PDA (see build_plane_pda_cda)."""
+    _u_grid, _v_grid, pda, _cda = build_plane_pda_cda(
+        n, l, m, plane, axis_limit, axis_resolution, basis, dtype
+    )
+    return build_alias_table(pda)
+
+
+@table_cache.cached
+def build_plane_quadtree(
+    n: int,
+    l: int,
+    m: int,
+    plane: Plane,
+    axis_limit: float,
+    base_resolution: int = 256,
+    levels: int = 5,
+    tolerance: float = 1e-9,
+    basis: Basis = "complex",
+    dtype: npt.DTypeLike = float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Build an adaptive plane PDA: the leaves (u, v centres, level, mass) of a quadtree over a
+    base_resolution^2 grid, and their CDA. A cell is split into 4, at most levels times, while
+    its children's masses are not explained by a plane through the cell to within
+    tolerance * total mass: the error is their twist (c00 - c01 - c10 + c11) plus the change
+    in the cell's mass from the midpoint rule to their sum. A steady slope is not detail, so
+    smooth regions stay coarse while cusps and nodes are refined to the last level. Cells
+    lighter than tolerance * total are never split. A leaf at level k is
+    2 axis_limit / (base_resolution 2^k) wide.
+    """
+
+    if plane not in ("xy", "xz", "yz"):
+        raise ValueError("plane must be one of: 'xy', 'xz', 'yz'")
+    if base_resolution <= 0 or levels < 0:
+        raise ValueError("Require base_resolution > 0 and levels >= 0.")
+    dtype = real_dtype(dtype)
+
+    def cell_masses(u: np.ndarray, v: np.ndarray, width: float) -> np.ndarray:
+        # Midpoint rule, |psi|^2 at the centre times the cell area
+        re, im = wavefunction_slice_cartesian(
+            n, l, m, plane, u.ravel(), v.ravel(), basis=basis, dtype=dtype
+        )
+        return ((re * re + im * im) * (width * width)).reshape(u.shape)
+
+    with stage("sample.tables"):
+        # Base grid, cell centred
+        width = 2.0 * axis_limit / base_resolution
+        centres = -axis_limit + (np.arange(base_resolution) + 0.5) * width
+        u, v = np.meshgrid(centres.astype(dtype), centres.astype(dtype), indexing="ij")
+        u, v = u.ravel(), v.ravel()
+        mass = cell_masses(u, v, width)
+
+        # Guard against near-zero density (e.g. nodal planes)
+        total = float(mass.sum(dtype=np.float64))
+        if total < 1e-12:
+            raise ValueError("Near-zero probability density (e.g. nodal plane).")
+        threshold = tolerance * total
+
+        leaves = []
+        for level in range(levels + 1):
+            # Light cells, and every cell at the last level, stay leaves
+            split = mass > threshold if level < levels else np.zeros(len(u), bool)
+            leaves.append((u[~split], v[~split], level, mass[~split]))
+            u, v, mass = u[split], v[split], mass[split]
+            if len(u) == 0:
+                break
+
+            # Children centred a quarter width from the parent's centre
+            offset = np.array([-0.25, 0.25], dtype=dtype) * dtype.type(width)
+            child_u = u[:, None] + np.repeat(offset, 2)
+            child_v = v[:, None] + np.tile(offset, 2)
+            child_mass = cell_masses(child_u, child_v, 0.5 * width)
+
+            # Smooth cells stop here, keeping their children's (more accurate) total mass.
+            # Children are ordered (-u, -v), (-u, +v), (+u, -v), (+u, +v)
+            twist = (
+                child_mass[:, 0]
+                - child_mass[:, 1]
+                - child_mass[:, 2]
+                + child_mass[:, 3]
+            )
+            error = np.abs(twist) + np.abs(child_mass.sum(axis=1) - mass)
+            smooth = error <= threshold
+            child_total = child_mass[smooth].sum(axis=1)
+            leaves.append((u[smooth], v[smooth], level, child_total))
+
+            u = child_u[~smooth].ravel()
+            v = child_v[~smooth].ravel()
+            mass = child_mass[~smooth].ravel()
+            width *= 0.5
+
+    u_centres = np.concatenate([leaf[0] for leaf in leaves])
+    v_centres = np.concatenate([leaf[1] for leaf in leaves])
+    level = np.concatenate([np.full(len(leaf[0]), leaf[2], np.int8) for leaf in leaves])
+    pda = np.concatenate([leaf[3] for leaf in leaves])
+
+    # Accumulate in float64 so a float32 CDF keeps its small increments
+    cda = _normalised_cumsum(pda)
+
+    return u_centres, v_centres, level, pda, cda
+
+
+@table_cache.cached
+def build_plane_quadtree_alias_table(
+    n: int,
+    l: int,
+    m: int,
+    plane: Plane,
+    axis_limit: float,
+    base_resolution: int = 256,
+    levels: int = 5,
+    tolerance: float = 1e-9,
+    basis: Basis = "complex",
+    dtype: npt.DTypeLike = float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Alias table of the quadtree leaf PDA (see build_plane_quadtree)."""
+    _u, _v, _level, pda, _cda = build_plane_quadtree(
+        n, l, m, plane, axis_limit, base_resolution, levels, tolerance, basis, dtype
+    )
+    return build_alias_table(pda)
+
+
+def sample_cdf(cdf: npt.ArrayLike, num_samples: int, rng: RNGLike = None) -> np.ndarray:
     """Sample from a CDF using inverse transform sampling."""
-    rng = np.random.default_rng()
-    u = rng.uniform(0.0, 1.0, size=num_samples)
-    index = np.searchsorted(cdf, u, side="left")
+    rng = np.random.default_rng(rng)
+    cdf = np.asarray(cdf)
+    u_dtype = np.float32 if cdf.dtype == np.float32 else np.float64
+    u = rng.random(num_samples, dtype=u_dtype)
+    with stage("sample.searchsorted", num_samples):
+        index = np.searchsorted(cdf, u, side="left")
     return np.minimum(index, len(cdf) - 1)  # Clamp
@@ -1,52 +1,301 @@
 from .utilities import condon_shortley_phase_factor as cspf, factorial_ratio
-from .legendre import associated_legendre_polynomial
+from .utilities import OutFormat, Workspace, complex_dtype, real_dtype
+from .instrument import stage
+from .legendre import (
+    associated_legendre_table,
+    lm_index,
+    normalised_associated_legendre_polynomial,
+)
 
 import numpy as np
 import numpy.typing as npt
 
 
 def spherical_harmonic(
-    l: int, m: int, theta: npt.ArrayLike, phi: npt.ArrayLike
-) -> tuple[np.ndarray, np.ndarray]:
-    """Spherical Harmonic Y_l^m(\\theta, \\phi) using Condon-Shortley convention in P_l^m."""
-    theta = np.asarray(theta, dtype=float)
-    phi = np.asarray(phi, dtype=float)
+    l: int,
+    m: int,
+    theta: npt.ArrayLike,
+    phi: npt.ArrayLike,
+    out_format: OutFormat = "tuple",
+    out: tuple[np.ndarray, np.ndarray] | np.ndarray | None = None,
+    workspace: Workspace | None = None,
+    dtype: npt.DTypeLike = float,
+) -> tuple[np.ndarray, np.ndarray] | np.ndarray:
+    """
+    Spherical Harmonic Y_l^m(\\theta, \\phi) using Condon-Shortley convention in P_l^m.
+    out_format="complex" returns a single complex array instead of (re, im).
+    Computed in place on out (matching out_format) and workspace buffers.
+    """
+    dtype = real_dtype(dtype)
+    theta = np.asarray(theta, dtype=dtype)
+    phi = np.asarray(phi, dtype=dtype)
+    if out_format not in ("tuple", "complex"):
+        raise ValueError("out_format must be one of: 'tuple', 'complex'")
 
-    if m < 0:
-        mp = -m
-        re, im = spherical_harmonic(l, mp, theta, phi)
-        sign = cspf(mp)
-        return sign * re, -sign * im  # conjugate
+    shape = np.broadcast_shapes(theta.shape, phi.shape)
+    out = _empty_out(shape, out_format, dtype) if out is None else out
+    re, im = (out.real, out.imag) if out_format == "complex" else out
 
-    root_term1 = (2 * l + 1) / (4 * np.pi)
-    root_term2 = factorial_ratio(l - m, l + m)
-    # rootTerm2 = factorial(l - m) / factorial(l + m)
-    normalisation = np.sqrt(root_term1 * root_term2)
+    with stage("spherical_harmonic", re.size):
+        workspace = Workspace() if workspace is None else workspace
+        x = workspace.get("spherical_harmonic.x", theta.shape, dtype)
+        np.cos(theta, out=x)
 
-    legendre = associated_legendre_polynomial(l, m, np.cos(theta))
+        complex_exponent = workspace.get("spherical_harmonic.phase", phi.shape, dtype)
+        np.multiply(phi, abs(m), out=complex_exponent)
+        np.cos(complex_exponent, out=re)
+        np.sin(complex_exponent, out=im)
 
-    complex_exponent = m * phi
-    complex_exponential_real = np.cos(complex_exponent)
-    complex_exponential_imag = np.sin(complex_exponent)
+        _apply_legendre(l, m, x, re, im, workspace, dtype)
+        return out
 
-    re = normalisation * legendre * complex_exponential_real
-    im = normalisation * legendre * complex_exponential_imag
-    return re, im
+
+def spherical_harmonic_cartesian(
+    l: int,
+    m: int,
+    x: npt.ArrayLike,
+    y: npt.ArrayLike,
+    z: npt.ArrayLike,
+    out_format: OutFormat = "tuple",
+    out: tuple[np.ndarray, np.ndarray] | np.ndarray | None = None,
+    workspace: Workspace | None = None,
+    dtype: npt.DTypeLike = float,
+    r: npt.ArrayLike | None = None,
+) -> tuple[np.ndarray, np.ndarray] | np.ndarray:
+    """
+    Spherical Harmonic Y_l^m at Cartesian points, without going through angles.
+    Uses cos(theta) = z/r and e^{i m phi} = ((x + iy)/rho)^m by repeated complex multiplication;
+    like cartesian_to_spherical, the origin has theta = pi/2 and the z axis phi = 0.
+    Pass r = sqrt(x^2 + y^2 + z^2) if the caller already has it.
+    """
+    dtype = real_dtype(dtype)
+    x = np.asarray(x, dtype=dtype)
+    y = np.asarray(y, dtype=dtype)
+    z = np.asarray(z, dtype=dtype)
+    if out_format not in ("tuple", "complex"):
+        raise ValueError("out_format must be one of: 'tuple', 'complex'")
+
+    shape = np.broadcast_shapes(x.shape, y.shape, z.shape)
+    out = _empty_out(shape, out_format, dtype) if out is None else out
+    re, im = (out.real, out.imag) if out_format == "complex" else out
+
+    with stage("spherical_harmonic_cartesian", re.size):
+        workspace = Workspace() if workspace is None else workspace
+        rho = workspace.get("spherical_harmonic.rho", shape, dtype)
+        term = workspace.get("spherical_harmonic.term", shape, dtype)
+
+        # rho^2 = x^2 + y^2, r = sqrt(rho^2 + z^2)
+        np.multiply(x, x, out=rho)
+        np.multiply(y, y, out=term)
+        rho += term
+        if r is None:
+            r = workspace.get("spherical_harmonic.r", shape, dtype)
+            np.multiply(z, z, out=r)
+            r += rho
+            np.sqrt(r, out=r)
+        else:
+            r = np.asarray(r, dtype=dtype)
+        np.sqrt(rho, out=rho)
+
+        cos_theta = workspace.get("spherical_harmonic.x", shape, dtype)
+        cos_theta[...] = 0.0
+        np.divide(z, r, out=cos_theta, where=r != 0.0)
+        np.clip(cos_theta, -1.0, 1.0, out=cos_theta)
+
+        # e^{i phi} = (x + iy) / rho, and 1 on the z axis
+        re[...] = 1.0
+        im[...] = 0.0
+        if m != 0:
+            cos_phi = workspace.get("spherical_harmonic.cos_phi", shape, dtype)
+            sin_phi = workspace.get("spherical_harmonic.sin_phi", shape, dtype)
+            cos_phi[...] = 1.0
+            sin_phi[...] = 0.0
+            on_axis = rho == 0.0
+            np.divide(x, rho, out=cos_phi, where=~on_axis)
+            np.divide(y, rho, out=sin_phi, where=~on_axis)
+
+            re[...] = cos_phi
+            im[...] = sin_phi
+            scratch = workspace.get("spherical_harmonic.scratch", shape, dtype)
+            for _ in range(abs(m) - 1):
+                # (re + i im) *= (cos_phi + i sin_phi)
+                np.multiply(im, sin_phi, out=term)
+                np.multiply(re, sin_phi, out=scratch)
+                re *= cos_phi
+                re -= term
+                im *= cos_phi
+                im += scratch
+
+        _apply_legendre(l, m, cos_theta, re, im, workspace, dtype)
+        return out
 
 
 def spherical_harmonic_real(
-    l: int, m: int, theta: npt.ArrayLike, phi: npt.ArrayLike
+    l: int,
+    m: int,
+    theta: npt.ArrayLike,
+    phi: npt.ArrayLike,
+    out: np.ndarray | None = None,
+    workspace: Workspace | None = None,
+    dtype: npt.DTypeLike = float,
 ) -> np.ndarray:
     """Real-form spherical harmonic Y_{lm}^real, as a real linear combination of +-m"""
-    theta = np.asarray(theta, dtype=float)
-    phi = np.asarray(phi, dtype=float)
+    dtype = real_dtype(dtype)
+    theta = np.asarray(theta, dtype=dtype)
+    phi = np.asarray(phi, dtype=dtype)
+
+    shape = np.broadcast_shapes(theta.shape, phi.shape)
+    if out is None:
+        out = np.empty(shape, dtype=dtype)
+    workspace = Workspace() if workspace is None else workspace
+
+    re, im = spherical_harmonic(
+        l,
+        abs(m),
+        theta,
+        phi,
+        out=_real_scratch(workspace, shape, dtype),
+        workspace=workspace,
+        dtype=dtype,
+    )
+    return _real_combination(m, re, im, out)
+
+
+def spherical_harmonic_real_cartesian(
+    l: int,
+    m: int,
+    x: npt.ArrayLike,
+    y: npt.ArrayLike,
+    z: npt.ArrayLike,
+    out: np.ndarray | None = None,
+    workspace: Workspace | None = None,
+    dtype: npt.DTypeLike = float,
+    r: npt.ArrayLike | None = None,
+) -> np.ndarray:
+    """Real-form spherical harmonic Y_{lm}^real at Cartesian points (see spherical_harmonic_cartesian)."""
+    dtype = real_dtype(dtype)
+    x = np.asarray(x, dtype=dtype)
+    y = np.asarray(y, dtype=dtype)
+    z = np.asarray(z, dtype=dtype)
+
+    shape = np.broadcast_shapes(x.shape, y.shape, z.shape)
+    if out is None:
+        out = np.empty(shape, dtype=dtype)
+    workspace = Workspace() if workspace is None else workspace
+
+    re, im = spherical_harmonic_cartesian(
+        l,
+        abs(m),
+        x,
+        y,
+        z,
+        out=_real_scratch(workspace, shape, dtype),
+        workspace=workspace,
+        dtype=dtype,
+        r=r,
+    )
+    return _real_combination(m, re, im, out)
 
+
+def spherical_harmonic_table(
+    l_max: int,
+    theta: npt.ArrayLike,
+    phi: npt.ArrayLike,
+    dtype: npt.DTypeLike = float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    All spherical harmonics Y_l^m(\\theta, \\phi) for 0 <= l <= l_max and |m| <= l, in one recurrence sweep.
+    Returns (re, im), each of shape ((l_max + 1)^2, *broadcast(theta, phi).shape), indexed by lm_index(l, m).
+    Uses the unnormalised Legendre recurrence, which overflows for l_max > 150 (inf/nan);
+    use spherical_harmonic, built on the normalised recurrence, for larger l.
+    """
+    dtype = real_dtype(dtype)
+    theta = np.asarray(theta, dtype=dtype)
+    phi = np.asarray(phi, dtype=dtype)
+    theta, phi = np.broadcast_arrays(theta, phi)
+
+    legendre = associated_legendre_table(l_max, np.cos(theta), dtype=dtype)
+    re = np.empty_like(legendre)
+    im = np.empty_like(legendre)
+
+    for m in range(0, l_max + 1):
+        complex_exponential_real = np.cos(m * phi)
+        complex_exponential_imag = np.sin(m * phi)
+        for l in range(m, l_max + 1):
+            root_term1 = (2 * l + 1) / (4 * np.pi)
+            root_term2 = factorial_ratio(l - m, l + m)
+            normalisation = np.sqrt(root_term1 * root_term2)
+
+            index = lm_index(l, m)
+            np.multiply(legendre[index], normalisation, out=re[index, ...])
+            np.multiply(re[index], complex_exponential_imag, out=im[index, ...])
+            re[index, ...] *= complex_exponential_real
+
+            # Y_l^{-m} = (-1)^m conj(Y_l^m)
+            if m > 0:
+                sign = cspf(m)
+                np.multiply(re[index], sign, out=re[lm_index(l, -m), ...])
+                np.multiply(im[index], -sign, out=im[lm_index(l, -m), ...])
+
+    return re, im
+
+
+def _empty_out(
+    shape: tuple[int, ...], out_format: OutFormat, dtype: np.dtype
+) -> tuple[np.ndarray, np.ndarray] | np.ndarray:
+    if out_format == "complex":
+        return np.empty(shape, dtype=complex_dtype(dtype))
+    return np.empty(shape, dtype=dtype), np.empty(shape, dtype=dtype)
+
+
+def _apply_legendre(
+    l: int,
+    m: int,
+    x: np.ndarray,
+    re: np.ndarray,
+    im: np.ndarray,
+    workspace: Workspace,
+    dtype: np.dtype,
+) -> None:
+    """Scale (re, im) = e^{i|m|phi} in place by N P_l^|m|(x), then apply Y_l^{-m} = (-1)^m conj(Y_l^m)."""
     mp = abs(m)
-    phase = cspf(mp)
-    re, im = spherical_harmonic(l, mp, theta, phi)
 
-    if m == 0:
-        return re
+    # N P_l^m from the normalised recurrence, which stays finite for large l
+    legendre = normalised_associated_legendre_polynomial(
+        l,
+        mp,
+        x,
+        out=workspace.get("spherical_harmonic.P", x.shape, dtype),
+        workspace=workspace,
+        dtype=dtype,
+    )
+    re *= legendre
+    im *= legendre
+
     if m < 0:
-        return np.sqrt(2.0) * phase * im
-    return np.sqrt(2.0) * phase * re
+        sign = cspf(mp)
+        re *= sign
+        im *= -sign  # conjugate
+
+
+def _real_scratch(
+    workspace: Workspace, shape: tuple[int, ...], dtype: np.dtype
+) -> tuple[np.ndarray, np.ndarray]:
+    return (
+        workspace.get("spherical_harmonic_real.re", shape, dtype),
+        workspace.get("spherical_harmonic_real.im", shape, dtype),
+    )
+
+
+def _real_combination(
+    m: int, re: np.ndarray, im: np.ndarray, out: np.ndarray
+) -> np.ndarray:
+    """Y_{lm}^real from Y_l^|m| = re + i im."""
+    phase = cspf(abs(m))
+    if m == 0:
+        out[...] = re
+    elif m < 0:
+        np.multiply(im, np.sqrt(2.0) * phase, out=out)
+    else:
+        np.multiply(re, np.sqrt(2.0) * phase, out=out)
+    return out
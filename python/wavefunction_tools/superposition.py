@@ -1,28 +1,52 @@
 import numpy as np
 import numpy.typing as npt
+from typing import Sequence
+
+from .utilities import OutFormat, as_complex, complex_dtype
+from .wavefunction import (
+    Axis,
+    Basis,
+    Plane,
+    wavefunction_cartesian,
+    _axis_to_xyz,
+    _plane_to_xyz,
+)
+
+
+def energy_level(n: float) -> float:
+    """Energy E_n = -13.6 / n^2 (eV) of hydrogen level n."""
+    return -(13.6 / (n**2))
 
 
 def time_dependent_factor(
-    n: float, time: float, hbar: float = 1.0
-) -> tuple[np.ndarray, np.ndarray]:
+    n: float, time: float, hbar: float = 1.0, out_format: OutFormat = "tuple"
+) -> tuple[np.ndarray, np.ndarray] | np.ndarray:
     """Calculate the time-dependent factor for a given principal quantum number n and time."""
-    energy = -(13.6 / (n**2))
+    energy = energy_level(n)
     exponent = -energy * time / hbar
+    if out_format == "complex":
+        return np.exp(1j * exponent)
     e_real = np.cos(exponent)
     e_imag = np.sin(exponent)
     return e_real, e_imag
 
 
 def superpose_wavefunctions(
-    psi1: tuple[npt.ArrayLike, npt.ArrayLike],
-    psi2: tuple[npt.ArrayLike, npt.ArrayLike],
+    psi1: tuple[npt.ArrayLike, npt.ArrayLike] | npt.ArrayLike,
+    psi2: tuple[npt.ArrayLike, npt.ArrayLike] | npt.ArrayLike,
     factor: float,
-) -> tuple[np.ndarray, np.ndarray]:
-    """Superpose two wavefunctions using factor [0,1]."""
+) -> tuple[np.ndarray, np.ndarray] | np.ndarray:
+    """
+    Superpose two wavefunctions using factor [0,1].
+    Takes (re, im) tuples or native complex arrays, and returns the same form.
+    """
     theta = 0.5 * np.pi * factor  # Map factor [0,1] to angle [0, pi/2]
     alpha = np.cos(theta)
     beta = np.sin(theta)
 
+    if not (isinstance(psi1, tuple) and isinstance(psi2, tuple)):
+        return alpha * as_complex(psi1) + beta * as_complex(psi2)
+
     re1, im1 = psi1
     re2, im2 = psi2
 
@@ -31,6 +55,217 @@ def superpose_wavefunctions(
     return re, im
 
 
+class Superposition:
+    """
+    Superposition psi(t) = sum_k c_k psi_k e^{-i E_k t / hbar} of hydrogen states on fixed points.
+    The basis stack is evaluated once, so each psi(t) is a single matrix product of the
+    phase vector with the stack. Repeated (n, l, m) states share one basis entry.
+    """
+
+    def __init__(
+        self,
+        states: Sequence[tuple[int, int, int, complex]],
+        x: npt.ArrayLike,
+        y: npt.ArrayLike,
+        z: npt.ArrayLike,
+        basis: Basis = "complex",
+        hbar: float = 1.0,
+        workers: int | None = None,
+        dtype: npt.DTypeLike = float,
+    ):
+        if len(states) == 0:
+            raise ValueError("states must contain at least one (n, l, m, coefficient).")
+
+        # Merge repeated states, keeping first-seen order
+        merged: dict[tuple[int, int, int], complex] = {}
+        for n, l, m, coefficient in states:
+            merged[(n, l, m)] = merged.get((n, l, m), 0.0) + complex(coefficient)
+
+        self.states = list(merged)
+        self.basis = basis
+        self.hbar = hbar
+        self.dtype = complex_dtype(dtype)
+        self.coefficients = np.array(list(merged.values()), dtype=self.dtype)
+        self.energies = np.array([energy_level(n) for n, _l, _m in self.states])
+
+        self.shape = np.broadcast_shapes(np.shape(x), np.shape(y), np.shape(z))
+        self.stack = np.empty(
+            (len(self.states), int(np.prod(self.shape))), dtype=self.dtype
+        )
+        for k, (n, l, m) in enumerate(self.states):
+            psi = wavefunction_cartesian(
+                n,
+                l,
+                m,
+                x,
+                y,
+                z,
+                basis=basis,
+                workers=workers,
+                out_format="complex",
+                dtype=dtype,
+            )
+            self.stack[k] = np.ravel(psi)
+
+        # Extents of the points, recorded in rendered frame metadata
+        self.grid = {"x": _extent(x), "y": _extent(y), "z": _extent(z)}
+
+    @classmethod
+    def on_slice(
+        cls,
+        states: Sequence[tuple[int, int, int, complex]],
+        plane: Plane,
+        u: npt.ArrayLike,
+        v: npt.ArrayLike,
+        **kwargs,
+    ) -> "Superposition":
+        """Superposition on a 2D plane; kwargs are forwarded to Superposition."""
+        u = np.asarray(u, dtype=kwargs.get("dtype", float))
+        v = np.asarray(v, dtype=kwargs.get("dtype", float))
+        superposition = cls(states, *_plane_to_xyz(plane, u, v), **kwargs)
+        superposition.grid = {"plane": plane, "u": _extent(u), "v": _extent(v)}
+        return superposition
+
+    @classmethod
+    def on_line(
+        cls,
+        states: Sequence[tuple[int, int, int, complex]],
+        axis: Axis,
+        u: npt.ArrayLike,
+        **kwargs,
+    ) -> "Superposition":
+        """Superposition on a 1D line; kwargs are forwarded to Superposition."""
+        u = np.asarray(u, dtype=kwargs.get("dtype", float))
+        superposition = cls(states, *_axis_to_xyz(axis, u), **kwargs)
+        superposition.grid = {"axis": axis, "u": _extent(u)}
+        return superposition
+
+    @property
+    def nbytes(self) -> int:
+        return self.stack.nbytes
+
+    def phases(
+        self, time: npt.ArrayLike, coefficients: npt.ArrayLike | None = None
+    ) -> np.ndarray:
+        """c_k e^{-i E_k t / hbar}, shape (*time.shape, number of states)."""
+        time = np.asarray(time, dtype=float)
+        coefficients = self.coefficients if coefficients is None else coefficients
+        exponent = np.multiply.outer(time, -self.energies / self.hbar)
+        return (np.asarray(coefficients) * np.exp(1j * exponent)).astype(self.dtype)
+
+    def evaluate(
+        self,
+        time: npt.ArrayLike,
+        coefficients: npt.ArrayLike | None = None,
+        out_format: OutFormat = "tuple",
+    ) -> tuple[np.ndarray, np.ndarray] | np.ndarray:
+        """
+        psi at one time (shape of the points) or many (time.shape + shape of the points).
+        coefficients overrides the stored ones for this call, e.g. to animate a mixing factor.
+        """
+        if out_format not in ("tuple", "complex"):
+            raise ValueError("out_format must be one of: 'tuple', 'complex'")
+        time = np.asarray(time, dtype=float)
+        phases = self.phases(time.ravel(), coefficients)
+
+        psi = (phases @ self.stack).reshape(time.shape + self.shape)
+        if out_format == "complex":
+            return psi
+        return psi.real, psi.imag
+
+
+class TwoStateDensity:
+    """
+    Density and phase frames of psi(t) = a psi1 e^{-i E1 t / hbar} + b psi2 e^{-i E2 t / hbar}.
+    |psi|^2 = |a|^2 |psi1|^2 + |b|^2 |psi2|^2 + 2 Re(conj(a) b e^{-i(E2 - E1)t / hbar} conj(psi1) psi2),
+    so the fields are precomputed once and each frame is a single weights @ fields product.
+    """
+
+    def __init__(
+        self,
+        psi1: tuple[npt.ArrayLike, npt.ArrayLike] | npt.ArrayLike,
+        psi2: tuple[npt.ArrayLike, npt.ArrayLike] | npt.ArrayLike,
+        n1: int,
+        n2: int,
+        hbar: float = 1.0,
+    ):
+        psi1 = as_complex(psi1)
+        psi2 = as_complex(psi2)
+        if psi1.shape != psi2.shape:
+            raise ValueError("psi1 and psi2 must have the same shape.")
+
+        self.shape = psi1.shape
+        self.energies = (energy_level(n1), energy_level(n2))
+        self.hbar = hbar
+        real = np.result_type(psi1.real.dtype, psi2.real.dtype)
+
+        # Rows: Re psi1, Im psi1, Re psi2, Im psi2
+        self.amplitudes = np.stack(
+            [psi1.real.ravel(), psi1.imag.ravel(), psi2.real.ravel(), psi2.imag.ravel()]
+        ).astype(real, copy=False)
+
+        # Rows: |psi1|^2, |psi2|^2, Re and Im of conj(psi1) psi2
+        cross = np.conjugate(psi1) * psi2
+        self.fields = np.stack(
+            [
+                np.abs(psi1.ravel()) ** 2,
+                np.abs(psi2.ravel()) ** 2,
+                cross.real.ravel(),
+                cross.imag.ravel(),
+            ]
+        ).astype(real, copy=False)
+
+    def density(
+        self, time: float, factor: float | tuple[complex, complex] = 0.5
+    ) -> np.ndarray:
+        """|psi|^2 at time; factor in [0,1] mixes as superpose_wavefunctions, or pass (a, b)."""
+        a, b = self._coefficients(time, factor)
+        w = np.conjugate(a) * b
+        weights = [abs(a) ** 2, abs(b) ** 2, 2.0 * w.real, -2.0 * w.imag]
+        weights = np.asarray(weights, dtype=self.fields.dtype)
+        return (weights @ self.fields).reshape(self.shape)
+
+    def magnitude(
+        self, time: float, factor: float | tuple[complex, complex] = 0.5
+    ) -> np.ndarray:
+        """|psi| at time (see density)."""
+        density = self.density(time, factor)
+        np.maximum(density, 0.0, out=density)  # Rounding can leave tiny negatives
+        return np.sqrt(density, out=density)
+
+    def phase(
+        self, time: float, factor: float | tuple[complex, complex] = 0.5
+    ) -> np.ndarray:
+        """arg(psi) at time (see density)."""
+        a, b = self._coefficients(time, factor)
+        weights = [
+            [a.real, -a.imag, b.real, -b.imag],  # Re psi
+            [a.imag, a.real, b.imag, b.real],  # Im psi
+        ]
+        weights = np.asarray(weights, dtype=self.amplitudes.dtype)
+        re, im = weights @ self.amplitudes
+        return np.arctan2(im, re).reshape(self.shape)
+
+    def _coefficients(
+        self, time: float, factor: float | tuple[complex, complex]
+    ) -> tuple[complex, complex]:
+        """a e^{-i E1 t / hbar} and b e^{-i E2 t / hbar}."""
+        if isinstance(factor, tuple):
+            a, b = factor
+        else:
+            theta = 0.5 * np.pi * factor  # Map factor [0,1] to angle [0, pi/2]
+            a, b = np.cos(theta), np.sin(theta)
+        e1, e2 = self.energies
+        a = complex(a) * np.exp(-1j * e1 * time / self.hbar)
+        b = complex(b) * np.exp(-1j * e2 * time / self.hbar)
+        return a, b
+
+
+def _extent(values: npt.ArrayLike) -> list[float]:
+    values = np.asarray(values)
+    return [float(values.min()), float(values.max())]
+
+
 # psi_1 = wavefunction(1, 0, 0, 0, 0, 0) * time_dependent_factor(1, time)
 # psi_2 = wavefunction(2, 1, 0, 0, 0, 0) * time_dependent_factor(2, time)
 # psi_superposition = superpose_wavefunctions(psi_1, psi_2, factor)
@@ -0,0 +1,58 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+import numpy as np
+import numpy.typing as npt
+
+# Elements per tile, small enough that a tile's temporaries stay in cache
+TILE_SIZE = 16384
+
+
+def evaluate_tiled(
+    func: Callable[..., np.ndarray | tuple[np.ndarray, ...]],
+    *arrays: npt.ArrayLike,
+    workers: int | None = None,
+    tile_size: int = TILE_SIZE,
+) -> np.ndarray | tuple[np.ndarray, ...]:
+    """
+    Evaluate an element-wise func(*arrays) over the broadcast inputs in tiles on a thread pool.
+    NumPy ufuncs release the GIL, so tiles run concurrently; results are written into
+    preallocated outputs of the broadcast shape. workers=None or 1 evaluates in one call,
+    workers=0 uses every CPU.
+    """
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    if workers is not None and workers < 0:
+        raise ValueError("workers must be None or a non-negative integer.")
+
+    arrays = np.broadcast_arrays(*(np.asarray(a) for a in arrays))
+    shape = arrays[0].shape
+    size = arrays[0].size
+    if workers is None or workers == 1 or size <= tile_size:
+        return func(*arrays)
+
+    flat = [a.ravel() for a in arrays]
+    starts = range(0, size, tile_size)
+
+    # The first tile fixes the output structure and dtypes
+    first = func(*(a[:tile_size] for a in flat))
+    is_tuple = isinstance(first, tuple)
+    first = first if is_tuple else (first,)
+    outputs = tuple(np.empty(size, dtype=np.asarray(f).dtype) for f in first)
+    for out, f in zip(outputs, first):
+        out[:tile_size] = f
+
+    def run(start: int) -> None:
+        stop = min(start + tile_size, size)
+        result = func(*(a[start:stop] for a in flat))
+        result = result if is_tuple else (result,)
+        for out, r in zip(outputs, result):
+            out[start:stop] = r
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for _ in pool.map(run, starts[1:]):
+            pass
+
+    outputs = tuple(out.reshape(shape) for out in outputs)
+    return outputs if is_tuple else outputs[0]
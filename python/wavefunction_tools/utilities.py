@@ -1,9 +1,59 @@
 import numpy as np
 import numpy.typing as npt
+from math import exp, lgamma
+from typing import Callable, Literal
+
+from .instrument import stage
 
 Z = 1
 a0 = 1
 
+# "tuple" returns (re, im) float arrays, "complex" a single complex array
+OutFormat = Literal["tuple", "complex"]
+
+# Anything np.random.default_rng accepts: a Generator is used as-is, seeds build a new one
+RNGLike = np.random.Generator | np.random.SeedSequence | int | None
+
+
+def real_dtype(dtype: npt.DTypeLike) -> np.dtype:
+    """Validate a working precision: float32 or float64."""
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError("dtype must be one of: 'float32', 'float64'")
+    return dtype
+
+
+def complex_dtype(dtype: npt.DTypeLike) -> np.dtype:
+    """Complex dtype matching a real precision: complex64 for float32, else complex128."""
+    return np.result_type(real_dtype(dtype), np.complex64)
+
+
+class Workspace:
+    """
+    Reusable scratch buffers for the out= kernels, keyed by name, shape and dtype.
+    Pass the same Workspace to repeated calls so their temporaries are allocated once.
+    Not thread-safe: use one Workspace per thread.
+    """
+
+    def __init__(self):
+        self._buffers: dict[tuple, np.ndarray] = {}
+
+    def get(
+        self, name: str, shape: tuple[int, ...], dtype: npt.DTypeLike = float
+    ) -> np.ndarray:
+        key = (name, tuple(shape), np.dtype(dtype))
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            buffer = self._buffers[key] = np.empty(shape, dtype=dtype)
+        return buffer
+
+    @property
+    def nbytes(self) -> int:
+        return sum(buffer.nbytes for buffer in self._buffers.values())
+
+    def clear(self) -> None:
+        self._buffers.clear()
+
 
 def alternating_sign(exponent: int) -> int:
     """Return (-1)^m for integer m."""
@@ -17,9 +67,12 @@ def condon_shortley_phase_factor(m: int) -> int:
 
 
 def factorial_ratio(a: int, b: int) -> float:
-    """Return a!/b! for integers 0<=a<=b using a product (avoids factorials)."""
+    """Return a!/b! for integers 0<=a<=b, without forming either factorial."""
     if a < 0 or b < 0 or a > b:
         raise ValueError("Require 0 <= a <= b")
+    if b - a > 16:
+        return exp(lgamma(a + 1) - lgamma(b + 1))
+    # A short product is exact to rounding, where lgamma would lose a few digits
     prod = 1.0
     for k in range(a + 1, b + 1):
         prod /= k
@@ -37,6 +90,60 @@ def binomial(n: float, k: int) -> float:
     return product
 
 
+def invert_monotone(
+    f: Callable[[np.ndarray], np.ndarray],
+    df: Callable[[np.ndarray], np.ndarray],
+    y: npt.ArrayLike,
+    lo: npt.ArrayLike,
+    hi: npt.ArrayLike,
+    tol: float = 1e-12,
+    max_iterations: int = 100,
+    bracket_nodes: int = 64,
+) -> np.ndarray:
+    """
+    Solve f(x) = y element-wise for increasing f on [lo, hi], with f(lo) <= y <= f(hi).
+    Each element starts from its cell of a coarse bracket_nodes table of f (for scalar lo, hi),
+    then Newton steps are kept inside the shrinking bracket, falling back to bisection.
+    """
+    y = np.asarray(y, dtype=float)
+    shape = y.shape
+    y = y.ravel()
+
+    if bracket_nodes > 1 and np.ndim(lo) == 0 and np.ndim(hi) == 0:
+        x_nodes = np.linspace(lo, hi, bracket_nodes + 1)
+        index = np.searchsorted(f(x_nodes), y, side="right")
+        index = np.clip(index, 1, bracket_nodes)
+        lo, hi = x_nodes[index - 1], x_nodes[index]
+
+    lo = np.broadcast_to(np.asarray(lo, dtype=float), y.shape).copy()
+    hi = np.broadcast_to(np.asarray(hi, dtype=float), y.shape).copy()
+    x = 0.5 * (lo + hi)
+
+    # Only unconverged elements are iterated
+    active = np.arange(y.size)
+    for _ in range(max_iterations):
+        if active.size == 0:
+            break
+        x_a, lo_a, hi_a = x[active], lo[active], hi[active]
+
+        residual = f(x_a) - y[active]
+        below = residual < 0.0
+        lo_a = np.where(below, x_a, lo_a)
+        hi_a = np.where(below, hi_a, x_a)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_new = x_a - residual / df(x_a)
+        outside = ~((x_new >= lo_a) & (x_new <= hi_a))  # Also catches nan from df == 0
+        x_new = np.where(outside, 0.5 * (lo_a + hi_a), x_new)
+
+        scale = tol * (1.0 + np.abs(x_new))
+        done = (np.abs(x_new - x_a) <= scale) | (hi_a - lo_a <= scale)
+        x[active], lo[active], hi[active] = x_new, lo_a, hi_a
+        active = active[~done]
+
+    return x.reshape(shape)
+
+
 def spherical_to_cartesian(
     r: npt.ArrayLike, theta: npt.ArrayLike, phi: npt.ArrayLike
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
@@ -48,21 +155,26 @@ def spherical_to_cartesian(
 
 
 def cartesian_to_spherical(
-    x: npt.ArrayLike, y: npt.ArrayLike, z: npt.ArrayLike
+    x: npt.ArrayLike,
+    y: npt.ArrayLike,
+    z: npt.ArrayLike,
+    dtype: npt.DTypeLike = float,
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     """Convert Cartesian (x,y,z) to Spherical (r,theta,phi)."""
-    x = np.asarray(x, dtype=float)
-    y = np.asarray(y, dtype=float)
-    z = np.asarray(z, dtype=float)
+    dtype = real_dtype(dtype)
+    x = np.asarray(x, dtype=dtype)
+    y = np.asarray(y, dtype=dtype)
+    z = np.asarray(z, dtype=dtype)
 
-    r = np.sqrt(x * x + y * y + z * z)
-    safe_r = np.where(r == 0.0, 1.0, r)
+    with stage("coordinates", np.broadcast(x, y, z).size):
+        r = np.sqrt(x * x + y * y + z * z)
+        safe_r = np.where(r == 0.0, 1.0, r)
 
-    theta = np.arccos(np.clip(z / safe_r, -1.0, 1.0))  # [0, pi]
-    phi = np.arctan2(y, x)  # (-pi, pi]
-    phi = np.where(phi < 0.0, phi + 2.0 * np.pi, phi)  # [0, 2pi)
+        theta = np.arccos(np.clip(z / safe_r, -1.0, 1.0))  # [0, pi]
+        phi = np.arctan2(y, x)  # (-pi, pi]
+        phi = np.where(phi < 0.0, phi + 2.0 * np.pi, phi)  # [0, 2pi)
 
-    return r, theta, phi
+        return r, theta, phi
 
 
 def complex_phase(re: npt.ArrayLike, im: npt.ArrayLike, deg=False) -> np.ndarray:
@@ -91,12 +203,26 @@ def complex_magnitude_squared(re: npt.ArrayLike, im: npt.ArrayLike) -> np.ndarra
 
 
 def complex_multiply(
-    z1: tuple[npt.ArrayLike, npt.ArrayLike],
-    z2: tuple[npt.ArrayLike, npt.ArrayLike],
-) -> tuple[np.ndarray, np.ndarray]:
-    """Multiply two complex numbers."""
+    z1: tuple[npt.ArrayLike, npt.ArrayLike] | npt.ArrayLike,
+    z2: tuple[npt.ArrayLike, npt.ArrayLike] | npt.ArrayLike,
+) -> tuple[np.ndarray, np.ndarray] | np.ndarray:
+    """
+    Multiply two complex numbers, given as (re, im) tuples or native complex arrays.
+    Returns (re, im) if both are tuples, otherwise a complex array.
+    """
+    if not (isinstance(z1, tuple) and isinstance(z2, tuple)):
+        return as_complex(z1) * as_complex(z2)
+
     re1, im1 = z1
     re2, im2 = z2
     re_product = re1 * re2 - im1 * im2
     im_product = re1 * im2 + im1 * re2
     return re_product, im_product
+
+
+def as_complex(z: tuple[npt.ArrayLike, npt.ArrayLike] | npt.ArrayLike) -> np.ndarray:
+    """Native complex (or real) array from an (re, im) tuple or array-like."""
+    if isinstance(z, tuple):
+        re, im = z
+        return np.asarray(re) + 1j * np.asarray(im)
+    return np.asarray(z)
@@ -1,15 +1,31 @@
 import numpy as np
 import numpy.typing as npt
-from typing import Literal
+from functools import lru_cache, partial
+from typing import Callable, Literal
 
-from .radial_wave_function import radial_distribution, radial_wave_function
-from .spherical_harmonic import spherical_harmonic, spherical_harmonic_real
-from .utilities import cartesian_to_spherical
+from .radial_wave_function import (
+    radial_wave_function,
+    inverse_radial_cumulative_distribution,
+    clear_radial_cdf_cache,
+)
+from .radial_table import radial_table
+from .spherical_harmonic import (
+    spherical_harmonic,
+    spherical_harmonic_cartesian,
+    spherical_harmonic_real,
+    spherical_harmonic_real_cartesian,
+)
+from .instrument import stage
+from .tiling import evaluate_tiled
+from .utilities import alternating_sign
+from .utilities import OutFormat, Workspace, complex_dtype, real_dtype
 
 
 Axis = Literal["x", "y", "z"]
 Plane = Literal["xy", "xz", "yz"]
 Basis = Literal["complex", "real"]
+# "tabulated" looks R_nl up in a cached piecewise polynomial table (see radial_table)
+RadialBackend = Literal["exact", "tabulated"]
 
 
 def wavefunction(
@@ -20,25 +36,59 @@ def wavefunction(
     theta: npt.ArrayLike,
     phi: npt.ArrayLike,
     basis: Basis = "complex",
-) -> tuple[np.ndarray, np.ndarray]:
-    """Hydrogen wave function psi_{nlm}(r,theta,phi)."""
-    r = np.asarray(r, dtype=float)
-    theta = np.asarray(theta, dtype=float)
-    phi = np.asarray(phi, dtype=float)
+    out_format: OutFormat = "tuple",
+    workspace: Workspace | None = None,
+    dtype: npt.DTypeLike = float,
+    radial_backend: RadialBackend = "exact",
+) -> tuple[np.ndarray, np.ndarray] | np.ndarray:
+    """
+    Hydrogen wave function psi_{nlm}(r,theta,phi).
+    out_format="complex" returns a single complex array instead of (re, im),
+    or a real array for the real basis (no zero imaginary part is allocated).
+    Temporaries come from workspace; only the returned arrays are allocated.
+    dtype=np.float32 computes in single precision (complex64 for complex output), agreeing
+    with float64 to within 1e-5 of max|psi| for n <= 15.
+    radial_backend="tabulated" replaces the Laguerre recurrence with a table lookup whose
+    cost does not grow with n (measured within 1e-10 of max|R|; see RadialTable).
+    """
+    dtype = real_dtype(dtype)
+    r = np.asarray(r, dtype=dtype)
+    theta = np.asarray(theta, dtype=dtype)
+    phi = np.asarray(phi, dtype=dtype)
+    if out_format not in ("tuple", "complex"):
+        raise ValueError("out_format must be one of: 'tuple', 'complex'")
 
-    R = radial_wave_function(n, l, r)
+    workspace = Workspace() if workspace is None else workspace
+    shape = np.broadcast_shapes(r.shape, theta.shape, phi.shape)
+    with stage("wavefunction", np.prod(shape, dtype=int)):
+        R = _radial(
+            n,
+            l,
+            r,
+            workspace.get("wavefunction.R", r.shape, dtype),
+            workspace,
+            radial_backend,
+        )
 
-    if basis == "real":
-        Y_re = spherical_harmonic_real(l, m, theta, phi)
-        real = R * Y_re
-        imag = np.zeros_like(real)
-        return real, imag
-
-    Y_re, Y_im = spherical_harmonic(l, m, theta, phi)
-    real = R * Y_re
-    imag = R * Y_im
-
-    return real, imag
+        return _times_angular(
+            R,
+            partial(
+                spherical_harmonic, l, m, theta, phi, workspace=workspace, dtype=dtype
+            ),
+            partial(
+                spherical_harmonic_real,
+                l,
+                m,
+                theta,
+                phi,
+                workspace=workspace,
+                dtype=dtype,
+            ),
+            shape,
+            basis,
+            out_format,
+            dtype,
+        )
 
 
 def wavefunction_cartesian(
@@ -49,10 +99,45 @@ def wavefunction_cartesian(
     y: npt.ArrayLike,
     z: npt.ArrayLike,
     basis: Basis = "complex",
-) -> tuple[np.ndarray, np.ndarray]:
-    """Hydrogen wave function psi_{nlm}(x,y,z)."""
-    r, theta, phi = cartesian_to_spherical(x, y, z)
-    return wavefunction(n, l, m, r, theta, phi, basis=basis)
+    workers: int | None = None,
+    out_format: OutFormat = "tuple",
+    dtype: npt.DTypeLike = float,
+    radial_backend: RadialBackend = "exact",
+) -> tuple[np.ndarray, np.ndarray] | np.ndarray:
+    """
+    Hydrogen wave function psi_{nlm}(x,y,z).
+    Evaluated without converting to angles (see spherical_harmonic_cartesian).
+    workers > 1 evaluates cache-sized tiles on a thread pool (0 uses every CPU).
+    """
+    if workers is not None and workers != 1:
+        return evaluate_tiled(
+            lambda x, y, z: wavefunction_cartesian(
+                n,
+                l,
+                m,
+                x,
+                y,
+                z,
+                basis=basis,
+                out_format=out_format,
+                dtype=dtype,
+                radial_backend=radial_backend,
+            ),
+            x,
+            y,
+            z,
+            workers=workers,
+        )
+
+    dtype = real_dtype(dtype)
+    x = np.asarray(x, dtype=dtype)
+    y = np.asarray(y, dtype=dtype)
+    z = np.asarray(z, dtype=dtype)
+    if out_format not in ("tuple", "complex"):
+        raise ValueError("out_format must be one of: 'tuple', 'complex'")
+    return _wavefunction_cartesian(
+        n, l, m, x, y, z, basis, out_format, dtype, radial_backend
+    )
 
 
 def wavefunction_slice_cartesian(
@@ -63,13 +148,49 @@ def wavefunction_slice_cartesian(
     u: npt.ArrayLike,
     v: npt.ArrayLike,
     basis: Basis = "complex",
-) -> tuple[np.ndarray, np.ndarray]:
-    """Hydrogen wave function psi_{nlm}(x,y,z) on a 2D plane."""
-    u = np.asarray(u, dtype=float)
-    v = np.asarray(v, dtype=float)
+    workers: int | None = None,
+    out_format: OutFormat = "tuple",
+    dtype: npt.DTypeLike = float,
+    radial_backend: RadialBackend = "exact",
+) -> tuple[np.ndarray, np.ndarray] | np.ndarray:
+    """
+    Hydrogen wave function psi_{nlm}(x,y,z) on a 2D plane.
+    On a meshgrid of axes symmetric about 0 (e.g. linspace(-L, L, N)) R_nl is evaluated
+    once per distinct (|u|, |v|), up to 8x fewer points, and the angular part per pixel.
+    """
+    dtype = real_dtype(dtype)
+    u = np.asarray(u, dtype=dtype)
+    v = np.asarray(v, dtype=dtype)
+    if out_format not in ("tuple", "complex"):
+        raise ValueError("out_format must be one of: 'tuple', 'complex'")
 
     x, y, z = _plane_to_xyz(plane, u, v)
-    return wavefunction_cartesian(n, l, m, x, y, z, basis=basis)
+    R = _symmetric_slice_radial(n, l, u, v, radial_backend)
+    if R is None:
+        return wavefunction_cartesian(
+            n,
+            l,
+            m,
+            x,
+            y,
+            z,
+            basis=basis,
+            workers=workers,
+            out_format=out_format,
+            dtype=dtype,
+            radial_backend=radial_backend,
+        )
+
+    return evaluate_tiled(
+        lambda x, y, z, R: _wavefunction_cartesian(
+            n, l, m, x, y, z, basis, out_format, dtype, radial_backend, R
+        ),
+        x,
+        y,
+        z,
+        R,
+        workers=workers,
+    )
 
 
 def wavefunction_line_cartesian(
@@ -79,21 +200,286 @@ def wavefunction_line_cartesian(
     axis: Axis,
     u: npt.ArrayLike,
     basis: Basis = "complex",
-) -> tuple[np.ndarray, np.ndarray]:
+    workers: int | None = None,
+    out_format: OutFormat = "tuple",
+    dtype: npt.DTypeLike = float,
+) -> tuple[np.ndarray, np.ndarray] | np.ndarray:
     """Hydrogen wave function psi_{nlm}(x,y,z) on a 1D line."""
-    u = np.asarray(u, dtype=float)
+    dtype = real_dtype(dtype)
+    u = np.asarray(u, dtype=dtype)
     x, y, z = _axis_to_xyz(axis, u)
-    return wavefunction_cartesian(n, l, m, x, y, z, basis=basis)
+    return wavefunction_cartesian(
+        n,
+        l,
+        m,
+        x,
+        y,
+        z,
+        basis=basis,
+        workers=workers,
+        out_format=out_format,
+        dtype=dtype,
+    )
+
+
+def wavefunction_volume(
+    n: int,
+    l: int,
+    m: int,
+    extent: float,
+    resolution: int,
+    basis: Basis = "complex",
+    workers: int | None = None,
+    out_format: OutFormat = "tuple",
+    dtype: npt.DTypeLike = float,
+) -> tuple[np.ndarray, np.ndarray] | np.ndarray:
+    """
+    Hydrogen wave function psi_{nlm}(x,y,z) on the cube linspace(-extent, extent, resolution)^3,
+    indexed [x, y, z]. Only the x, y, z >= 0 octant is evaluated, the rest is filled by the
+    mirror symmetries z -> -z (parity (-1)^{l+|m|}), y -> -y (phi -> -phi) and x -> -x
+    (phi -> pi - phi).
+    """
+    if basis not in ("complex", "real"):
+        raise ValueError("basis must be one of: 'complex', 'real'")
+
+    dtype = real_dtype(dtype)
+    axis = np.linspace(-extent, extent, resolution, dtype=dtype)
+    h = resolution // 2  # Indices [:h] mirror [resolution - h:]
+
+    x, y, z = np.meshgrid(axis[h:], axis[h:], axis[h:], indexing="ij")
+    octant = wavefunction_cartesian(
+        n,
+        l,
+        m,
+        x,
+        y,
+        z,
+        basis=basis,
+        workers=workers,
+        out_format=out_format,
+        dtype=dtype,
+    )
+
+    # (sign, conjugate) for each reflection
+    parity = alternating_sign(l + abs(m))
+    if basis == "complex":
+        # phi -> -phi conjugates e^{im phi}; phi -> pi - phi also multiplies by (-1)^m
+        reflect_z = (parity, False)
+        reflect_y = (1, True)
+        reflect_x = (alternating_sign(m), True)
+    else:
+        # cos(m phi) for m >= 0, sin(|m| phi) for m < 0
+        reflect_z = (parity, False)
+        reflect_y = (1 if m >= 0 else -1, False)
+        reflect_x = ((1 if m >= 0 else -1) * alternating_sign(m), False)
+
+    parts = [octant] if out_format == "complex" else list(octant)
+    volumes = []
+    for index, part in enumerate(parts):
+        volume = np.empty((resolution,) * 3, dtype=part.dtype)
+        volume[h:, h:, h:] = part
+
+        # In (re, im) form conjugation negates the imaginary part instead
+        is_imag = out_format == "tuple" and index == 1
+        for view, dim, (sign, conjugate) in (
+            (volume[h:, h:], 2, reflect_z),
+            (volume[h:], 1, reflect_y),
+            (volume, 0, reflect_x),
+        ):
+            if is_imag and conjugate:
+                sign = -sign
+            _reflect(view, dim, h, sign, conjugate and out_format == "complex")
+        volumes.append(volume)
+
+    return volumes[0] if out_format == "complex" else tuple(volumes)
 
 
 def radial_axis(n: int, l: int, tail: float = 1e-3) -> float:
-    """Approximate radius containing (1 - tail) probability."""
-    r = np.linspace(0.0, 100.0 * n * n, 20000)  # ? Arbitrary conservative max radius
-    P = radial_distribution(n, l, r)
-    dr = r[1] - r[0]
-    cdf = np.cumsum(P) * dr
-    cdf /= cdf[-1]
-    return float(r[np.searchsorted(cdf, 1.0 - tail)])
+    """
+    Radius containing (1 - tail) probability, by root finding on the radial CDF (closed form
+    for n <= 4, a cached ~1e-13 table above that; see radial_cumulative_distribution).
+    """
+    if not 0.0 < tail <= 1.0:
+        raise ValueError("Require 0 < tail <= 1.")
+    return _radial_axis(n, l, float(tail))
+
+
+@lru_cache(maxsize=None)
+def _radial_axis(n: int, l: int, tail: float) -> float:
+    return float(inverse_radial_cumulative_distribution(n, l, 1.0 - tail))
+
+
+def clear_radial_axis_cache() -> None:
+    """Drop the cached radii and the radial CDF tables they are found on."""
+    _radial_axis.cache_clear()
+    clear_radial_cdf_cache()
+
+
+def _radial(
+    n: int,
+    l: int,
+    r: np.ndarray,
+    out: np.ndarray,
+    workspace: Workspace,
+    radial_backend: RadialBackend,
+) -> np.ndarray:
+    if radial_backend == "exact":
+        return radial_wave_function(
+            n, l, r, out=out, workspace=workspace, dtype=r.dtype
+        )
+    if radial_backend == "tabulated":
+        return radial_table(n, l)(r, out=out, workspace=workspace)
+    raise ValueError("radial_backend must be one of: 'exact', 'tabulated'")
+
+
+def _wavefunction_cartesian(
+    n: int,
+    l: int,
+    m: int,
+    x: np.ndarray,
+    y: np.ndarray,
+    z: np.ndarray,
+    basis: Basis,
+    out_format: OutFormat,
+    dtype: np.dtype,
+    radial_backend: RadialBackend,
+    R: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray] | np.ndarray:
+    """wavefunction_cartesian on validated arrays; R, if given, is R_nl(r) already evaluated."""
+    workspace = Workspace()
+    shape = np.broadcast_shapes(x.shape, y.shape, z.shape)
+    size = np.prod(shape, dtype=int)
+    with stage("wavefunction_cartesian", size):
+        with stage("coordinates", size):
+            r = workspace.get("wavefunction.r", shape, dtype)
+            term = workspace.get("wavefunction.term", shape, dtype)
+            np.multiply(x, x, out=r)
+            np.multiply(y, y, out=term)
+            r += term
+            np.multiply(z, z, out=term)
+            r += term
+            np.sqrt(r, out=r)
+
+        if R is None:
+            R = _radial(
+                n,
+                l,
+                r,
+                workspace.get("wavefunction.R", shape, dtype),
+                workspace,
+                radial_backend,
+            )
+
+        coordinates = dict(workspace=workspace, dtype=dtype, r=r)
+        return _times_angular(
+            R,
+            partial(spherical_harmonic_cartesian, l, m, x, y, z, **coordinates),
+            partial(spherical_harmonic_real_cartesian, l, m, x, y, z, **coordinates),
+            shape,
+            basis,
+            out_format,
+            dtype,
+        )
+
+
+def _symmetric_slice_radial(
+    n: int,
+    l: int,
+    u: np.ndarray,
+    v: np.ndarray,
+    radial_backend: RadialBackend,
+) -> np.ndarray | None:
+    """
+    R_nl on a meshgrid of axes symmetric about 0 (e.g. linspace(-L, L, N)), or None for any
+    other grid. R depends only on (|u|, |v|), so it is evaluated on one quadrant, and only on
+    its i <= j triangle when u and v share an axis, then gathered back to the full grid.
+    """
+    if u.ndim != 2 or u.shape != v.shape or u.size < 4:
+        return None
+    u_dim = _mesh_dim(u)
+    v_dim = _mesh_dim(v)
+    if u_dim is None or v_dim is None or u_dim == v_dim:
+        return None
+
+    # Rows and columns of the grid, whichever of u and v they come from
+    row_axis, col_axis = (u[:, 0], v[0, :]) if u_dim == 0 else (v[:, 0], u[0, :])
+    row_half = _symmetric_half(row_axis)
+    col_half = _symmetric_half(col_axis)
+    if row_half is None or col_half is None:
+        return None
+    (rows, row_index), (cols, col_index) = row_half, col_half
+
+    workspace = Workspace()
+    if rows.shape == cols.shape and np.array_equal(rows, cols):
+        i, j = np.triu_indices(len(rows))
+        r = np.sqrt(rows[i] ** 2 + cols[j] ** 2)
+        R_triangle = _radial(n, l, r, np.empty_like(r), workspace, radial_backend)
+        quadrant = np.empty((len(rows), len(cols)), dtype=u.dtype)
+        quadrant[i, j] = R_triangle
+        quadrant[j, i] = R_triangle
+    else:
+        r = np.sqrt(rows[:, None] ** 2 + cols[None, :] ** 2)
+        quadrant = _radial(n, l, r, np.empty_like(r), workspace, radial_backend)
+
+    return np.take(np.take(quadrant, row_index, axis=0), col_index, axis=1)
+
+
+def _mesh_dim(grid: np.ndarray) -> int | None:
+    """The one dimension a 2D meshgrid coordinate varies along (0 if constant), else None."""
+    if np.array_equal(grid, np.broadcast_to(grid[:, :1], grid.shape)):
+        return 0
+    if np.array_equal(grid, np.broadcast_to(grid[:1, :], grid.shape)):
+        return 1
+    return None
+
+
+def _symmetric_half(axis: np.ndarray) -> tuple[np.ndarray, np.ndarray] | None:
+    """
+    For an axis with axis[i] == -axis[-1 - i] (to rounding), its non-negative half and the
+    index of each element's |value| in that half; None if the axis is not symmetric.
+    """
+    size = len(axis)
+    tolerance = 4 * np.finfo(axis.dtype).eps * np.abs(axis).max()
+    if not np.all(np.abs(axis + axis[::-1]) <= tolerance):
+        return None
+
+    # |axis[start:]| runs outwards from 0 (odd sizes) or from the centre pair (even sizes)
+    start = size // 2
+    index = np.arange(size)
+    return np.abs(axis[start:]), np.maximum(index, size - 1 - index) - start
+
+
+def _times_angular(
+    R: np.ndarray,
+    harmonic: Callable[..., tuple[np.ndarray, np.ndarray] | np.ndarray],
+    harmonic_real: Callable[..., np.ndarray],
+    shape: tuple[int, ...],
+    basis: Basis,
+    out_format: OutFormat,
+    dtype: np.dtype,
+) -> tuple[np.ndarray, np.ndarray] | np.ndarray:
+    """R times the (real or complex) harmonic, allocating only the returned arrays."""
+    if basis == "real":
+        real = harmonic_real(out=np.empty(shape, dtype=dtype))
+        real *= R
+        if out_format == "complex":
+            return real
+        imag = np.zeros_like(real)
+        return real, imag
+
+    if out_format == "complex":
+        Y = np.empty(shape, dtype=complex_dtype(dtype))
+        harmonic(out_format=out_format, out=Y)
+        Y *= R
+        return Y
+
+    real, imag = harmonic(
+        out=(np.empty(shape, dtype=dtype), np.empty(shape, dtype=dtype))
+    )
+    real *= R
+    imag *= R
+
+    return real, imag
 
 
 def _plane_to_xyz(
@@ -101,13 +487,13 @@ def _plane_to_xyz(
 ):
     if plane == "xy":
         x, y = u, v
-        z = np.full_like(x, offset, dtype=float)
+        z = np.full_like(x, offset)
     elif plane == "xz":
         x, z = u, v
-        y = np.full_like(x, offset, dtype=float)
+        y = np.full_like(x, offset)
     elif plane == "yz":
         y, z = u, v
-        x = np.full_like(y, offset, dtype=float)
+        x = np.full_like(y, offset)
     else:
         raise ValueError("plane must be one of: 'xy', 'xz', 'yz'")
     return x, y, z
@@ -116,16 +502,31 @@ def _plane_to_xyz(
 def _axis_to_xyz(axis: Axis, u: npt.ArrayLike, offset: float = 0.0):
     if axis == "x":
         x = u
-        y = np.full_like(x, offset, dtype=float)
-        z = np.full_like(x, offset, dtype=float)
+        y = np.full_like(x, offset)
+        z = np.full_like(x, offset)
     elif axis == "y":
         y = u
-        x = np.full_like(y, offset, dtype=float)
-        z = np.full_like(y, offset, dtype=float)
+        x = np.full_like(y, offset)
+        z = np.full_like(y, offset)
     elif axis == "z":
         z = u
-        x = np.full_like(z, offset, dtype=float)
-        y = np.full_like(z, offset, dtype=float)
+        x = np.full_like(z, offset)
+        y = np.full_like(z, offset)
     else:
         raise ValueError("axis must be one of: 'x', 'y', 'z'")
     return x, y, z
+
+
+def _reflect(volume: np.ndarray, axis: int, h: int, sign: int, conjugate: bool):
+    """Fill indices [:h] along axis with sign * (conj of) the mirrored indices [-h:]."""
+    source = [slice(None)] * volume.ndim
+    target = [slice(None)] * volume.ndim
+    source[axis] = slice(volume.shape[axis] - h, None)
+    target[axis] = slice(None, h)
+
+    mirrored = np.flip(volume[tuple(source)], axis)
+    if conjugate:
+        np.conjugate(mirrored, out=volume[tuple(target)])
+        volume[tuple(target)] *= sign
+    else:
+        np.multiply(mirrored, sign, out=volume[tuple(target)])